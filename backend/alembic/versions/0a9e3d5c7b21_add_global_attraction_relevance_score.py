@@ -0,0 +1,65 @@
+"""add global attraction relevance score
+
+Revision ID: 0a9e3d5c7b21
+Revises: f4a61c8d2b57
+Create Date: 2026-10-19 15:07:42.981356
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0a9e3d5c7b21"
+down_revision: Union[str, Sequence[str], None] = "f4a61c8d2b57"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column(
+        "global_attractions",
+        sa.Column("relevance_score", sa.Float(), server_default="0", nullable=False),
+    )
+
+    # Same formula as GlobalAttraction.dynamic_relevance_rank()
+    op.execute("""
+        UPDATE global_attractions
+        SET relevance_score =
+            ((3.0 * must_count) + (1.5 * want_count) + (0.5 * optional_count))
+            * (((3.0 * must_count) + (1.5 * want_count) + (0.5 * optional_count) + 1.0)
+               / (search_count + 10.0))
+            / pow(
+                (EXTRACT(year FROM age(now(), created_at)) * 12.0)
+                + EXTRACT(month FROM age(now(), created_at)) + 1.0,
+                1.5
+            );
+    """)
+
+    op.drop_index(
+        "ix_global_attractions_country_city_key", table_name="global_attractions"
+    )
+    op.create_index(
+        "ix_global_attractions_city_key_relevance",
+        "global_attractions",
+        ["country_key", "city_key", sa.text("relevance_score DESC")],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(
+        "ix_global_attractions_city_key_relevance", table_name="global_attractions"
+    )
+    op.create_index(
+        "ix_global_attractions_country_city_key",
+        "global_attractions",
+        ["country_key", "city_key"],
+        unique=False,
+    )
+    op.drop_column("global_attractions", "relevance_score")
@@ -0,0 +1,75 @@
+"""add global attraction h3 cell
+
+Revision ID: 1b6e4f9a2c83
+Revises: 0a9e3d5c7b21
+Create Date: 2026-10-19 16:02:47.218530
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import h3
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "1b6e4f9a2c83"
+down_revision: Union[str, Sequence[str], None] = "0a9e3d5c7b21"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# H3 resolution the cells were computed at when this revision was written.
+H3_RESOLUTION = 7
+
+global_attractions = sa.table(
+    "global_attractions",
+    sa.column("id", sa.Integer),
+    sa.column("latitude", sa.Float),
+    sa.column("longitude", sa.Float),
+    sa.column("h3_cell", sa.String),
+)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column(
+        "global_attractions", sa.Column("h3_cell", sa.String(), nullable=True)
+    )
+
+    conn = op.get_bind()
+    rows = conn.execute(
+        sa.select(
+            global_attractions.c.id,
+            global_attractions.c.latitude,
+            global_attractions.c.longitude,
+        ).where(
+            global_attractions.c.latitude.is_not(None),
+            global_attractions.c.longitude.is_not(None),
+        )
+    ).all()
+    if rows:
+        conn.execute(
+            global_attractions.update()
+            .where(global_attractions.c.id == sa.bindparam("row_id"))
+            .values(h3_cell=sa.bindparam("cell")),
+            [
+                {"row_id": id_, "cell": h3.latlng_to_cell(lat, lon, H3_RESOLUTION)}
+                for id_, lat, lon in rows
+            ],
+        )
+
+    op.create_index(
+        op.f("ix_global_attractions_h3_cell"),
+        "global_attractions",
+        ["h3_cell"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(
+        op.f("ix_global_attractions_h3_cell"), table_name="global_attractions"
+    )
+    op.drop_column("global_attractions", "h3_cell")
@@ -0,0 +1,195 @@
+"""add checkpoint compaction job
+
+Revision ID: c7d2e5a1f834
+Revises: b41f7d2c9e10
+Create Date: 2026-10-19 10:04:17.552931
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "c7d2e5a1f834"
+down_revision: Union[str, Sequence[str], None] = "b41f7d2c9e10"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def create_compaction_objects() -> None:
+    """Creates the run log and the procedure; scheduling is left to upgrade()."""
+    op.create_table(
+        "checkpoint_compaction_runs",
+        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column(
+            "started_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.Column("finished_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("kept_per_thread", sa.Integer(), nullable=False),
+        sa.Column("threads_compacted", sa.BigInteger(), server_default="0"),
+        sa.Column("checkpoints_deleted", sa.BigInteger(), server_default="0"),
+        sa.Column("writes_deleted", sa.BigInteger(), server_default="0"),
+        sa.Column("blobs_deleted", sa.BigInteger(), server_default="0"),
+        sa.Column("bytes_freed", sa.BigInteger(), server_default="0"),
+        sa.PrimaryKeyConstraint("id"),
+    )
+
+    # Keeps the newest `keep_latest` checkpoints of every thread and removes the
+    # writes and channel blobs nothing points at anymore. Rows are deleted in
+    # batches of `batch_size` with a COMMIT after each batch so locks and WAL stay
+    # bounded. Blobs newer than what the kept checkpoints reference, and writes
+    # newer than the oldest kept checkpoint, are left alone since they may belong
+    # to a checkpoint that is being written concurrently.
+    op.execute("""
+        CREATE OR REPLACE PROCEDURE compact_checkpoints(
+            keep_latest INTEGER DEFAULT 10,
+            batch_size INTEGER DEFAULT 5000
+        )
+        LANGUAGE plpgsql AS $$
+        DECLARE
+            run_id INTEGER;
+            t RECORD;
+            cutoff TEXT;
+            deleted BIGINT;
+            freed BIGINT;
+            total_threads BIGINT := 0;
+            total_checkpoints BIGINT := 0;
+            total_writes BIGINT := 0;
+            total_blobs BIGINT := 0;
+            total_bytes BIGINT := 0;
+        BEGIN
+            INSERT INTO checkpoint_compaction_runs (kept_per_thread)
+            VALUES (keep_latest)
+            RETURNING id INTO run_id;
+            COMMIT;
+
+            FOR t IN
+                SELECT thread_id, checkpoint_ns
+                FROM checkpoints
+                GROUP BY thread_id, checkpoint_ns
+                HAVING COUNT(*) > keep_latest
+            LOOP
+                SELECT checkpoint_id INTO cutoff
+                FROM checkpoints
+                WHERE thread_id = t.thread_id AND checkpoint_ns = t.checkpoint_ns
+                ORDER BY checkpoint_id DESC
+                OFFSET keep_latest - 1 LIMIT 1;
+
+                CONTINUE WHEN cutoff IS NULL;
+                total_threads := total_threads + 1;
+
+                LOOP
+                    WITH removed AS (
+                        DELETE FROM checkpoints
+                        WHERE ctid IN (
+                            SELECT ctid FROM checkpoints
+                            WHERE thread_id = t.thread_id
+                              AND checkpoint_ns = t.checkpoint_ns
+                              AND checkpoint_id < cutoff
+                            LIMIT batch_size
+                        )
+                        RETURNING pg_column_size(checkpoints.*) AS size
+                    )
+                    SELECT COUNT(*), COALESCE(SUM(size), 0) INTO deleted, freed
+                    FROM removed;
+
+                    total_checkpoints := total_checkpoints + deleted;
+                    total_bytes := total_bytes + freed;
+                    COMMIT;
+                    EXIT WHEN deleted < batch_size;
+                END LOOP;
+
+                LOOP
+                    WITH removed AS (
+                        DELETE FROM checkpoint_writes
+                        WHERE ctid IN (
+                            SELECT ctid FROM checkpoint_writes
+                            WHERE thread_id = t.thread_id
+                              AND checkpoint_ns = t.checkpoint_ns
+                              AND checkpoint_id < cutoff
+                            LIMIT batch_size
+                        )
+                        RETURNING pg_column_size(checkpoint_writes.*) AS size
+                    )
+                    SELECT COUNT(*), COALESCE(SUM(size), 0) INTO deleted, freed
+                    FROM removed;
+
+                    total_writes := total_writes + deleted;
+                    total_bytes := total_bytes + freed;
+                    COMMIT;
+                    EXIT WHEN deleted < batch_size;
+                END LOOP;
+
+                LOOP
+                    WITH removed AS (
+                        DELETE FROM checkpoint_blobs
+                        WHERE ctid IN (
+                            SELECT b.ctid FROM checkpoint_blobs b
+                            WHERE b.thread_id = t.thread_id
+                              AND b.checkpoint_ns = t.checkpoint_ns
+                              AND NOT EXISTS (
+                                  SELECT 1 FROM checkpoints c
+                                  WHERE c.thread_id = b.thread_id
+                                    AND c.checkpoint_ns = b.checkpoint_ns
+                                    AND c.checkpoint -> 'channel_versions' ->> b.channel = b.version
+                              )
+                              AND b.version < (
+                                  SELECT MAX(c.checkpoint -> 'channel_versions' ->> b.channel)
+                                  FROM checkpoints c
+                                  WHERE c.thread_id = b.thread_id
+                                    AND c.checkpoint_ns = b.checkpoint_ns
+                              )
+                            LIMIT batch_size
+                        )
+                        RETURNING pg_column_size(checkpoint_blobs.*) AS size
+                    )
+                    SELECT COUNT(*), COALESCE(SUM(size), 0) INTO deleted, freed
+                    FROM removed;
+
+                    total_blobs := total_blobs + deleted;
+                    total_bytes := total_bytes + freed;
+                    COMMIT;
+                    EXIT WHEN deleted < batch_size;
+                END LOOP;
+            END LOOP;
+
+            UPDATE checkpoint_compaction_runs
+            SET finished_at = NOW(),
+                threads_compacted = total_threads,
+                checkpoints_deleted = total_checkpoints,
+                writes_deleted = total_writes,
+                blobs_deleted = total_blobs,
+                bytes_freed = total_bytes
+            WHERE id = run_id;
+            COMMIT;
+
+            RAISE NOTICE 'compact_checkpoints: % threads, % checkpoints, % writes, % blobs, % freed',
+                total_threads, total_checkpoints, total_writes, total_blobs,
+                pg_size_pretty(total_bytes);
+        END;
+        $$;
+    """)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    create_compaction_objects()
+
+    op.execute("""
+        SELECT cron.schedule('compact_checkpoints', '30 * * * *', $$
+            CALL compact_checkpoints(10, 5000);
+        $$);
+    """)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute("SELECT cron.unschedule('compact_checkpoints');")
+    op.execute("DROP PROCEDURE IF EXISTS compact_checkpoints(INTEGER, INTEGER);")
+    op.drop_table("checkpoint_compaction_runs")
@@ -0,0 +1,64 @@
+"""add notification change trigger
+
+Revision ID: d93a4b6e0f27
+Revises: c7d2e5a1f834
+Create Date: 2026-10-19 11:26:53.907412
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "d93a4b6e0f27"
+down_revision: Union[str, Sequence[str], None] = "c7d2e5a1f834"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute("""
+        CREATE OR REPLACE FUNCTION notify_notification_change()
+        RETURNS TRIGGER AS $$
+        DECLARE
+            payload TEXT;
+        BEGIN
+            payload := json_build_object(
+                'op', CASE WHEN NEW.deleted_at IS NULL THEN 'upsert' ELSE 'delete' END,
+                'user_id', NEW.user_id,
+                'notification', json_build_object(
+                    'id', NEW.id,
+                    'category', NEW.category,
+                    'message', NEW.message,
+                    'is_read', NEW.is_read,
+                    'created_at', NEW.created_at
+                )
+            )::text;
+
+            -- pg_notify payloads are capped at 8000 bytes
+            IF octet_length(payload) > 7900 THEN
+                payload := json_build_object('op', 'resync', 'user_id', NEW.user_id)::text;
+            END IF;
+
+            PERFORM pg_notify('notification_events', payload);
+            RETURN NEW;
+        END;
+        $$ LANGUAGE plpgsql;
+    """)
+
+    op.execute("""
+        CREATE TRIGGER trigger_notify_notification_change
+        AFTER INSERT OR UPDATE ON notifications
+        FOR EACH ROW EXECUTE FUNCTION notify_notification_change();
+    """)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute(
+        "DROP TRIGGER IF EXISTS trigger_notify_notification_change ON notifications;"
+    )
+    op.execute("DROP FUNCTION IF EXISTS notify_notification_change();")
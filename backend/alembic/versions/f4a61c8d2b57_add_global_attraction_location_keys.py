@@ -0,0 +1,127 @@
+"""add global attraction location keys
+
+Revision ID: f4a61c8d2b57
+Revises: e2b8c0f5a913
+Create Date: 2026-10-19 13:58:31.604117
+
+"""
+
+from typing import Sequence, Union
+
+import re
+import unicodedata
+
+from alembic import op
+import sqlalchemy as sa
+from babel import Locale
+
+
+# revision identifiers, used by Alembic.
+revision: str = "f4a61c8d2b57"
+down_revision: Union[str, Sequence[str], None] = "e2b8c0f5a913"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Key normalization as of this revision, inlined so later changes to the app's
+# helpers cannot change what this backfill writes.
+COUNTRY_ALIASES = {
+    "usa": "us",
+    "united states of america": "us",
+    "uk": "gb",
+    "great britain": "gb",
+    "england": "gb",
+    "scotland": "gb",
+    "wales": "gb",
+    "holland": "nl",
+    "czech republic": "cz",
+    "turkey": "tr",
+    "italia": "it",
+    "deutschland": "de",
+    "espana": "es",
+    "brasil": "br",
+}
+
+
+def normalize_place_key(value):
+    if not value:
+        return ""
+    decomposed = unicodedata.normalize("NFKD", value)
+    stripped = "".join(c for c in decomposed if not unicodedata.combining(c))
+    return " ".join(re.sub(r"[^\w]+", " ", stripped.casefold()).split())
+
+
+def country_key_normalizer():
+    names = {
+        normalize_place_key(name): code.lower()
+        for code, name in Locale("en").territories.items()
+        if code.isalpha() and len(code) == 2
+    }
+
+    def normalize_country_key(value):
+        key = normalize_place_key(value)
+        if key in COUNTRY_ALIASES:
+            return COUNTRY_ALIASES[key]
+        if len(key) == 2 and key.isalpha():
+            return key
+        return names.get(key, key)
+
+    return normalize_country_key
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm;")
+
+    op.add_column(
+        "global_attractions", sa.Column("city_key", sa.String(), nullable=True)
+    )
+    op.add_column(
+        "global_attractions", sa.Column("country_key", sa.String(), nullable=True)
+    )
+
+    normalize_country_key = country_key_normalizer()
+    conn = op.get_bind()
+    pairs = conn.execute(
+        sa.text("SELECT DISTINCT city, country FROM global_attractions")
+    ).all()
+    for city, country in pairs:
+        conn.execute(
+            sa.text(
+                "UPDATE global_attractions "
+                "SET city_key = :city_key, country_key = :country_key "
+                "WHERE city = :city AND country = :country"
+            ),
+            {
+                "city_key": normalize_place_key(city),
+                "country_key": normalize_country_key(country),
+                "city": city,
+                "country": country,
+            },
+        )
+
+    op.create_index(
+        "ix_global_attractions_country_city_key",
+        "global_attractions",
+        ["country_key", "city_key"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_global_attractions_city_key_trgm",
+        "global_attractions",
+        ["city_key"],
+        unique=False,
+        postgresql_using="gin",
+        postgresql_ops={"city_key": "gin_trgm_ops"},
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(
+        "ix_global_attractions_city_key_trgm", table_name="global_attractions"
+    )
+    op.drop_index(
+        "ix_global_attractions_country_city_key", table_name="global_attractions"
+    )
+    op.drop_column("global_attractions", "country_key")
+    op.drop_column("global_attractions", "city_key")
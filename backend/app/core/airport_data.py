@@ -1,8 +1,129 @@
+"""
+Compact airport dataset.
+
+`airportsdata.load("IATA")` parses a 3 MB CSV into a dict of dicts on every
+import. Instead, the rows we actually use are stored column-wise (string
+tuples plus float arrays for coordinates) in a pickled artifact next to this
+module, together with the prebuilt search index. Workers read it on first use.
+
+Build it with `python -m app.services.search.airport_index`; when it is missing
+or was built from another airportsdata release, the CSV is parsed as before.
+"""
+
+import os
+import pickle
+import sys
+from array import array
+from collections.abc import Iterator, Mapping
+from functools import lru_cache
+from pathlib import Path
+
 import airportsdata
+
 from app.core.logger import get_logger
 
 log = get_logger(__name__)
 
-log.info("Loading global airport database into memory...")
-AIRPORTS_DB = airportsdata.load("IATA")
-log.info(f"Successfully loaded {len(AIRPORTS_DB)} airports.")
+ARTIFACT_PATH = Path(__file__).parent / "data" / "airports.bin"
+# Bump when the column set or the AirportIndex state layout changes.
+ARTIFACT_FORMAT = 1
+
+STRING_FIELDS = ("iata", "name", "city", "subd", "country", "tz")
+FLOAT_FIELDS = ("lat", "lon")
+
+
+class AirportTable(Mapping):
+    """
+    Read-only `IATA code -> airport dict` mapping over columnar storage.
+    Rows are materialized on access, so only the columns stay resident.
+    """
+
+    def __init__(self, columns: dict):
+        self._columns = columns
+        self.codes: tuple[str, ...] = columns["iata"]
+        self._positions = {code: i for i, code in enumerate(self.codes)}
+
+    @classmethod
+    def from_rows(cls, airports: dict) -> "AirportTable":
+        rows = list(airports.values())
+        # Country, subdivision and timezone values repeat thousands of times.
+        columns = {
+            field: tuple(sys.intern(row.get(field) or "") for row in rows)
+            for field in STRING_FIELDS
+        }
+        for field in FLOAT_FIELDS:
+            columns[field] = array("d", (float(row.get(field) or 0) for row in rows))
+        return cls(columns)
+
+    @property
+    def columns(self) -> dict:
+        return self._columns
+
+    def position(self, code: str) -> int | None:
+        return self._positions.get(code)
+
+    def row(self, i: int) -> dict:
+        row = {field: self._columns[field][i] for field in STRING_FIELDS}
+        for field in FLOAT_FIELDS:
+            row[field] = self._columns[field][i]
+        return row
+
+    def __getitem__(self, code: str) -> dict:
+        return self.row(self._positions[code])
+
+    def __contains__(self, code) -> bool:
+        return code in self._positions
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.codes)
+
+    def __len__(self) -> int:
+        return len(self.codes)
+
+
+@lru_cache(maxsize=1)
+def read_artifact() -> dict | None:
+    """The artifact payload, or None when it is missing or stale."""
+    try:
+        with open(ARTIFACT_PATH, "rb") as f:
+            payload = pickle.load(f)
+    except FileNotFoundError:
+        log.warning(f"Airport artifact not found at {ARTIFACT_PATH}.")
+        return None
+    except Exception as e:
+        log.warning(f"Could not read airport artifact {ARTIFACT_PATH}: {e}")
+        return None
+
+    if (
+        payload.get("format") != ARTIFACT_FORMAT
+        or payload.get("source_version") != airportsdata.__version__
+    ):
+        log.warning("Airport artifact is stale, ignoring it.")
+        return None
+    return payload
+
+
+def write_artifact(table: AirportTable, index_state: dict, path: Path = ARTIFACT_PATH):
+    payload = {
+        "format": ARTIFACT_FORMAT,
+        "source_version": airportsdata.__version__,
+        "columns": table.columns,
+        "index": index_state,
+    }
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_suffix(".tmp")
+    with open(tmp_path, "wb") as f:
+        pickle.dump(payload, f, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(tmp_path, path)
+
+
+@lru_cache(maxsize=1)
+def get_airports() -> AirportTable:
+    payload = read_artifact()
+    if payload is not None:
+        table = AirportTable(payload["columns"])
+    else:
+        log.info("Loading global airport database from airportsdata...")
+        table = AirportTable.from_rows(airportsdata.load("IATA"))
+    log.info(f"Successfully loaded {len(table)} airports.")
+    return table
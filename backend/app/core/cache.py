@@ -14,6 +14,35 @@ r = redis.Redis(
 log.info(f"Connected to Redis at {settings.REDIS_HOST}:{settings.REDIS_PORT}")
 
 
+def build_cache_key(func_name: str, args: tuple, kwargs: dict) -> str:
+    """Key used by `redis_cache`; argument order is part of the key."""
+    key_parts = (
+        [func_name]
+        + [str(arg) for arg in args]
+        + [f"{k}={v}" for k, v in kwargs.items()]
+    )
+    return ":".join(key_parts)
+
+
+async def cache_get(cache_key: str):
+    try:
+        cached_data = await r.get(cache_key)
+        if cached_data:
+            log.info(f"Cache HIT: Serving {cache_key} from Redis")
+            return json.loads(cached_data)
+    except redis.ConnectionError:
+        log.error(f"Redis at {settings.REDIS_HOST} is down, skipping cache check.")
+    return None
+
+
+async def cache_set(cache_key: str, expire_time: int, result):
+    try:
+        if result is not None:
+            await r.setex(cache_key, expire_time, json.dumps(result))
+    except Exception as e:
+        log.error(f"Failed to commit async payload cache data to Redis: {e}")
+
+
 def redis_cache(expire_time=1800):
     """
     A hybrid custom decorator that transparently caches the results of
@@ -25,35 +54,16 @@ def redis_cache(expire_time=1800):
 
             @functools.wraps(func)
             async def async_wrapper(*args, **kwargs):
-                key_parts = (
-                    [func.__name__]
-                    + [str(arg) for arg in args]
-                    + [f"{k}={v}" for k, v in kwargs.items()]
-                )
-                cache_key = ":".join(key_parts)
-
-                try:
-                    cached_data = await r.get(cache_key)
-                    if cached_data:
-                        log.info(f"Cache HIT: Serving {cache_key} from Redis")
-                        return json.loads(cached_data)
-                except redis.ConnectionError:
-                    log.error(
-                        f"Redis at {settings.REDIS_HOST} is down, skipping cache check."
-                    )
+                cache_key = build_cache_key(func.__name__, args, kwargs)
+
+                cached_data = await cache_get(cache_key)
+                if cached_data is not None:
+                    return cached_data
 
                 log.warning(f"Cache MISS: Fetching live data async for {cache_key}")
 
                 result = await func(*args, **kwargs)
-
-                try:
-                    if result is not None:
-                        await r.setex(cache_key, expire_time, json.dumps(result))
-                except Exception as e:
-                    log.error(
-                        f"Failed to commit async payload cache data to Redis: {e}"
-                    )
-
+                await cache_set(cache_key, expire_time, result)
                 return result
 
             return async_wrapper
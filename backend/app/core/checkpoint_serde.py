@@ -0,0 +1,93 @@
+import hashlib
+from typing import Any
+
+import zstandard
+from langgraph.checkpoint.serde.base import SerializerProtocol
+from langgraph.checkpoint.serde.jsonplus import JsonPlusSerializer
+
+CAS_KEY = "__cas__"
+CAS_TABLE_KEY = "__cas_table__"
+CAS_VALUE_KEY = "__cas_value__"
+
+CAS_MIN_LENGTH = 512
+COMPRESS_MIN_BYTES = 1024
+ZSTD_LEVEL = 3
+
+
+def _extract_blobs(obj: Any, table: dict[str, str]) -> Any:
+    """
+    Returns a copy of `obj` where every large string (polylines, encoded steps)
+    is replaced by a reference to its content hash in `table`.
+    """
+    if isinstance(obj, str):
+        if len(obj) < CAS_MIN_LENGTH:
+            return obj
+        digest = hashlib.blake2b(obj.encode(), digest_size=16).hexdigest()
+        table[digest] = obj
+        return {CAS_KEY: digest}
+    if isinstance(obj, dict):
+        return {k: _extract_blobs(v, table) for k, v in obj.items()}
+    if isinstance(obj, list):
+        return [_extract_blobs(v, table) for v in obj]
+    return obj
+
+
+def _restore_blobs(obj: Any, table: dict[str, str]) -> Any:
+    if isinstance(obj, dict):
+        if len(obj) == 1 and CAS_KEY in obj:
+            return table[obj[CAS_KEY]]
+        return {k: _restore_blobs(v, table) for k, v in obj.items()}
+    if isinstance(obj, list):
+        return [_restore_blobs(v, table) for v in obj]
+    return obj
+
+
+class CompressedSerializer(SerializerProtocol):
+    """
+    Wraps the default LangGraph serializer (msgpack) with content-addressed
+    deduplication of large strings and zstd compression.
+    Modifiers are appended to the type tag (`msgpack+cas+zstd`), the same way
+    LangGraph's EncryptedSerializer marks its payloads, so checkpoints written
+    by the plain serializer stay readable.
+    """
+
+    def __init__(self, serde: SerializerProtocol | None = None) -> None:
+        self.serde = serde or JsonPlusSerializer()
+
+    def dumps_typed(self, obj: Any) -> tuple[str, bytes]:
+        modifiers = []
+
+        if isinstance(obj, (dict, list)):
+            table: dict[str, str] = {}
+            extracted = _extract_blobs(obj, table)
+            if table:
+                obj = {CAS_TABLE_KEY: table, CAS_VALUE_KEY: extracted}
+                modifiers.append("cas")
+
+        typ, data = self.serde.dumps_typed(obj)
+
+        if len(data) >= COMPRESS_MIN_BYTES:
+            data = zstandard.ZstdCompressor(level=ZSTD_LEVEL).compress(data)
+            modifiers.append("zstd")
+
+        return "+".join([typ, *modifiers]), data
+
+    def loads_typed(self, data: tuple[str, bytes]) -> Any:
+        typ, payload = data
+        if "+" not in typ:
+            return self.serde.loads_typed(data)
+
+        typ, *modifiers = typ.split("+")
+
+        if "zstd" in modifiers:
+            payload = zstandard.ZstdDecompressor().decompress(payload)
+
+        obj = self.serde.loads_typed((typ, payload))
+
+        if "cas" in modifiers:
+            obj = _restore_blobs(obj[CAS_VALUE_KEY], obj[CAS_TABLE_KEY])
+
+        return obj
+
+
+checkpoint_serde = CompressedSerializer()
@@ -40,17 +40,24 @@ class Settings(BaseSettings):
     SMTP_PORT: int
     SMTP_USER: str
     SMTP_PASSWORD: str
+    SMTP_POOL_SIZE: int = 2
+    DELIVERY_RENDER_PROCESSES: int = 2
 
     JWT_SECRET_KEY: str
     JWT_ALGORITHM: str = "HS256"
 
     WORKER_COUNT: int
 
+    HTTP_MAX_CONNECTIONS: int = 100
+    HTTP_MAX_KEEPALIVE_CONNECTIONS: int = 20
+
     BACKEND_CORS_ORIGINS: list = ["http://localhost:5173", "http://127.0.0.1:5173"]
 
     GOOGLE_API_KEY: str
     GEMINI_API_KEY: str
     SERPAPI_API_KEY: str
+    SERPAPI_MAX_CONCURRENCY_PER_KEY: int = 8
+    SERPAPI_TIMEOUT_SECONDS: float = 60
     RAPIDAPI_KEY: str
     OPENTRIPMAP_API_KEY: str
     TAVILY_API_KEY: str
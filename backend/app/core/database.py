@@ -3,6 +3,7 @@ from sqlalchemy.orm import declarative_base
 from psycopg_pool import AsyncConnectionPool
 from langgraph.checkpoint.postgres.aio import AsyncPostgresSaver
 from app.core.config import settings
+from app.core.checkpoint_serde import checkpoint_serde
 from app.core.logger import get_logger
 
 log = get_logger(__name__)
@@ -53,4 +54,4 @@ async def get_db():
 
 
 async def get_checkpointer():
-    yield AsyncPostgresSaver(langgraph_pool)
+    yield AsyncPostgresSaver(langgraph_pool, serde=checkpoint_serde)
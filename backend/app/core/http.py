@@ -0,0 +1,39 @@
+"""
+Process-wide pooled HTTP client for outbound API calls.
+"""
+
+import httpx
+
+from app.core.config import settings
+from app.core.logger import get_logger
+
+log = get_logger(__name__)
+
+DEFAULT_TIMEOUT_SECONDS = 30
+
+_client: httpx.AsyncClient | None = None
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """
+    Shared AsyncClient, so keep-alive connections and TLS sessions to the same
+    upstream are reused across requests instead of opened per call.
+    """
+    global _client
+    if _client is None or _client.is_closed:
+        _client = httpx.AsyncClient(
+            timeout=DEFAULT_TIMEOUT_SECONDS,
+            limits=httpx.Limits(
+                max_connections=settings.HTTP_MAX_CONNECTIONS,
+                max_keepalive_connections=settings.HTTP_MAX_KEEPALIVE_CONNECTIONS,
+            ),
+        )
+    return _client
+
+
+async def close_http_client():
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
+        log.info("Shared HTTP client closed.")
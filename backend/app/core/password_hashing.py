@@ -0,0 +1,123 @@
+"""
+Bounded thread pool for bcrypt work so password checks never block the event loop.
+"""
+
+import asyncio
+import os
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import Callable, Optional, TypeVar
+
+from app.core.logger import get_logger
+
+log = get_logger(__name__)
+
+T = TypeVar("T")
+
+HASHING_WORKERS = min(4, os.cpu_count() or 1)
+MAX_PENDING_HASHES = HASHING_WORKERS * 8
+MAX_CONCURRENT_PER_IP = 4
+MAX_CONCURRENT_PER_ACCOUNT = 2
+SLOW_QUEUE_SECONDS = 0.5
+
+
+class HashingLimitExceeded(Exception):
+    """Raised when the queue is full or a client has too many hashes in flight."""
+
+
+class PasswordHashingPool:
+    """
+    Runs bcrypt in a dedicated thread pool (bcrypt releases the GIL while hashing).
+    At most MAX_PENDING_HASHES calls are queued or running at once; further calls
+    are rejected instead of waiting. Each IP and account is also capped on
+    concurrent calls so a single client cannot fill the queue.
+    The executor is created on first use and dropped by shutdown(), so the pool
+    can serve again after an app lifespan has ended.
+    """
+
+    def __init__(
+        self,
+        workers: int = HASHING_WORKERS,
+        max_pending: int = MAX_PENDING_HASHES,
+        per_ip: int = MAX_CONCURRENT_PER_IP,
+        per_account: int = MAX_CONCURRENT_PER_ACCOUNT,
+    ):
+        self._workers = workers
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._slots = asyncio.Semaphore(max_pending)
+        self._limits = {"ip": per_ip, "account": per_account}
+        self._in_flight: Counter[tuple[str, str]] = Counter()
+
+        self.calls = 0
+        self.total_queue_seconds = 0.0
+        self.max_queue_seconds = 0.0
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self._workers, thread_name_prefix="bcrypt"
+            )
+        return self._executor
+
+    @contextmanager
+    def _reserve(self, ip: Optional[str], account: Optional[str]):
+        keys = [(kind, key) for kind, key in (("ip", ip), ("account", account)) if key]
+        for kind, key in keys:
+            if self._in_flight[(kind, key)] >= self._limits[kind]:
+                raise HashingLimitExceeded(f"Too many concurrent attempts for {kind}")
+
+        for k in keys:
+            self._in_flight[k] += 1
+        try:
+            yield
+        finally:
+            for k in keys:
+                self._in_flight[k] -= 1
+                if self._in_flight[k] <= 0:
+                    del self._in_flight[k]
+
+    def _record_queue_time(self, waited: float):
+        self.calls += 1
+        self.total_queue_seconds += waited
+        self.max_queue_seconds = max(self.max_queue_seconds, waited)
+        if waited >= SLOW_QUEUE_SECONDS:
+            log.warning(f"Password hashing queued for {waited * 1000:.0f} ms")
+
+    async def run(
+        self,
+        fn: Callable[..., T],
+        *args,
+        ip: Optional[str] = None,
+        account: Optional[str] = None,
+    ) -> T:
+        submitted = time.perf_counter()
+
+        def timed():
+            self._record_queue_time(time.perf_counter() - submitted)
+            return fn(*args)
+
+        with self._reserve(ip, account):
+            if self._slots.locked():
+                raise HashingLimitExceeded("Password hashing queue is full")
+            async with self._slots:
+                loop = asyncio.get_running_loop()
+                return await loop.run_in_executor(self._get_executor(), timed)
+
+    def stats(self) -> dict:
+        return {
+            "calls": self.calls,
+            "avg_queue_ms": (
+                self.total_queue_seconds / self.calls * 1000 if self.calls else 0.0
+            ),
+            "max_queue_ms": self.max_queue_seconds * 1000,
+        }
+
+    def shutdown(self):
+        executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+
+password_hashing_pool = PasswordHashingPool()
@@ -0,0 +1,198 @@
+"""
+Redis-backed token revocation cache with a per-worker Bloom filter in front of it.
+"""
+
+import asyncio
+import hashlib
+import math
+import time
+from datetime import datetime, timezone
+from typing import Optional
+
+import redis.asyncio as redis
+from sqlalchemy import select
+
+from app.core.cache import r
+from app.core.database import SessionLocal
+from app.core.logger import get_logger
+from app.models.blacklist_token import BlacklistToken
+
+log = get_logger(__name__)
+
+REVOKED_KEY_PREFIX = "revoked_token:"
+REVOKED_INDEX_KEY = "revoked_tokens"
+REVOKED_CHANNEL = "revoked_tokens:events"
+
+BLOOM_CAPACITY = 100_000
+BLOOM_ERROR_RATE = 0.01
+REBUILD_INTERVAL_SECONDS = 300
+RECONNECT_DELAY_SECONDS = 5
+
+
+class BloomFilter:
+    """Fixed-size Bloom filter using double hashing over a single blake2b digest."""
+
+    def __init__(
+        self, capacity: int = BLOOM_CAPACITY, error_rate: float = BLOOM_ERROR_RATE
+    ):
+        self.size = max(8, int(-capacity * math.log(error_rate) / (math.log(2) ** 2)))
+        self.hash_count = max(1, round(self.size / capacity * math.log(2)))
+        self.bits = bytearray((self.size + 7) // 8)
+
+    def _positions(self, item: str):
+        digest = hashlib.blake2b(item.encode(), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        return ((h1 + i * h2) % self.size for i in range(self.hash_count))
+
+    def add(self, item: str):
+        for pos in self._positions(item):
+            self.bits[pos >> 3] |= 1 << (pos & 7)
+
+    def __contains__(self, item: str) -> bool:
+        return all(
+            self.bits[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(item)
+        )
+
+
+def _expiry_timestamp(expires_at: datetime) -> int:
+    if expires_at.tzinfo is None:
+        expires_at = expires_at.replace(tzinfo=timezone.utc)
+    return int(expires_at.timestamp())
+
+
+class RevocationCache:
+    """
+    Keeps every revoked JTI in Redis until its token expires and mirrors the set
+    into a local Bloom filter. Other workers learn about new revocations through a
+    pub/sub channel, and the filter is rebuilt periodically to drop expired entries.
+    """
+
+    def __init__(self):
+        self.bloom: Optional[BloomFilter] = None
+        self._recent: set[str] = set()
+        self._tasks: list[asyncio.Task] = []
+
+    async def start(self):
+        self._tasks = [
+            asyncio.create_task(self._listen()),
+            asyncio.create_task(self._refresh()),
+        ]
+
+    async def stop(self):
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+        self.bloom = None
+
+    async def revoke(self, jti: str, expires_at: datetime):
+        exp = _expiry_timestamp(expires_at)
+        if exp <= time.time():
+            return
+
+        if self.bloom is not None:
+            self.bloom.add(jti)
+        self._recent.add(jti)
+
+        async with r.pipeline(transaction=False) as pipe:
+            pipe.set(f"{REVOKED_KEY_PREFIX}{jti}", 1, exat=exp)
+            pipe.zadd(REVOKED_INDEX_KEY, {jti: exp})
+            pipe.publish(REVOKED_CHANNEL, jti)
+            await pipe.execute()
+
+    async def is_revoked(self, jti: str) -> Optional[bool]:
+        """
+        Returns False when the Bloom filter rules the token out, True when Redis
+        holds the revocation, and None when only Postgres can give a definite answer.
+        """
+        bloom = self.bloom
+        if bloom is not None and jti not in bloom:
+            return False
+
+        try:
+            if await r.exists(f"{REVOKED_KEY_PREFIX}{jti}"):
+                return True
+        except redis.RedisError as e:
+            log.error(f"Revocation cache lookup failed, falling back to Postgres: {e}")
+
+        return None
+
+    async def rebuild(self):
+        self._recent = set()
+        now = int(time.time())
+
+        await r.zremrangebyscore(REVOKED_INDEX_KEY, "-inf", now)
+        jtis = set(await r.zrange(REVOKED_INDEX_KEY, 0, -1))
+
+        # Postgres is the source of truth: a revocation whose Redis mirror write
+        # failed would otherwise fall out of the filter on this rebuild.
+        missing = [
+            (jti, expires_at)
+            for jti, expires_at in await self._live_revocations()
+            if jti not in jtis
+        ]
+        if missing:
+            await self._mirror(missing)
+            jtis.update(jti for jti, _ in missing)
+            log.info(f"Restored {len(missing)} revocations missing from Redis.")
+
+        bloom = BloomFilter(capacity=max(BLOOM_CAPACITY, 2 * len(jtis)))
+        for jti in jtis:
+            bloom.add(jti)
+        for jti in self._recent:
+            bloom.add(jti)
+
+        self.bloom = bloom
+        log.info(f"Token revocation filter rebuilt with {len(jtis)} entries.")
+
+    async def _live_revocations(self) -> list[tuple[str, datetime]]:
+        async with SessionLocal() as db:
+            result = await db.execute(
+                select(BlacklistToken.token, BlacklistToken.expires_at).where(
+                    BlacklistToken.expires_at > datetime.utcnow()
+                )
+            )
+            return [tuple(row) for row in result.all()]
+
+    async def _mirror(self, rows: list[tuple[str, datetime]]):
+        async with r.pipeline(transaction=False) as pipe:
+            for jti, expires_at in rows:
+                exp = _expiry_timestamp(expires_at)
+                pipe.set(f"{REVOKED_KEY_PREFIX}{jti}", 1, exat=exp)
+                pipe.zadd(REVOKED_INDEX_KEY, {jti: exp})
+            await pipe.execute()
+
+    async def _listen(self):
+        while True:
+            try:
+                async with r.pubsub() as pubsub:
+                    await pubsub.subscribe(REVOKED_CHANNEL)
+                    await self.rebuild()
+
+                    async for message in pubsub.listen():
+                        if message.get("type") != "message":
+                            continue
+                        jti = message["data"]
+                        self._recent.add(jti)
+                        if self.bloom is not None:
+                            self.bloom.add(jti)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self.bloom = None
+                log.error(f"Token revocation listener disconnected: {e}")
+                await asyncio.sleep(RECONNECT_DELAY_SECONDS)
+
+    async def _refresh(self):
+        while True:
+            await asyncio.sleep(REBUILD_INTERVAL_SECONDS)
+            if self.bloom is None:
+                continue
+            try:
+                await self.rebuild()
+            except Exception as e:
+                log.error(f"Token revocation filter refresh failed: {e}")
+
+
+revocation_cache = RevocationCache()
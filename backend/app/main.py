@@ -13,6 +13,11 @@ from fastapi.middleware.cors import CORSMiddleware
 from app.core.config import settings
 from app.core.database import langgraph_pool
 from app.core.auth import auth
+from app.core.revocation import revocation_cache
+from app.core.password_hashing import password_hashing_pool
+from app.core.http import close_http_client
+from app.services.notifications.broadcaster import notification_broadcaster
+from app.services.jobs.registry import scheduler
 
 from app.routers.auth import router as auth_router
 from app.routers.users import router as users_router
@@ -32,8 +37,18 @@ async def lifespan(app: FastAPI):
     await langgraph_pool.open()
     log.info("LangGraph checkpointer pool opened.")
 
+    await revocation_cache.start()
+    await notification_broadcaster.start()
+    await scheduler.start()
+
     yield
 
+    await scheduler.stop()
+    await notification_broadcaster.stop()
+    await revocation_cache.stop()
+    password_hashing_pool.shutdown()
+    await close_http_client()
+
     await langgraph_pool.close()
     log.info("LangGraph checkpointer pool closed.")
 
@@ -68,4 +83,8 @@ auth.handle_errors(app)
 @app.get("/health", tags=["Health"])
 def healthcheck():
     """Health check endpoint."""
-    return {"status": "ok", "version": settings.VERSION}
+    return {
+        "status": "ok",
+        "version": settings.VERSION,
+        "password_hashing": password_hashing_pool.stats(),
+    }
@@ -7,6 +7,10 @@ from .blacklist_token import BlacklistToken
 from .companion import TravelCompanion
 from .notifications import Notification
 from .global_attraction import GlobalAttraction
+from .itinerary_read_model import ItineraryReadModel
+from .delivery_job import DeliveryJob
+from .rendered_document import RenderedDocument
+from .place_resolution import PlaceResolution
 
 __all__ = [
     "User",
@@ -16,4 +20,8 @@ __all__ = [
     "TravelCompanion",
     "Notification",
     "GlobalAttraction",
+    "ItineraryReadModel",
+    "DeliveryJob",
+    "RenderedDocument",
+    "PlaceResolution",
 ]
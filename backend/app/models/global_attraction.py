@@ -1,11 +1,50 @@
-from sqlalchemy import JSON, Boolean, Column, Integer, String, Float, Text, DateTime
+import h3
+from sqlalchemy import (
+    JSON,
+    Boolean,
+    Column,
+    Integer,
+    String,
+    Float,
+    Text,
+    DateTime,
+    Index,
+    event,
+    update,
+    text,
+    values,
+    column,
+)
 from sqlalchemy.sql import func
 from app.core.database import Base
 from sqlalchemy.ext.asyncio import AsyncSession
+from app.utils.generic import normalize_place_key, normalize_country_key
+from app.core.logger import get_logger
+
+log = get_logger(__name__)
+
+METRIC_COLUMNS = ("search_count", "must_count", "want_count", "optional_count")
+
+# ~1.4 km hexagon edge: a 15 km city radius is covered by a few hundred cells.
+H3_RESOLUTION = 7
 
 
 class GlobalAttraction(Base):
     __tablename__ = "global_attractions"
+    __table_args__ = (
+        Index(
+            "ix_global_attractions_city_key_relevance",
+            "country_key",
+            "city_key",
+            text("relevance_score DESC"),
+        ),
+        Index(
+            "ix_global_attractions_city_key_trgm",
+            "city_key",
+            postgresql_using="gin",
+            postgresql_ops={"city_key": "gin_trgm_ops"},
+        ),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
 
@@ -17,10 +56,13 @@ class GlobalAttraction(Base):
     city = Column(String, index=True, nullable=False)
     state_province = Column(String, index=True, nullable=True)
     country = Column(String, index=True, nullable=False)
+    city_key = Column(String, nullable=True)
+    country_key = Column(String, nullable=True)
     formatted_address = Column(String, nullable=True)
     timezone = Column(String, nullable=True)
     latitude = Column(Float, nullable=False)
     longitude = Column(Float, nullable=False)
+    h3_cell = Column(String, index=True, nullable=True)
 
     category = Column(String, index=True)
     tags = Column(String, nullable=True)
@@ -38,23 +80,52 @@ class GlobalAttraction(Base):
     must_count = Column(Integer, default=0, nullable=False)
     want_count = Column(Integer, default=0, nullable=False)
     optional_count = Column(Integer, default=0, nullable=False)
+    relevance_score = Column(Float, default=0.0, server_default="0", nullable=False)
 
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(
         DateTime(timezone=True), server_default=func.now(), onupdate=func.now()
     )
 
+    @staticmethod
+    def location_keys(city: str | None, country: str | None) -> dict:
+        """Normalized lookup keys stored alongside the display city/country."""
+        return {
+            "city_key": normalize_place_key(city),
+            "country_key": normalize_country_key(country),
+        }
+
+    @staticmethod
+    def spatial_cell(latitude: float | None, longitude: float | None) -> str | None:
+        """H3 cell the coordinates fall in, used for radius and nearest lookups."""
+        if latitude is None or longitude is None:
+            return None
+        return h3.latlng_to_cell(latitude, longitude, H3_RESOLUTION)
+
     @classmethod
-    def dynamic_relevance_rank(cls, gravity: float = 1.5):
+    def dynamic_relevance_rank(
+        cls,
+        gravity: float = 1.5,
+        search_count=None,
+        must_count=None,
+        want_count=None,
+        optional_count=None,
+    ):
         """
         Compiles the Laplace-Smoothed Engagement Quality Model directly into a SQL statement.
         Allows multi-factor ordering using the native database engine execution block.
+        Counter expressions can be overridden to score the values an UPDATE is about to write.
         """
-        intent_score = (
-            (3.0 * cls.must_count) + (1.5 * cls.want_count) + (0.5 * cls.optional_count)
+        search_count = cls.search_count if search_count is None else search_count
+        must_count = cls.must_count if must_count is None else must_count
+        want_count = cls.want_count if want_count is None else want_count
+        optional_count = (
+            cls.optional_count if optional_count is None else optional_count
         )
 
-        conversion_rate = (intent_score + 1.0) / (cls.search_count + 10.0)
+        intent_score = (3.0 * must_count) + (1.5 * want_count) + (0.5 * optional_count)
+
+        conversion_rate = (intent_score + 1.0) / (search_count + 10.0)
 
         raw_score = intent_score * conversion_rate
 
@@ -67,21 +138,65 @@ class GlobalAttraction(Base):
         return raw_score / decay_denominator
 
     @classmethod
-    async def track_search_metrics(cls, db: AsyncSession, attraction_ids: list[int]):
+    def refresh_relevance_scores_stmt(cls, attraction_ids: list[int] | None = None):
         """
-        Executes an atomic SQL update pass over selected IDs.
-        Increments metrics in a single network trip without risking state drift.
+        Rewrites the stored relevance_score from the live counters and time decay.
+        Rows whose score did not change are skipped to keep the periodic refresh cheap.
         """
-        if not attraction_ids:
-            return
+        score = cls.dynamic_relevance_rank()
+        stmt = (
+            update(cls)
+            .where(cls.relevance_score.is_distinct_from(score))
+            .values(relevance_score=score)
+            .execution_options(synchronize_session=False)
+        )
+        if attraction_ids is not None:
+            stmt = stmt.where(cls.id.in_(attraction_ids))
+        return stmt
 
-        from sqlalchemy import update
+    @classmethod
+    async def refresh_relevance_scores(cls, db: AsyncSession):
+        result = await db.execute(cls.refresh_relevance_scores_stmt())
+        log.info(f"Refreshed relevance scores for {result.rowcount} attractions.")
 
-        stmt = (
+    @classmethod
+    def apply_metric_deltas_stmt(cls, deltas: dict[int, dict[str, int]]):
+        """
+        Builds a single UPDATE ... FROM (VALUES ...) applying buffered counter deltas
+        for many attractions at once. Counters never drop below zero and the stored
+        relevance score is recomputed from the new values in the same pass.
+        """
+        rows = [
+            (attraction_id, *(counts.get(c, 0) for c in METRIC_COLUMNS))
+            for attraction_id, counts in deltas.items()
+        ]
+        delta_table = values(
+            column("id", Integer),
+            *(column(c, Integer) for c in METRIC_COLUMNS),
+            name="deltas",
+        ).data(rows)
+
+        new_counts = {
+            c: func.greatest(getattr(cls, c) + getattr(delta_table.c, c), 0)
+            for c in METRIC_COLUMNS
+        }
+
+        return (
             update(cls)
-            .where(cls.id.in_(attraction_ids))
-            .values(search_count=cls.search_count + 1)
+            .where(cls.id == delta_table.c.id)
+            .values(
+                **new_counts,
+                relevance_score=cls.dynamic_relevance_rank(**new_counts),
+            )
+            .execution_options(synchronize_session=False)
         )
 
-        await db.execute(stmt)
-        await db.commit()
+
+@event.listens_for(GlobalAttraction, "before_insert")
+@event.listens_for(GlobalAttraction, "before_update")
+def _set_location_keys(mapper, connection, target: GlobalAttraction):
+    for key, value in GlobalAttraction.location_keys(
+        target.city, target.country
+    ).items():
+        setattr(target, key, value)
+    target.h3_cell = GlobalAttraction.spatial_cell(target.latitude, target.longitude)
@@ -0,0 +1,38 @@
+"""Denormalized snapshot of the itinerary graph state served to read endpoints."""
+
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, JSON
+from sqlalchemy.sql import func
+from app.core.database import Base
+
+
+class ItineraryReadModel(Base):
+    __tablename__ = "itinerary_read_models"
+
+    session_id = Column(
+        Integer,
+        ForeignKey("vacation_sessions.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+
+    stage = Column(Integer, default=0, nullable=False)
+    pace = Column(String, nullable=True)
+    search_location = Column(String, nullable=True)
+
+    bucket_counts = Column(JSON, nullable=True)
+    schedule_summary = Column(JSON, nullable=True)
+
+    pois = Column(JSON, nullable=True)
+    resolved_attractions = Column(JSON, nullable=True)
+    mobility_config = Column(JSON, nullable=True)
+    mobility_recommendation = Column(JSON, nullable=True)
+    pace_recommendation = Column(JSON, nullable=True)
+    schedule = Column(JSON, nullable=True)
+    excluded_pois = Column(JSON, nullable=True)
+    trip_details = Column(JSON, nullable=True)
+
+    updated_at = Column(
+        DateTime(timezone=True), server_default=func.now(), onupdate=func.now()
+    )
+
+    def __repr__(self):
+        return f"<ItineraryReadModel session_id={self.session_id} stage={self.stage}>"
@@ -0,0 +1,21 @@
+"""Resolved places (labels and city centres) keyed on normalized query text."""
+
+from sqlalchemy import Column, DateTime, Float, String
+from sqlalchemy.sql import func
+from app.core.database import Base
+
+
+class PlaceResolution(Base):
+    __tablename__ = "place_resolutions"
+
+    query_key = Column(String, primary_key=True)
+    label = Column(String, nullable=True)
+    name = Column(String, nullable=True)
+    latitude = Column(Float, nullable=True)
+    longitude = Column(Float, nullable=True)
+    source = Column(String, nullable=False)
+
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    updated_at = Column(
+        DateTime(timezone=True), server_default=func.now(), onupdate=func.now()
+    )
@@ -0,0 +1,15 @@
+"""Rendered PDF blobs addressed by a hash of the payload they were rendered from."""
+
+from sqlalchemy import Column, DateTime, Integer, LargeBinary, String
+from sqlalchemy.sql import func
+from app.core.database import Base
+
+
+class RenderedDocument(Base):
+    __tablename__ = "rendered_documents"
+
+    content_hash = Column(String(64), primary_key=True)
+    content = Column(LargeBinary, nullable=False)
+    byte_size = Column(Integer, nullable=False)
+
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
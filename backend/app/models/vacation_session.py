@@ -10,9 +10,11 @@ from sqlalchemy import (
     DateTime,
     ForeignKey,
     Boolean,
+    Index,
     Integer,
     Table,
     Text,
+    text,
 )
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
@@ -56,6 +58,13 @@ vacation_companions = Table(
 
 class VacationSession(Base):
     __tablename__ = "vacation_sessions"
+    __table_args__ = (
+        Index(
+            "ix_vacation_sessions_active_updated_at",
+            "updated_at",
+            postgresql_where=text("is_active"),
+        ),
+    )
 
     id = Column(Integer, primary_key=True, index=True, autoincrement=True)
     user_id = Column(
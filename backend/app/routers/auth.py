@@ -5,13 +5,15 @@ from fastapi import (
     APIRouter,
     Depends,
     HTTPException,
+    Request,
     Response,
     BackgroundTasks,
 )
 from pydantic import BaseModel
 from app.core.auth import auth, refresh_token_cookie, access_token_header
 from app.core.database import get_db
-from app import models, schemas, utils
+from app import models, schemas
+from app.utils import security
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 from datetime import datetime, timezone
@@ -31,9 +33,16 @@ log = get_logger(__name__)
 router = APIRouter(prefix="/auth", tags=["Authentication"])
 
 
+def client_ip(request: Request) -> str | None:
+    # uvicorn rewrites the client from X-Forwarded-For when the request comes
+    # from the gateway (FORWARDED_ALLOW_IPS), so this is the real caller.
+    return request.client.host if request.client else None
+
+
 @router.post("/register", response_model=schemas.User)
 async def register_user(
     user: schemas.UserCreate,
+    request: Request,
     background_tasks: BackgroundTasks,
     db: AsyncSession = Depends(get_db),
 ):
@@ -49,7 +58,9 @@ async def register_user(
     if user.password != user.confirm_password:
         raise HTTPException(status_code=400, detail="Passwords do not match")
 
-    hashed_password = utils.security.get_password_hash(user.password)
+    hashed_password = await security.get_password_hash_async(
+        user.password, ip=client_ip(request), account=user.email
+    )
     background_tasks.add_task(send_verification_email, user.email)
     db_user = models.User(email=user.email, hashed_password=hashed_password)
     db.add(db_user)
@@ -139,7 +150,7 @@ class ResetPasswordRequest(BaseModel):
 
 @router.post("/reset-password")
 async def reset_password(
-    data: ResetPasswordRequest, db: AsyncSession = Depends(get_db)
+    data: ResetPasswordRequest, request: Request, db: AsyncSession = Depends(get_db)
 ):
     if data.new_password != data.confirm_password:
         raise HTTPException(status_code=400, detail="Passwords do not match")
@@ -159,13 +170,18 @@ async def reset_password(
     if not user:
         raise HTTPException(status_code=404, detail="User not found")
 
-    if utils.security.verify_password(data.new_password, user.hashed_password):
+    ip = client_ip(request)
+    if await security.verify_password_async(
+        data.new_password, user.hashed_password, ip=ip, account=email
+    ):
         raise HTTPException(
             status_code=400,
             detail="Your new password cannot be the same as your old password.",
         )
 
-    user.hashed_password = utils.security.get_password_hash(data.new_password)
+    user.hashed_password = await security.get_password_hash_async(
+        data.new_password, ip=ip, account=email
+    )
 
     exp_timestamp = payload.get("exp")
     jti = payload.get("jti")
@@ -173,7 +189,7 @@ async def reset_password(
         expires_at = datetime.fromtimestamp(exp_timestamp, tz=timezone.utc).replace(
             tzinfo=None
         )
-        await utils.security.blacklist_token(db=db, token=jti, expires_at=expires_at)
+        await security.blacklist_token(db=db, token=jti, expires_at=expires_at)
 
     await db.commit()
 
@@ -187,13 +203,19 @@ class LoginForm(BaseModel):
 
 @router.post("/login")
 async def login(
-    data: LoginForm, response: Response, db: AsyncSession = Depends(get_db)
+    data: LoginForm,
+    request: Request,
+    response: Response,
+    db: AsyncSession = Depends(get_db),
 ):
     stmt = select(models.User).filter(models.User.email == data.email)
     result = await db.execute(stmt)
     user = result.scalars().first()
-    if not user or not utils.security.verify_password(
-        data.password, user.hashed_password
+    if not user or not await security.verify_password_async(
+        data.password,
+        user.hashed_password,
+        ip=client_ip(request),
+        account=data.email,
     ):
         raise HTTPException(
             status_code=401, detail="Login failed. Please check your credentials."
@@ -221,7 +243,7 @@ async def refresh_token(
     db: AsyncSession = Depends(get_db),
 ):
     try:
-        await utils.security.blacklist_token(
+        await security.blacklist_token(
             db=db, token=token.jti, expires_at=token.exp
         )
 
@@ -247,11 +269,11 @@ async def logout(
     db: AsyncSession = Depends(get_db),
 ):
     try:
-        await utils.security.blacklist_token(
+        await security.blacklist_token(
             db=db, token=access_token.jti, expires_at=access_token.exp
         )
 
-        await utils.security.blacklist_token(
+        await security.blacklist_token(
             db=db, token=refresh_token.jti, expires_at=refresh_token.exp
         )
 
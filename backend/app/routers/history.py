@@ -1,7 +1,8 @@
 from typing import Any, List, Optional
 
 from app.core.database import get_db
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
+from fastapi.responses import JSONResponse
 from app import models
 from app.core.logger import get_logger
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -11,12 +12,20 @@ from authx import TokenPayload
 from app.core.auth import access_token_header
 from datetime import date, datetime
 from pydantic import BaseModel, ConfigDict
+from app.services.delivery.queue import enqueue_pdf_render
+from app.services.email.pdf_cache import (
+    get_cached_pdf,
+    pdf_content_hash,
+    vacation_document_payload,
+)
 
 
 logger = get_logger(__name__)
 
 router = APIRouter(prefix="/history", tags=["history"])
 
+PDF_RETRY_AFTER_SECONDS = 5
+
 
 class VacationSummary(BaseModel):
     """
@@ -105,6 +114,68 @@ async def get_vacation_details(
     return vacation
 
 
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """
+    If-None-Match comparison (RFC 9110 13.1.2): `*` matches any current
+    representation, otherwise any listed tag matches by weak comparison.
+    """
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+
+    opaque = etag.removeprefix("W/")
+    return any(
+        tag.strip().removeprefix("W/") == opaque for tag in if_none_match.split(",")
+    )
+
+
+@router.get("/vacations/{vacation_id}/pdf")
+async def download_vacation_pdf(
+    vacation_id: str,
+    request: Request,
+    db: AsyncSession = Depends(get_db),
+    token: TokenPayload = Depends(access_token_header),
+):
+    """
+    Serves the itinerary PDF of a vacation from the rendered document cache.
+    The ETag is the payload hash, so unchanged snapshots revalidate with a 304.
+    PDFs are only rendered by the delivery worker: until the blob exists a
+    render job is queued and the client is told to retry with a 202.
+    """
+    stmt = select(models.Vacation).where(
+        models.Vacation.id == vacation_id, models.Vacation.user_id == token.sub
+    )
+    vacation = (await db.execute(stmt)).scalar_one_or_none()
+
+    if not vacation:
+        raise HTTPException(status_code=404, detail="Vacation not found")
+
+    payload = vacation_document_payload(vacation)
+    content_hash = pdf_content_hash(payload)
+    etag = f'"{content_hash}"'
+    headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers=headers)
+
+    pdf_bytes = await get_cached_pdf(db, content_hash)
+    if pdf_bytes is None:
+        await enqueue_pdf_render(db, token.sub, payload, content_hash)
+        await db.commit()
+        return JSONResponse(
+            status_code=202,
+            content={"status": "rendering"},
+            headers={"Retry-After": str(PDF_RETRY_AFTER_SECONDS)},
+        )
+
+    filename = (
+        f"TuRAG_Itinerary_{vacation.destination.replace(',', '').replace(' ', '_')}.pdf"
+    )
+    headers["Content-Disposition"] = f'attachment; filename="{filename}"'
+    return Response(content=pdf_bytes, media_type="application/pdf", headers=headers)
+
+
 @router.delete("/vacations/{vacation_id}")
 async def delete_history(
     vacation_id: str,
@@ -3,18 +3,20 @@ from fastapi import APIRouter, Depends, HTTPException
 from app import models
 from app.core.logger import get_logger
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, update
+from sqlalchemy import select
 from authx import TokenPayload
 from app.core.auth import access_token_header
 from langgraph.checkpoint.postgres.aio import AsyncPostgresSaver
 from app.services.agents.itinerary_graph import (
     generate_graph as generate_itinerary_graph,
     run_itinerary_graph,
+    load_itinerary_view,
 )
+from app.services.agents.read_model import sync_itinerary_read_model
 from app.schemas.itinerary import *
 from app.services.agents.mobility_strategies import MobilityConfig
 
-from app.models.global_attraction import GlobalAttraction
+from app.services.search.attraction_metrics import record_attraction_metrics
 
 log = get_logger(__name__)
 
@@ -42,6 +44,9 @@ async def update_stage(
     config = {"configurable": {"thread_id": f"itinerary_{data.session_id}"}}
 
     await graph.aupdate_state(config, {"stage": data.stage})
+    await sync_itinerary_read_model(
+        db, data.session_id, {"stage": data.stage}, partial=True
+    )
 
     return {"status": "success", "new_stage": data.stage}
 
@@ -69,9 +74,10 @@ async def update_search_location(
     graph = generate_itinerary_graph(checkpointer)
     config = {"configurable": {"thread_id": f"itinerary_{data.session_id}"}}
 
-    current_state = await graph.aget_state(config)
-    current_state.values["search_location"] = data.new_location
     await graph.aupdate_state(config, {"search_location": data.new_location})
+    await sync_itinerary_read_model(
+        db, data.session_id, {"search_location": data.new_location}, partial=True
+    )
 
     return {"status": "success", "new_search_location": data.new_location}
 
@@ -95,12 +101,10 @@ async def get_itinerary_state(
             f"Unauthorized access attempt to session {session_id} by user {token.sub}"
         )
         raise HTTPException(status_code=404, detail="Session not found")
-    config = {"configurable": {"thread_id": f"itinerary_{session_id}"}}
 
-    graph = generate_itinerary_graph(checkpointer)
-    state = await graph.aget_state(config)
+    state = await load_itinerary_view(session_id, db, checkpointer)
 
-    if not state.values:
+    if not state:
         return {
             "stage": 0,
             "pois": [],
@@ -115,27 +119,13 @@ async def get_itinerary_state(
             "trip_details": None,
         }
 
-    ui_keys = {
-        "stage",
-        "pois",
-        "resolved_attractions",
-        "search_location",
-        "mobility_config",
-        "pace",
-        "mobility_recommendation",
-        "pace_recommendation",
-        "schedule",
-        "excluded_pois",
-        "trip_details",
-    }
-
-    return {k: v for k, v in state.values.items() if k in ui_keys}
+    return state
 
 
 BUCKET_COLUMN_MAP = {
-    "must": GlobalAttraction.must_count,
-    "want": GlobalAttraction.want_count,
-    "optional": GlobalAttraction.optional_count,
+    "must": "must_count",
+    "want": "want_count",
+    "optional": "optional_count",
 }
 
 
@@ -162,12 +152,13 @@ async def add_to_bucket(
     graph = generate_itinerary_graph(checkpointer)
     config = {"configurable": {"thread_id": f"itinerary_{data.session_id}"}}
 
-    current_state = await graph.aget_state(config)
+    current_state = await load_itinerary_view(data.session_id, db, checkpointer)
 
-    pois = current_state.values.get("pois", [])
+    pois = (current_state or {}).get("pois") or []
 
     existing_poi = next((p for p in pois if p["id"] == data.attraction_id), None)
     new_col = BUCKET_COLUMN_MAP.get(data.bucket.lower())
+    counts = {}
 
     if existing_poi:
         old_bucket = existing_poi.get("bucket", "want")
@@ -175,27 +166,14 @@ async def add_to_bucket(
             old_col = BUCKET_COLUMN_MAP.get(old_bucket.lower())
 
             if old_col is not None:
-                await db.execute(
-                    update(GlobalAttraction)
-                    .where(GlobalAttraction.id == data.attraction_id)
-                    .where(old_col > 0)
-                    .values({old_col: old_col - 1})
-                )
+                counts[old_col] = counts.get(old_col, 0) - 1
             if new_col is not None:
-                await db.execute(
-                    update(GlobalAttraction)
-                    .where(GlobalAttraction.id == data.attraction_id)
-                    .values({new_col: new_col + 1})
-                )
+                counts[new_col] = counts.get(new_col, 0) + 1
     else:
         if new_col is not None:
-            await db.execute(
-                update(GlobalAttraction)
-                .where(GlobalAttraction.id == data.attraction_id)
-                .values({new_col: new_col + 1})
-            )
+            counts[new_col] = 1
 
-    await db.commit()
+    await record_attraction_metrics(db, {data.attraction_id: counts})
 
     new_poi = {
         "id": data.attraction_id,
@@ -208,6 +186,9 @@ async def add_to_bucket(
     updated_pois = [p for p in pois if p["id"] != data.attraction_id] + [new_poi]
 
     await graph.aupdate_state(config, {"pois": updated_pois})
+    await sync_itinerary_read_model(
+        db, data.session_id, {"pois": updated_pois}, partial=True
+    )
 
     return {"status": "success", "pois": updated_pois}
 
@@ -229,8 +210,8 @@ async def remove_from_bucket(
 
     config = {"configurable": {"thread_id": f"itinerary_{data.session_id}"}}
     graph = generate_itinerary_graph(checkpointer)
-    current_state = await graph.aget_state(config)
-    pois = current_state.values.get("pois", [])
+    current_state = await load_itinerary_view(data.session_id, db, checkpointer)
+    pois = (current_state or {}).get("pois") or []
 
     target_poi = next((p for p in pois if p["id"] == data.attraction_id), None)
     if not target_poi:
@@ -240,16 +221,13 @@ async def remove_from_bucket(
     target_col = BUCKET_COLUMN_MAP.get(current_bucket.lower())
 
     if target_col is not None:
-        await db.execute(
-            update(GlobalAttraction)
-            .where(GlobalAttraction.id == data.attraction_id)
-            .where(target_col > 0)
-            .values({target_col: target_col - 1})
-        )
-        await db.commit()
+        await record_attraction_metrics(db, {data.attraction_id: {target_col: -1}})
 
     updated_pois = [p for p in pois if p["id"] != data.attraction_id]
     await graph.aupdate_state(config, {"pois": updated_pois})
+    await sync_itinerary_read_model(
+        db, data.session_id, {"pois": updated_pois}, partial=True
+    )
 
     return {"status": "success", "pois": updated_pois}
 
@@ -309,8 +287,11 @@ async def update_mobility(
 
     validated_config = MobilityConfig.model_validate(data.config)
 
-    await graph.aupdate_state(
-        config, {"mobility_config": validated_config.model_dump(mode="json")}
+    mobility_config = validated_config.model_dump(mode="json")
+
+    await graph.aupdate_state(config, {"mobility_config": mobility_config})
+    await sync_itinerary_read_model(
+        db, data.session_id, {"mobility_config": mobility_config}, partial=True
     )
 
     return {"status": "success"}
@@ -379,6 +360,9 @@ async def trigger_pace_change(
 
     try:
         await graph.aupdate_state(config, {"pace": data.pace})
+        await sync_itinerary_read_model(
+            db, data.session_id, {"pace": data.pace}, partial=True
+        )
 
         return {"status": "success", "new_pace": data.pace}
     except Exception as e:
@@ -453,6 +437,9 @@ async def update_trip_details(
 
     try:
         await graph.aupdate_state(config, {"trip_details": data.trip_details})
+        await sync_itinerary_read_model(
+            db, data.session_id, {"trip_details": data.trip_details}, partial=True
+        )
 
         return {"status": "success", "updated_trip_details": data.trip_details}
     except Exception as e:
@@ -530,8 +517,8 @@ async def set_transit_mode(
     config = {"configurable": {"thread_id": f"itinerary_{data.session_id}"}}
 
     try:
-        current_state = await graph.aget_state(config)
-        schedule = current_state.values.get("schedule", {})
+        current_state = await load_itinerary_view(data.session_id, db, checkpointer)
+        schedule = (current_state or {}).get("schedule") or []
 
         updated = False
         for day in schedule:
@@ -14,7 +14,7 @@ from fastapi.responses import StreamingResponse
 import jwt
 from app.core.auth import auth, access_token_header
 from app.core.database import get_db
-from app import utils
+from app.utils import security
 from sqlalchemy.ext.asyncio import AsyncSession
 from datetime import datetime, timezone
 from app.core.cache import redis_cache
@@ -39,7 +39,7 @@ async def refresh_token(
 
         expiry_datetime = datetime.fromtimestamp(refresh_exp, tz=timezone.utc)
 
-        await utils.security.blacklist_token(
+        await security.blacklist_token(
             db=db, token=refresh_jti, expires_at=expiry_datetime
         )
 
@@ -1,106 +1,96 @@
 import asyncio
-import orjson
 from contextlib import asynccontextmanager
-from datetime import datetime, timedelta
+from datetime import datetime
 from fastapi import APIRouter, Depends, Request
 from fastapi.responses import StreamingResponse
 from sqlalchemy import select, update
+from sqlalchemy.dialects.postgresql import insert
 from app import models
 from app.core.database import get_db
 from app.core.auth import access_token_header
 from sqlalchemy.ext.asyncio import AsyncSession
+from app.services.notifications.broadcaster import notification_broadcaster
+from app.utils.generic import format_sse
 
 router = APIRouter(prefix="/notifications", tags=["Notifications"])
 
 get_db_context = asynccontextmanager(get_db)
 
 
-async def notification_stream_generator(user_id: str, request: Request):
-    last_sent_hash = None
-    last_abandon_check = datetime.min
+HEARTBEAT_SECONDS = 15
+
+
+async def ensure_welcome_notification(db: AsyncSession, user_id: str):
+    await db.execute(
+        insert(models.Notification)
+        .values(
+            user_id=user_id,
+            category="WELCOME",
+            event_key=f"welcome_{user_id}",
+            message="Welcome to TuRAG! 🌴 Start planning your next trip in the dashboard.",
+            is_read=False,
+        )
+        .on_conflict_do_nothing(index_elements=["event_key"])
+    )
+    await db.commit()
 
-    while True:
-        if await request.is_disconnected():
-            break
 
+async def load_notifications(db: AsyncSession, user_id: str) -> list[dict]:
+    result = await db.execute(
+        select(models.Notification)
+        .where(
+            models.Notification.user_id == user_id,
+            models.Notification.deleted_at == None,
+        )
+        .order_by(models.Notification.created_at.desc())
+    )
+
+    return [
+        {
+            "id": n.id,
+            "category": n.category,
+            "message": n.message,
+            "is_read": n.is_read,
+            "created_at": n.created_at.isoformat() if n.created_at else None,
+        }
+        for n in result.scalars().all()
+    ]
+
+
+async def notification_stream_generator(user_id: str, request: Request):
+    """
+    Sends the user's notification list once as a `snapshot` event, then relays
+    `delta` events pushed by the broadcaster. Comment frames keep idle
+    connections alive.
+    """
+    queue = notification_broadcaster.subscribe(user_id)
+
+    try:
         async with get_db_context() as db:
-            welcome_key = f"welcome_{user_id}"
-            welcome_exists = await db.execute(
-                select(models.Notification).where(
-                    models.Notification.event_key == welcome_key
-                )
-            )
-
-            if not welcome_exists.scalar():
-                db.add(
-                    models.Notification(
-                        user_id=user_id,
-                        category="WELCOME",
-                        event_key=welcome_key,
-                        message="Welcome to TuRAG! 🌴 Start planning your next trip in the dashboard.",
-                    )
-                )
-                await db.commit()
-
-            if (datetime.now() - last_abandon_check).total_seconds() > 300:
-                threshold = datetime.now() - timedelta(hours=24)
-                sessions = await db.execute(
-                    select(models.VacationSession).where(
-                        models.VacationSession.user_id == user_id,
-                        models.VacationSession.updated_at < threshold,
-                        models.VacationSession.is_active == True,
-                    )
-                )
-
-                for session in sessions.scalars().all():
-                    abandon_key = f"abandon_{session.id}"
-                    exists = await db.execute(
-                        select(models.Notification).where(
-                            models.Notification.event_key == abandon_key
-                        )
-                    )
-
-                    if not exists.scalar():
-                        db.add(
-                            models.Notification(
-                                user_id=user_id,
-                                category="SESSION_ALERT",
-                                event_key=abandon_key,
-                                message=f"Still thinking about {session.destination or 'your trip'}? Jump back in!",
-                            )
-                        )
-
-                await db.commit()
-                last_abandon_check = datetime.now()
-
-            result = await db.execute(
-                select(models.Notification)
-                .where(
-                    models.Notification.user_id == user_id,
-                    models.Notification.deleted_at == None,
-                )
-                .order_by(models.Notification.created_at.desc())
-            )
-
-            notifications = result.scalars().all()
-            payload = [
-                {
-                    "id": n.id,
-                    "category": n.category,
-                    "message": n.message,
-                    "is_read": n.is_read,
-                    "created_at": n.created_at.isoformat() if n.created_at else None,
-                }
-                for n in notifications
-            ]
-
-            current_hash = hash(orjson.dumps(payload))
-            if current_hash != last_sent_hash:
-                json_string = orjson.dumps(payload).decode("utf-8")
-                yield f"data: {json_string}\n\n"
-                last_sent_hash = current_hash
-
-        await asyncio.sleep(10)
+            await ensure_welcome_notification(db, user_id)
+            snapshot = await load_notifications(db, user_id)
+
+        yield format_sse("snapshot", snapshot)
+
+        while True:
+            if await request.is_disconnected():
+                break
+
+            try:
+                event = await asyncio.wait_for(queue.get(), timeout=HEARTBEAT_SECONDS)
+            except asyncio.TimeoutError:
+                event = None
+
+            if event is None:
+                yield ": heartbeat\n\n"
+            elif event.get("op") == "resync":
+                async with get_db_context() as db:
+                    snapshot = await load_notifications(db, user_id)
+                yield format_sse("snapshot", snapshot)
+            else:
+                yield format_sse("delta", event)
+    finally:
+        notification_broadcaster.unsubscribe(user_id, queue)
 
 
 @router.get("/stream")
@@ -1,6 +1,15 @@
-from app.services.search import flights, accommodations_v2
+from app.services.search import (
+    flights,
+    accommodations_v2,
+    flight_prefetch,
+    hotel_details,
+    hotel_results,
+    price_grid,
+)
 from app.core.database import get_db
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Query
+from fastapi.responses import StreamingResponse
+import orjson
 from app import schemas, models
 from app.core.logger import get_logger
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -8,8 +17,11 @@ from sqlalchemy import select, update
 from authx import TokenPayload
 from app.core.auth import access_token_header
 from datetime import datetime
+from typing import AsyncIterator, Optional
 from urllib.parse import parse_qs, urlparse, urlencode, urlunparse
-from app.core.airport_data import AIRPORTS_DB
+from app.services.search.airport_index import get_airport_index
+from app.services.search.nearby_attractions import catalog_city_center
+from app.utils.generic import format_sse
 
 
 log = get_logger(__name__)
@@ -19,115 +31,129 @@ router = APIRouter(prefix="/search", tags=["Search"])
 
 @router.get("/airports/autocomplete")
 def search_airports_autocomplete(q: str = Query(..., min_length=2)):
-    query = q.lower().strip()
-    matches = []
+    return get_airport_index().search(q)
 
-    for code, data in AIRPORTS_DB.items():
-        city = data.get("city", "").lower()
-        name = data.get("name", "").lower()
-        code_lower = code.lower()
 
-        if query in city or query in name or query in code_lower:
-            if code_lower.startswith(query):
-                score = 0
+def _split_place(value: str) -> tuple[str, str | None]:
+    parts = value.split(",")
+    city = parts[0].strip()
+    country = parts[1].strip() if len(parts) > 1 else None
+    return city, country
 
-            elif query == city:
-                if "international" in name or "intl" in name:
-                    score = 10
-                elif "municipal" in name or "county" in name or "field" in name:
-                    score = 30
-                else:
-                    score = 20
 
-            elif city.startswith(query):
-                score = 40
+async def resolve_departure_params(
+    data: schemas.FlightsRequest, db: AsyncSession, user_id: str
+) -> dict:
+    """
+    SerpAPI location parameters for the departure side. Explicit airport codes
+    keep the session currency; city names are resolved through the airport index.
+    """
+    index = get_airport_index()
+    departure_codes = index.parse_iata_list(data.departure)
+    if not departure_codes:
+        return flights.get_location_data(*_split_place(data.departure))
 
-            elif name.startswith(query):
-                score = 50
-
-            elif query in city:
-                score = 60
-
-            else:
-                score = 70
-
-            matches.append(
-                (
-                    score,
-                    {
-                        "code": code,
-                        "city": data.get("city", ""),
-                        "name": data.get("name", ""),
-                        "country": data.get("country", ""),
-                    },
-                )
+    first_airport = index.airport(departure_codes[0])
+    stmt = select(models.VacationSession).filter(
+        models.VacationSession.id == data.session_id,
+        models.VacationSession.user_id == user_id,
+    )
+    result = await db.execute(stmt)
+    session = result.scalars().first()
+    currency = (session.currency if session else "EUR") or "EUR"
+    return {
+        "departure_id": ",".join(departure_codes),
+        "gl": first_airport.get("country", "US").lower(),
+        "hl": "en",
+        "currency": currency,
+    }
+
+
+def resolve_arrival_id(arrival: str) -> str | None:
+    arrival_codes = get_airport_index().parse_iata_list(arrival)
+    if arrival_codes:
+        return ",".join(arrival_codes)
+    return flights.get_location_data(*_split_place(arrival)).get("departure_id")
+
+
+def flight_search_params(
+    data: schemas.FlightsRequest, location: dict, arrival_id: str
+) -> dict:
+    """
+    Shared `call_flights_api` arguments. The Redis cache key follows argument
+    order, so every flight route (and the inbound prefetch) builds them here.
+    """
+    return {
+        "departure_id": location.get("departure_id"),
+        "arrival_id": arrival_id,
+        "outbound_date": data.outbound_date,
+        "return_date": data.return_date,
+        "adults": data.adults,
+        "children": data.children,
+        "infants_in_seat": data.infants_in_seat,
+        "infants_on_lap": data.infants_on_lap,
+        "sort_by": data.sort_by,
+        "stops": data.stops,
+        "gl": location.get("gl"),
+        "hl": location.get("hl"),
+        "currency": location.get("currency"),
+    }
+
+
+MAX_FLIGHT_OPTIONS = 12
+
+
+def ranked_flights(flight_results: dict) -> list[dict]:
+    """The results shown to the user: best_flights first, then other_flights."""
+    best_flights = flight_results.get("best_flights") or []
+    other_flights = flight_results.get("other_flights") or []
+    return (best_flights + other_flights)[:MAX_FLIGHT_OPTIONS]
+
+
+def flight_option(
+    flight: dict, token_key: str, currency: str | None
+) -> schemas.FlightsResponse | None:
+    """Normalizes one SerpAPI result; None when it carries no token to continue with."""
+    token = flight.get(token_key)
+    if not token:
+        return None
+
+    return schemas.FlightsResponse(
+        token=token,
+        price=flight.get("price"),
+        currency=currency,
+        flights=[
+            schemas.Flight(
+                airline=detail.get("airline", ""),
+                airline_logo=detail.get("airline_logo"),
+                departure=detail.get("departure_airport", {}).get("name"),
+                departure_time=detail.get("departure_airport", {}).get("time"),
+                arrival=detail.get("arrival_airport", {}).get("name"),
+                arrival_time=detail.get("arrival_airport", {}).get("time"),
+                duration=str(detail.get("duration", "")),
+                airplane=detail.get("airplane"),
+                travel_class=detail.get("travel_class"),
+                extensions=list(detail.get("extensions", [])),
             )
+            for detail in flight.get("flights", [])
+        ],
+    )
 
-    matches.sort(key=lambda x: (x[0], x[1]["country"], x[1]["city"]))
-
-    results = [m[1] for m in matches[:15]]
 
-    return results
+def flight_options(flights_list: list[dict], token_key: str, currency: str | None):
+    for flight in flights_list:
+        option = flight_option(flight, token_key, currency)
+        if option is not None:
+            yield option
 
 
-@router.post("/getOutboundFlights", response_model=list[schemas.FlightsResponse])
-async def search_outbound_flights(
-    data: schemas.FlightsRequest,
-    db: AsyncSession = Depends(get_db),
-    access_token: TokenPayload = Depends(access_token_header),
-):
-    log.info(f"Request data: {data}")
+async def outbound_search_params(
+    data: schemas.FlightsRequest, db: AsyncSession, user_id: str
+) -> dict:
     log.info(f"Searching flights: {data.departure} -> {data.arrival}")
     try:
-        departure_codes = [
-            c.strip().upper() for c in data.departure.split(",") if c.strip()
-        ]
-        is_departure_iata = len(departure_codes) > 0 and all(
-            len(c) == 3 and c in AIRPORTS_DB for c in departure_codes
-        )
-
-        if is_departure_iata:
-            first_airport = AIRPORTS_DB[departure_codes[0]]
-            stmt = select(models.VacationSession).filter(
-                models.VacationSession.id == data.session_id,
-                models.VacationSession.user_id == access_token.sub,
-            )
-            result = await db.execute(stmt)
-            session = result.scalars().first()
-            currency = (session.currency if session else "EUR") or "EUR"
-            results = {
-                "departure_id": ",".join(departure_codes),
-                "gl": first_airport.get("country", "US").lower(),
-                "hl": "en",
-                "currency": currency,
-            }
-            log.info(
-                f"Location data for departure {', '.join(departure_codes)}: {results}"
-            )
-        else:
-            departure = data.departure.split(",")
-            city = departure[0].strip()
-            country = departure[1].strip() if len(departure) > 1 else None
-            results = flights.get_location_data(city, country)
-
-            log.info(f"Location data for departure {city}, {country}: {results}")
-
-        arrival_codes = [
-            c.strip().upper() for c in data.arrival.split(",") if c.strip()
-        ]
-        is_arrival_iata = len(arrival_codes) > 0 and all(
-            len(c) == 3 and c in AIRPORTS_DB for c in arrival_codes
-        )
-
-        if is_arrival_iata:
-            arrival_id = ",".join(arrival_codes)
-        else:
-            arrival = data.arrival.split(",")
-            city = arrival[0].strip()
-            country = arrival[1].strip() if len(arrival) > 1 else None
-            arrival_id = flights.get_location_data(city, country).get("departure_id")
-
-        log.info(f"Location data for arrival {city}, {country}: {arrival_id}")
+        results = await resolve_departure_params(data, db, user_id)
+        arrival_id = resolve_arrival_id(data.arrival)
 
         if not results.get("departure_id"):
             raise HTTPException(
@@ -145,69 +171,173 @@ async def search_outbound_flights(
         log.error(f"Error getting flight parameters: {e}")
         raise HTTPException(status_code=400, detail="Invalid location format")
 
-    log.info("Searching for outbound flights...")
-    flight_results = await flights.call_flights_api(
-        departure_id=results.get("departure_id"),
-        arrival_id=arrival_id,
-        outbound_date=data.outbound_date,
-        return_date=data.return_date,
-        adults=data.adults,
-        children=data.children,
-        infants_in_seat=data.infants_in_seat,
-        infants_on_lap=data.infants_on_lap,
-        sort_by=data.sort_by,
-        stops=data.stops,
-        gl=results.get("gl"),
-        hl=results.get("hl"),
-        currency=results.get("currency"),
-    )
+    return flight_search_params(data, results, arrival_id)
+
+
+def schedule_inbound_prefetch(
+    background_tasks: BackgroundTasks,
+    data: schemas.FlightsRequest,
+    search_params: dict,
+    departure_tokens: list[str],
+):
+    """`departure_tokens` is read when the task runs, after the response is sent."""
+    if data.prefetch_inbound and data.return_date:
+        background_tasks.add_task(
+            flight_prefetch.prefetch_inbound, search_params, departure_tokens
+        )
 
-    best_flights = flight_results.get("best_flights")
-    other_flights = flight_results.get("other_flights")
-    all_flights = (best_flights or []) + (other_flights or [])
 
-    if not all_flights:
+@router.post("/getOutboundFlights", response_model=list[schemas.FlightsResponse])
+async def search_outbound_flights(
+    data: schemas.FlightsRequest,
+    background_tasks: BackgroundTasks,
+    db: AsyncSession = Depends(get_db),
+    access_token: TokenPayload = Depends(access_token_header),
+):
+    search_params = await outbound_search_params(data, db, access_token.sub)
+    flight_results = await flights.call_flights_api(**search_params)
+
+    outbound = ranked_flights(flight_results)
+    if not outbound:
         log.warning("No flights found for the given criteria.")
         raise HTTPException(status_code=404, detail="No flights found")
 
-    log.info(f"Found {len(all_flights)} flights.")
     try:
-        response = []
-        for flight in all_flights[:12]:
-            log.info(f"Flight: Price {flight.get('price')}")
-            if not flight.get("departure_token"):
-                log.warning("Skipping flight with missing departure token.")
-                continue
-            flight_schema = schemas.FlightsResponse(
-                token=flight.get("departure_token"),
-                price=flight.get("price"),
-                currency=results.get("currency", "EUR"),
-                flights=[],
-            )
-            for detail in flight.get("flights", []):
-                flight_detail = schemas.Flight(
-                    airline=detail.get("airline", ""),
-                    airline_logo=detail.get("airline_logo"),
-                    departure=detail.get("departure_airport", {}).get("name"),
-                    departure_time=detail.get("departure_airport", {}).get("time"),
-                    arrival=detail.get("arrival_airport", {}).get("name"),
-                    arrival_time=detail.get("arrival_airport", {}).get("time"),
-                    duration=str(detail.get("duration", "")),
-                    airplane=detail.get("airplane"),
-                    travel_class=detail.get("travel_class"),
-                    extensions=[ext for ext in detail.get("extensions", [])],
-                )
-                flight_schema.flights.append(flight_detail)
-            response.append(flight_schema)
+        response = list(
+            flight_options(outbound, "departure_token", search_params["currency"])
+        )
     except Exception as e:
         log.error(f"Error constructing flight response: {e}")
         raise HTTPException(
             status_code=500, detail=f"Error processing flight data: {e}"
         )
 
+    log.info(f"Returning {len(response)} outbound flights.")
+    schedule_inbound_prefetch(
+        background_tasks, data, search_params, [option.token for option in response]
+    )
     return response
 
 
+async def flight_option_lines(
+    flights_stream: AsyncIterator[dict],
+    currency: str | None,
+    departure_tokens: Optional[list[str]] = None,
+):
+    """
+    One FlightsResponse line per ranked flight as it arrives, or an
+    `{"error": ...}` line. The upstream stream is always read to the end, so
+    the complete search still lands in the cache.
+    """
+    sent = 0
+    seen = 0
+    try:
+        async for flight in flights_stream:
+            seen += 1
+            if seen > MAX_FLIGHT_OPTIONS:
+                continue
+            option = flight_option(flight, "departure_token", currency)
+            if option is None:
+                continue
+            if departure_tokens is not None:
+                departure_tokens.append(option.token)
+            sent += 1
+            yield option.model_dump_json() + "\n"
+    except Exception as e:
+        log.error(f"Error streaming flight response: {e}")
+        yield orjson.dumps({"error": "Error processing flight data"}).decode() + "\n"
+        return
+
+    if not sent:
+        log.warning("No flights found for the given criteria.")
+        yield orjson.dumps({"error": "No flights found"}).decode() + "\n"
+
+
+@router.post("/getOutboundFlights/stream")
+async def stream_outbound_flights(
+    data: schemas.FlightsRequest,
+    background_tasks: BackgroundTasks,
+    db: AsyncSession = Depends(get_db),
+    access_token: TokenPayload = Depends(access_token_header),
+):
+    """
+    NDJSON variant of getOutboundFlights: one FlightsResponse per line, in the
+    same order (best_flights first). The response starts right away and each
+    flight is written as soon as its part of the SerpAPI body has arrived.
+    """
+    search_params = await outbound_search_params(data, db, access_token.sub)
+
+    departure_tokens: list[str] = []
+    schedule_inbound_prefetch(background_tasks, data, search_params, departure_tokens)
+    return StreamingResponse(
+        flight_option_lines(
+            flights.stream_flights_api(**search_params),
+            search_params["currency"],
+            departure_tokens,
+        ),
+        media_type="application/x-ndjson",
+    )
+
+
+async def price_grid_events(search_params: dict, cells: list, currency: str):
+    """
+    SSE stream: a `grid` event listing the cells, a `cell` event per date pair
+    as its search finishes, then `done` with the cheapest cell.
+    """
+    yield format_sse(
+        "grid",
+        {
+            "cells": [{"outbound_date": o, "return_date": r} for o, r in cells],
+            "currency": currency,
+        },
+    )
+
+    cheapest = None
+    async for cell in price_grid.stream_price_grid(search_params, cells):
+        if cell["price"] is not None and (
+            cheapest is None or cell["price"] < cheapest["price"]
+        ):
+            cheapest = cell
+        yield format_sse("cell", cell)
+
+    yield format_sse("done", {"cheapest": cheapest, "currency": currency})
+
+
+@router.post("/flightPriceGrid")
+async def flight_price_grid(
+    data: schemas.FlightPriceGridRequest,
+    db: AsyncSession = Depends(get_db),
+    access_token: TokenPayload = Depends(access_token_header),
+):
+    log.info(f"Price grid: {data.departure} -> {data.arrival} (±{data.days} days)")
+    try:
+        results = await resolve_departure_params(data, db, access_token.sub)
+        arrival_id = resolve_arrival_id(data.arrival)
+        cells = price_grid.grid_cells(data.outbound_date, data.return_date, data.days)
+    except Exception as e:
+        log.error(f"Error getting price grid parameters: {e}")
+        raise HTTPException(status_code=400, detail="Invalid location or date format")
+
+    if not results.get("departure_id") or not arrival_id:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Could not find airports for {data.departure} -> {data.arrival}",
+        )
+    if not cells:
+        raise HTTPException(
+            status_code=400, detail="No upcoming dates in the requested window"
+        )
+
+    return StreamingResponse(
+        price_grid_events(
+            flight_search_params(data, results, arrival_id),
+            cells,
+            results.get("currency"),
+        ),
+        media_type="text/event-stream",
+    )
+
+
 @router.post("/getInboundFlights", response_model=list[schemas.FlightsResponse])
 async def search_inbound_flights(
     data: schemas.FlightsRequest,
@@ -217,48 +347,8 @@ async def search_inbound_flights(
     log.info(f"Request data: {data}")
     log.info(f"Searching flight: {data.departure} -> {data.arrival}")
     try:
-        departure_codes = [
-            c.strip().upper() for c in data.departure.split(",") if c.strip()
-        ]
-        is_departure_iata = len(departure_codes) > 0 and all(
-            len(c) == 3 and c in AIRPORTS_DB for c in departure_codes
-        )
-
-        if is_departure_iata:
-            first_airport = AIRPORTS_DB[departure_codes[0]]
-            stmt = select(models.VacationSession).filter(
-                models.VacationSession.id == data.session_id,
-                models.VacationSession.user_id == access_token.sub,
-            )
-            result = await db.execute(stmt)
-            session = result.scalars().first()
-            currency = (session.currency if session else "EUR") or "EUR"
-            results = {
-                "departure_id": ",".join(departure_codes),
-                "gl": first_airport.get("country", "US").lower(),
-                "hl": "en",
-                "currency": currency,
-            }
-        else:
-            departure = data.departure.split(",")
-            city = departure[0].strip()
-            country = departure[1].strip() if len(departure) > 1 else None
-            results = flights.get_location_data(city, country)
-
-        arrival_codes = [
-            c.strip().upper() for c in data.arrival.split(",") if c.strip()
-        ]
-        is_arrival_iata = len(arrival_codes) > 0 and all(
-            len(c) == 3 and c in AIRPORTS_DB for c in arrival_codes
-        )
-
-        if is_arrival_iata:
-            arrival_id = ",".join(arrival_codes)
-        else:
-            arrival = data.arrival.split(",")
-            city = arrival[0].strip()
-            country = arrival[1].strip() if len(arrival) > 1 else None
-            arrival_id = flights.get_location_data(city, country).get("departure_id")
+        results = await resolve_departure_params(data, db, access_token.sub)
+        arrival_id = resolve_arrival_id(data.arrival)
 
         if not results.get("departure_id"):
             raise HTTPException(
@@ -276,66 +366,26 @@ async def search_inbound_flights(
         raise HTTPException(status_code=400, detail="Invalid location format")
 
     log.info("Searching for inbound flights...")
-    flight_results = await flights.call_flights_api(
-        departure_token=data.token,
-        departure_id=results.get("departure_id"),
-        arrival_id=arrival_id,
-        outbound_date=data.outbound_date,
-        return_date=data.return_date,
-        adults=data.adults,
-        children=data.children,
-        infants_in_seat=data.infants_in_seat,
-        infants_on_lap=data.infants_on_lap,
-        sort_by=data.sort_by,
-        stops=data.stops,
-        gl=results.get("gl"),
-        hl=results.get("hl"),
-        currency=results.get("currency", "EUR"),
+    flight_results = await flight_prefetch.fetch_inbound(
+        flight_search_params(data, results, arrival_id), data.token
     )
 
-    best_flights = flight_results.get("best_flights")
-    other_flights = flight_results.get("other_flights")
-    all_flights = (best_flights or []) + (other_flights or [])
-
-    if not all_flights:
+    inbound = ranked_flights(flight_results)
+    if not inbound:
         log.warning("No flights found for the given criteria.")
         raise HTTPException(status_code=404, detail="No flights found")
 
-    log.info(f"Found {len(all_flights)} flights.")
     try:
-        response = []
-        for flight in all_flights[:12]:
-            log.info(f"Flight: Price {flight.get('price')}")
-            if not flight.get("booking_token"):
-                log.warning("Skipping flight with missing booking token.")
-                continue
-            flight_schema = schemas.FlightsResponse(
-                token=flight.get("booking_token"),
-                price=flight.get("price"),
-                currency=results.get("currency"),
-                flights=[],
-            )
-            for detail in flight.get("flights", []):
-                flight_detail = schemas.Flight(
-                    airline=detail.get("airline", ""),
-                    airline_logo=detail.get("airline_logo"),
-                    departure=detail.get("departure_airport", {}).get("name"),
-                    departure_time=detail.get("departure_airport", {}).get("time"),
-                    arrival=detail.get("arrival_airport", {}).get("name"),
-                    arrival_time=detail.get("arrival_airport", {}).get("time"),
-                    duration=str(detail.get("duration", "")),
-                    airplane=detail.get("airplane"),
-                    travel_class=detail.get("travel_class"),
-                    extensions=[ext for ext in detail.get("extensions", [])],
-                )
-                flight_schema.flights.append(flight_detail)
-            response.append(flight_schema)
+        response = list(
+            flight_options(inbound, "booking_token", results.get("currency"))
+        )
     except Exception as e:
         log.error(f"Error constructing flight response: {e}")
         raise HTTPException(
             status_code=500, detail=f"Error processing flight data: {e}"
         )
 
+    log.info(f"Returning {len(response)} inbound flights.")
     return response
 
 
@@ -348,48 +398,8 @@ async def book_flight(
     log.info(f"Request data: {data}")
     log.info(f"Searching flight: {data.departure} -> {data.arrival}")
     try:
-        departure_codes = [
-            c.strip().upper() for c in data.departure.split(",") if c.strip()
-        ]
-        is_departure_iata = len(departure_codes) > 0 and all(
-            len(c) == 3 and c in AIRPORTS_DB for c in departure_codes
-        )
-
-        if is_departure_iata:
-            first_airport = AIRPORTS_DB[departure_codes[0]]
-            stmt = select(models.VacationSession).filter(
-                models.VacationSession.id == data.session_id,
-                models.VacationSession.user_id == access_token.sub,
-            )
-            result = await db.execute(stmt)
-            session = result.scalars().first()
-            currency = (session.currency if session else "EUR") or "EUR"
-            results = {
-                "departure_id": ",".join(departure_codes),
-                "gl": first_airport.get("country", "US").lower(),
-                "hl": "en",
-                "currency": currency,
-            }
-        else:
-            departure = data.departure.split(",")
-            city = departure[0].strip()
-            country = departure[1].strip() if len(departure) > 1 else None
-            results = flights.get_location_data(city, country)
-
-        arrival_codes = [
-            c.strip().upper() for c in data.arrival.split(",") if c.strip()
-        ]
-        is_arrival_iata = len(arrival_codes) > 0 and all(
-            len(c) == 3 and c in AIRPORTS_DB for c in arrival_codes
-        )
-
-        if is_arrival_iata:
-            arrival_id = ",".join(arrival_codes)
-        else:
-            arrival = data.arrival.split(",")
-            city = arrival[0].strip()
-            country = arrival[1].strip() if len(arrival) > 1 else None
-            arrival_id = flights.get_location_data(city, country).get("departure_id")
+        results = await resolve_departure_params(data, db, access_token.sub)
+        arrival_id = resolve_arrival_id(data.arrival)
 
         if not results.get("departure_id"):
             raise HTTPException(
@@ -407,20 +417,7 @@ async def book_flight(
 
     log.info("Searching for booking link...")
     booking_results = await flights.call_flights_api(
-        booking_token=data.token,
-        departure_id=results.get("departure_id"),
-        arrival_id=arrival_id,
-        outbound_date=data.outbound_date,
-        return_date=data.return_date,
-        adults=data.adults,
-        children=data.children,
-        infants_in_seat=data.infants_in_seat,
-        infants_on_lap=data.infants_on_lap,
-        sort_by=data.sort_by,
-        stops=data.stops,
-        gl=results.get("gl"),
-        hl=results.get("hl"),
-        currency=results.get("currency"),
+        booking_token=data.token, **flight_search_params(data, results, arrival_id)
     )
     selected_outbound = booking_results.get("selected_flights", [{}])[0]
     outbound_segments = selected_outbound.get("flights", [])
@@ -432,7 +429,7 @@ async def book_flight(
         actual_iata_code = final_arrival_airport.get("id")
 
         if actual_iata_code:
-            airport_info = AIRPORTS_DB.get(actual_iata_code.upper())
+            airport_info = get_airport_index().airport(actual_iata_code)
             if airport_info:
                 air_lat = airport_info.get("lat")
                 air_lon = airport_info.get("lon")
@@ -490,13 +487,43 @@ async def book_flight(
     return schemas.FlightBookingResponse(booking_url=url)
 
 
-@router.post("/getaccommodations", response_model=list[schemas.accommodationsResponse])
-async def get_accommodations(
-    data: schemas.accommodationsRequest,
-    db: AsyncSession = Depends(get_db),
-    access_token: TokenPayload = Depends(access_token_header),
-):
-    log.info(f"Request data: {data}")
+async def session_currency(db: AsyncSession, session_id: int, user_id: str) -> str:
+    stmt = select(models.VacationSession).filter(
+        models.VacationSession.id == session_id,
+        models.VacationSession.user_id == user_id,
+    )
+    result = await db.execute(stmt)
+    session = result.scalars().first()
+    return session.currency if session and session.currency else "EUR"
+
+
+async def hotel_result_set(
+    data: schemas.accommodationsRequest, db: AsyncSession, user_id: str
+) -> tuple[str, str, list[dict]]:
+    """
+    Currency, fingerprint and normalized hotels for a search. Only the first
+    request for a fingerprint goes upstream; the set then serves every page,
+    sort and filter until it expires.
+    """
+    currency_code = await session_currency(db, data.session_id, user_id)
+    fingerprint = hotel_results.search_fingerprint(
+        {
+            "location": data.location,
+            "arrival_date": data.arrival_date,
+            "departure_date": data.departure_date,
+            "currency_code": currency_code,
+            "adults": data.adults,
+            "children": data.children,
+            "room_qty": data.room_qty,
+            "price_min": data.price_min,
+            "price_max": data.price_max,
+        }
+    )
+
+    hotels = await hotel_results.load_result_set(fingerprint)
+    if hotels is not None:
+        return currency_code, fingerprint, hotels
+
     log.info(f"Searching accommodations in {data.location}")
     try:
         destination = await accommodations_v2.get_destination_id(
@@ -514,15 +541,6 @@ async def get_accommodations(
         log.warning("No accommodations found for the given criteria.")
         raise HTTPException(status_code=404, detail="No accommodations found")
 
-    stmt = select(models.VacationSession).filter(
-        models.VacationSession.id == data.session_id,
-        models.VacationSession.user_id == access_token.sub,
-    )
-    result = await db.execute(stmt)
-    session = result.scalars().first()
-
-    currency_code = session.currency if session and session.currency else "EUR"
-
     try:
         results = await accommodations_v2.search_hotels(
             dest_id=destination.get("dest_id"),
@@ -544,188 +562,247 @@ async def get_accommodations(
         log.error(f"Error searching accommodations: {e}")
         raise HTTPException(status_code=500, detail="Error searching accommodations")
 
-    hotels_list = results.get("data", {}).get("hotels")
+    hotels = [
+        hotel_results.normalize_hotel(hotel)
+        for hotel in results.get("data", {}).get("hotels") or []
+    ]
+    await hotel_results.store_result_set(fingerprint, hotels)
+    return currency_code, fingerprint, hotels
 
-    sorted_hotels = sorted(
-        hotels_list,
-        key=lambda x: (
-            x.get("property", {})
-            .get("priceBreakdown", {})
-            .get("grossPrice", {})
-            .get("value", float("inf"))
-        ),
-    )[:12]
 
-    response = []
-    for hotel in sorted_hotels:
-        hotel_info = hotel.get("property", {})
-        price_info = round(
-            hotel_info.get("priceBreakdown", {})
-            .get("grossPrice", {})
-            .get("value", float("inf")),
-            2,
-        )
-        ccy = hotel_info.get("priceBreakdown", {}).get("grossPrice", {}).get("currency")
-        response.append(
-            schemas.accommodationsResponse(
-                hotel_id=str(hotel.get("hotel_id", "")),
-                hotel_name=hotel_info.get("name", ""),
-                latitude=hotel_info.get("latitude"),
-                longitude=hotel_info.get("longitude"),
-                price=price_info,
-                currency=ccy,
-                photo_urls=hotel_info.get("photoUrls", []),
-                accessibilityLabel=hotel.get("accessibilityLabel"),
-                reviewScoreWord=hotel_info.get("reviewScoreWord"),
-                reviewScore=hotel_info.get("reviewScore"),
-                reviewCount=hotel_info.get("reviewCount"),
-                propertyClass=hotel_info.get("propertyClass"),
-                checkin_time_range=hotel_info.get("checkin", {}).get("fromTime")
-                + " - "
-                + hotel_info.get("checkin", {}).get("untilTime")
-                if hotel_info.get("checkin")
-                else None,
-                checkout_time_range=hotel_info.get("checkout", {}).get("fromTime")
-                + " - "
-                + hotel_info.get("checkout", {}).get("untilTime")
-                if hotel_info.get("checkout")
-                else None,
-            )
-        )
+async def add_hotel_distances(
+    data: schemas.accommodationsRequest,
+    db: AsyncSession,
+    fingerprint: str,
+    hotels: list[dict],
+):
+    """
+    Adds distances from the destination centre to a cached set the first time
+    a view sorts or filters on them, and stores the set again.
+    """
+    try:
+        center = await catalog_city_center(db, *_split_place(data.location))
+    except Exception as e:
+        log.warning(f"Could not locate {data.location} for hotel distances: {e}")
+        return
+    if not center:
+        return
 
-    return response
+    hotel_results.add_distances(hotels, center)
+    await hotel_results.store_result_set(fingerprint, hotels)
 
 
-@router.post("/getHotelDetails", response_model=schemas.HotelDetailsResponse)
-async def get_hotel_details(
+def schedule_details_prefetch(
+    background_tasks: BackgroundTasks,
+    data: schemas.accommodationsRequest,
+    currency_code: str,
+    hotels: list[dict],
+):
+    if data.prefetch_details:
+        background_tasks.add_task(
+            hotel_details.prefetch_hotel_details,
+            [
+                hotel_details_params(data, hotel["hotel_id"], currency_code)
+                for hotel in hotels[: hotel_details.DETAILS_PREFETCH_TOP_N]
+            ],
+        )
+
+
+@router.post("/getaccommodations", response_model=list[schemas.accommodationsResponse])
+async def get_accommodations(
     data: schemas.accommodationsRequest,
+    background_tasks: BackgroundTasks,
     db: AsyncSession = Depends(get_db),
     access_token: TokenPayload = Depends(access_token_header),
 ):
-    stmt = select(models.VacationSession).filter(
-        models.VacationSession.id == data.session_id,
-        models.VacationSession.user_id == access_token.sub,
+    currency_code, _, hotels = await hotel_result_set(data, db, access_token.sub)
+
+    cheapest = hotel_results.apply_view(hotels, "price")[: hotel_results.PAGE_SIZE]
+    schedule_details_prefetch(background_tasks, data, currency_code, cheapest)
+    return cheapest
+
+
+@router.post("/accommodations/page", response_model=schemas.HotelPageResponse)
+async def get_accommodations_page(
+    data: schemas.HotelPageRequest,
+    background_tasks: BackgroundTasks,
+    db: AsyncSession = Depends(get_db),
+    access_token: TokenPayload = Depends(access_token_header),
+):
+    """
+    One page of a cached hotel search, sorted by price, review score or distance
+    from the destination's attractions and filtered in memory. `next_cursor`
+    is only valid with the same search, sort and filters.
+    """
+    currency_code, fingerprint, hotels = await hotel_result_set(
+        data, db, access_token.sub
     )
-    result = await db.execute(stmt)
-    session = result.scalars().first()
-    currency_code = session.currency if session and session.currency else "EUR"
+
+    view = {
+        "sort": data.sort,
+        "max_price": data.max_price,
+        "min_review_score": data.min_review_score,
+        "min_stars": data.min_stars,
+        "max_distance_km": data.max_distance_km,
+    }
+    if hotel_results.needs_distances(
+        data.sort, data.max_distance_km
+    ) and not hotel_results.has_distances(hotels):
+        await add_hotel_distances(data, db, fingerprint, hotels)
 
     try:
-        results = await accommodations_v2.get_hotel_details(
-            hotel_id=data.loc_id,
-            arrival_date=data.arrival_date,
-            departure_date=data.departure_date,
-            currency_code=currency_code,
-            adults=data.adults,
-            children=data.children,
-            room_qty=data.room_qty,
+        page = hotel_results.paginate(
+            hotel_results.apply_view(hotels, **view),
+            fingerprint,
+            view,
+            data.cursor,
+            data.limit,
         )
+    except hotel_results.InvalidCursor as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    schedule_details_prefetch(background_tasks, data, currency_code, page["items"])
+    return page
+
+
+def hotel_details_params(
+    data: schemas.accommodationsRequest, hotel_id: str, currency_code: str
+) -> dict:
+    """
+    `get_hotel_details` arguments in one fixed order, so the single, batch and
+    prefetch paths share Redis entries.
+    """
+    return {
+        "hotel_id": hotel_id,
+        "arrival_date": data.arrival_date,
+        "departure_date": data.departure_date,
+        "currency_code": currency_code,
+        "adults": data.adults,
+        "children": data.children,
+        "room_qty": data.room_qty,
+    }
+
+
+def build_hotel_details(
+    results: dict, data: schemas.accommodationsRequest
+) -> schemas.HotelDetailsResponse:
+    raw_data = results.get("data", {})
+
+    room_info = next(iter(raw_data.get("rooms", {}).values()), None) or {}
+    description = raw_data.get("hotel_text", {}).get("description") or raw_data.get(
+        "description", ""
+    )
+    if not description:
+        description = room_info.get("description", "")
+
+    facilities_data = raw_data.get("facilities_block", {})
+    facilities_list = (
+        facilities_data.get("facilities", [])
+        if isinstance(facilities_data, dict)
+        else []
+    )
+    amenities = [f.get("name") for f in facilities_list]
+
+    photo_urls = [
+        p.get("url_max1280")
+        for p in room_info.get("photos", [])
+        if p.get("url_max1280")
+    ]
+
+    highlights = []
+    for h in raw_data.get("property_highlight_strip", []):
+        icons = h.get("icon_list", [])
+        icon_val = icons[0].get("icon") if icons else None
+        highlights.append({"name": h.get("name"), "icon": icon_val})
+
+    blocks = raw_data.get("block", [])
+    policies = blocks[0].get("block_text", {}).get("policies", []) if blocks else []
+    cancel_p = next(
+        (p.get("content") for p in policies if p.get("class") == "POLICY_CANCELLATION"),
+        None,
+    )
+    prepay_p = next(
+        (p.get("content") for p in policies if p.get("class") == "POLICY_PREPAY"),
+        None,
+    )
 
-        if not results or results.get("status") is False:
-            raise HTTPException(status_code=404, detail="Hotel details not found")
+    rooms_data = raw_data.get("rooms", {})
+    bed_info = "Bed information not available"
+    if rooms_data and isinstance(rooms_data, dict):
+        first_room = list(rooms_data.values())[0]
+        bed_configs = first_room.get("bed_configurations", [])
+        if bed_configs:
+            bed_types = bed_configs[0].get("bed_types", [])
+            bed_info = ", ".join([bt.get("name_with_count") for bt in bed_types])
 
-        raw_data = results.get("data", {})
+    base_url = raw_data.get("url", "")
+    deep_link_url = base_url
 
-        room_info = next(iter(raw_data.get("rooms", {}).values()), None)
-        description = raw_data.get("hotel_text", {}).get("description") or raw_data.get(
-            "description", ""
-        )
-        if not description and room_info:
-            description = room_info.get("description", "")
-
-        facilities_data = raw_data.get("facilities_block", {})
-        facilities_list = (
-            facilities_data.get("facilities", [])
-            if isinstance(facilities_data, dict)
-            else []
-        )
-        amenities = [f.get("name") for f in facilities_list]
-
-        photo_urls = [
-            p.get("url_max1280")
-            for p in room_info.get("photos", [])
-            if p.get("url_max1280")
-        ]
-        log.info(f"Extracted {len(photo_urls)} photo URLs for hotel {data.loc_id}")
-
-        highlights = []
-        for h in raw_data.get("property_highlight_strip", []):
-            icons = h.get("icon_list", [])
-            icon_val = icons[0].get("icon") if icons else None
-            highlights.append({"name": h.get("name"), "icon": icon_val})
-
-        blocks = raw_data.get("block", [])
-        policies = blocks[0].get("block_text", {}).get("policies", []) if blocks else []
-        cancel_p = next(
-            (
-                p.get("content")
-                for p in policies
-                if p.get("class") == "POLICY_CANCELLATION"
-            ),
-            None,
-        )
-        prepay_p = next(
-            (p.get("content") for p in policies if p.get("class") == "POLICY_PREPAY"),
-            None,
-        )
+    if base_url:
+        url_parts = list(urlparse(base_url))
 
-        rooms_data = raw_data.get("rooms", {})
-        bed_info = "Bed information not available"
-        if rooms_data and isinstance(rooms_data, dict):
-            first_room = list(rooms_data.values())[0]
-            bed_configs = first_room.get("bed_configurations", [])
-            if bed_configs:
-                bed_types = bed_configs[0].get("bed_types", [])
-                bed_info = ", ".join([bt.get("name_with_count") for bt in bed_types])
+        query = parse_qs(url_parts[4])
 
-        base_url = raw_data.get("url", "")
-        deep_link_url = base_url
+        query["checkin"] = [data.arrival_date]
+        query["checkout"] = [data.departure_date]
+        query["group_adults"] = [data.adults]
+        query["req_adults"] = [data.adults]
+        query["no_rooms"] = [data.room_qty]
 
-        if base_url:
-            url_parts = list(urlparse(base_url))
+        if data.children:
+            child_list = [age.strip() for age in data.children.split(",")]
 
-            query = parse_qs(url_parts[4])
+            query["group_children"] = [len(child_list)]
+            query["req_children"] = [len(child_list)]
 
-            query["checkin"] = [data.arrival_date]
-            query["checkout"] = [data.departure_date]
-            query["group_adults"] = [data.adults]
-            query["req_adults"] = [data.adults]
-            query["no_rooms"] = [data.room_qty]
+            query["age"] = child_list
+            query["req_age"] = child_list
+        else:
+            query["group_children"] = [0]
+            query["req_children"] = [0]
+
+        url_parts[4] = urlencode(query, doseq=True)
+        deep_link_url = urlunparse(url_parts)
+
+    return schemas.HotelDetailsResponse(
+        hotel_id=str(raw_data.get("hotel_id")),
+        url=deep_link_url,
+        description=description,
+        photos=photo_urls,
+        amenities=amenities,
+        sustainability_info=raw_data.get("sustainability"),
+        property_highlights=highlights,
+        languages_spoken=raw_data.get("spoken_languages", []),
+        price_breakdown_details=raw_data.get("product_price_breakdown"),
+        cancellation_policy=cancel_p,
+        prepayment_policy=prepay_p,
+        bed_details=bed_info,
+        address=raw_data.get("address", "Exact address not available")
+        + (f", {raw_data.get('district', '')}" if raw_data.get("district") else ""),
+    )
 
-            if data.children:
-                child_list = [age.strip() for age in data.children.split(",")]
 
-                query["group_children"] = [len(child_list)]
-                query["req_children"] = [len(child_list)]
+@router.post("/getHotelDetails", response_model=schemas.HotelDetailsResponse)
+async def get_hotel_details(
+    data: schemas.accommodationsRequest,
+    db: AsyncSession = Depends(get_db),
+    access_token: TokenPayload = Depends(access_token_header),
+):
+    currency_code = await session_currency(db, data.session_id, access_token.sub)
 
-                query["age"] = child_list
-                query["req_age"] = child_list
-            else:
-                query["group_children"] = [0]
-                query["req_children"] = [0]
-
-            url_parts[4] = urlencode(query, doseq=True)
-            deep_link_url = urlunparse(url_parts)
-
-        response = schemas.HotelDetailsResponse(
-            hotel_id=str(raw_data.get("hotel_id")),
-            url=deep_link_url,
-            description=description,
-            photos=photo_urls,
-            amenities=amenities,
-            sustainability_info=raw_data.get("sustainability"),
-            property_highlights=highlights,
-            languages_spoken=raw_data.get("spoken_languages", []),
-            price_breakdown_details=raw_data.get("product_price_breakdown"),
-            cancellation_policy=cancel_p,
-            prepayment_policy=prepay_p,
-            bed_details=bed_info,
-            address=raw_data.get("address", "Exact address not available")
-            + (f", {raw_data.get('district', '')}" if raw_data.get("district") else ""),
+    results = None
+    try:
+        results = await accommodations_v2.get_hotel_details(
+            **hotel_details_params(data, data.loc_id, currency_code)
         )
 
-        return response
+        if not results or results.get("status") is False:
+            raise HTTPException(status_code=404, detail="Hotel details not found")
+
+        return build_hotel_details(results, data)
 
+    except HTTPException:
+        raise
     except Exception as e:
         log.error(f"Error constructing hotel details: {e}")
         log.info(f"Raw response data: {results}")
@@ -734,6 +811,34 @@ async def get_hotel_details(
         )
 
 
+@router.post("/getHotelDetailsBatch", response_model=list[schemas.HotelDetailsResponse])
+async def get_hotel_details_batch(
+    data: schemas.HotelDetailsBatchRequest,
+    db: AsyncSession = Depends(get_db),
+    access_token: TokenPayload = Depends(access_token_header),
+):
+    """
+    Details for several hotels in one call, fetched with bounded concurrency.
+    Hotels whose details are unavailable are left out of the response.
+    """
+    currency_code = await session_currency(db, data.session_id, access_token.sub)
+    hotel_ids = list(dict.fromkeys(data.hotel_ids))
+
+    all_results = await hotel_details.fetch_hotel_details_many(
+        [hotel_details_params(data, hotel_id, currency_code) for hotel_id in hotel_ids]
+    )
+
+    response = []
+    for hotel_id, results in zip(hotel_ids, all_results):
+        if not results or results.get("status") is False:
+            continue
+        try:
+            response.append(build_hotel_details(results, data))
+        except Exception as e:
+            log.error(f"Error constructing hotel details for {hotel_id}: {e}")
+    return response
+
+
 @router.post("/bookaccommodation", response_model=schemas.accommodationBookingResponse)
 async def book_accommodation(
     data: schemas.accommodationBookingRequest,
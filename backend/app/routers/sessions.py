@@ -12,12 +12,10 @@ from app.core.auth import access_token_header
 from app.models.vacation_session import SessionStage
 from app.models.companion import TravelCompanion
 from sqlalchemy.orm import selectinload
-from fastapi import BackgroundTasks
-from app.services.agents.itinerary_graph import (
-    generate_graph as generate_itinerary_graph,
-)
+from app.services.agents.itinerary_graph import load_itinerary_view
 
-from app.services.email.itinerary_email import send_vacation_blueprint_email
+from app.services.delivery.queue import enqueue_blueprint_email
+from app.services.email.pdf_cache import vacation_document_payload
 
 log = get_logger(__name__)
 
@@ -147,13 +145,11 @@ async def compile_session(
     mobility_config = {}
 
     try:
-        graph = generate_itinerary_graph(checkpointer)
-        config = {"configurable": {"thread_id": f"itinerary_{session_id}"}}
-        current_state = await graph.aget_state(config)
+        current_state = await load_itinerary_view(session_id, db, checkpointer)
 
-        if current_state and current_state.values:
-            raw_schedule = current_state.values.get("schedule", [])
-            mobility_config = current_state.values.get("mobility_config", {}).get(
+        if current_state:
+            raw_schedule = current_state.get("schedule") or []
+            mobility_config = (current_state.get("mobility_config") or {}).get(
                 "strategies", {}
             )
     except Exception as graph_err:
@@ -335,56 +331,9 @@ async def compile_session(
         )
 
 
-async def process_email_and_notify(user_id: str, email_to: str, vacation_payload: dict):
-    """
-    Runs out-of-band in background workers: Generates and dispatches the travel PDF,
-    then commits a real-time system notification indicating status.
-    """
-    destination = vacation_payload.get("destination", "your destination")
-    try:
-        success = await send_vacation_blueprint_email(email_to, vacation_payload)
-
-        async for db in get_db():
-            if success:
-                db.add(
-                    models.Notification(
-                        user_id=user_id,
-                        category="EMAIL_SUCCESS",
-                        message=f"🎉 Pack your bags! Your detailed TuRAG Blueprint for {destination} is waiting in your inbox.",
-                    )
-                )
-            else:
-                db.add(
-                    models.Notification(
-                        user_id=user_id,
-                        category="EMAIL_ERROR",
-                        message=f"✈️ Slight turbulence: We couldn't deliver your {destination} itinerary email. You can still access it anytime from your dashboard.",
-                    )
-                )
-            await db.commit()
-            break
-
-    except Exception as e:
-        log.error(
-            f"Background serialization or mailing runner failure: {str(e)}",
-            exc_info=True,
-        )
-        async for db in get_db():
-            db.add(
-                models.Notification(
-                    user_id=user_id,
-                    category="EMAIL_ERROR",
-                    message=f"⚠️ Internal network variance occurred while finalizing your trip to {destination}. Your data is safely stored in your travel passport log!",
-                )
-            )
-            await db.commit()
-            break
-
-
 @router.post("/finalize/{session_id}")
 async def finalize_and_email_session(
     session_id: int,
-    background_tasks: BackgroundTasks,
     db: AsyncSession = Depends(get_db),
     token: TokenPayload = Depends(access_token_header),
 ):
@@ -422,25 +371,11 @@ async def finalize_and_email_session(
     if session:
         session.is_active = False
 
-    vacation_payload = {
-        "id": vacation.id,
-        "destination": vacation.destination,
-        "origin": vacation.origin,
-        "from_date": vacation.from_date.isoformat() if vacation.from_date else None,
-        "to_date": vacation.to_date.isoformat() if vacation.to_date else None,
-        "adults": vacation.adults,
-        "children": vacation.children,
-        "flight_price": vacation.flight_price,
-        "flight_ccy": vacation.flight_ccy,
-        "airport_name": vacation.airport_name,
-        "flights_url": vacation.flights_url,
-        "accommodation_price": vacation.accommodation_price,
-        "accommodation_ccy": vacation.accommodation_ccy,
-        "accommodation_name": vacation.accommodation_name,
-        "accommodation_address": vacation.accommodation_address,
-        "accommodation_url": vacation.accommodation_url,
-        "itinerary_data": vacation.itinerary_data,
-    }
+    vacation_payload = vacation_document_payload(vacation)
+
+    enqueue_blueprint_email(
+        db, user_id=token.sub, email_to=user.email, vacation_payload=vacation_payload
+    )
 
     try:
         await db.commit()
@@ -451,13 +386,6 @@ async def finalize_and_email_session(
             detail=f"Database state transaction failure: {str(commit_err)}",
         )
 
-    background_tasks.add_task(
-        process_email_and_notify,
-        user_id=token.sub,
-        email_to=user.email,
-        vacation_payload=vacation_payload,
-    )
-
     return {
         "status": "success",
         "message": "Itinerary locked successfully. Electronic document delivery manifest initialized.",
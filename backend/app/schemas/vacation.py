@@ -1,7 +1,7 @@
 """Schemas for vacation-related data."""
 
-from typing import Any, Optional
-from pydantic import BaseModel
+from typing import Any, Literal, Optional
+from pydantic import BaseModel, Field
 
 
 class SessionDataUpdate(BaseModel):
@@ -69,6 +69,13 @@ class FlightsRequest(BaseModel):
     price: Optional[float] = None
     destination_arrival: Optional[str] = ""
     destination_departure: Optional[str] = ""
+    prefetch_inbound: Optional[bool] = False
+
+
+class FlightPriceGridRequest(FlightsRequest):
+    """Schema for a flexible-date price grid around the requested dates."""
+
+    days: int = Field(3, ge=0, le=3)
 
 
 class accommodationsRequest(BaseModel):
@@ -85,6 +92,13 @@ class accommodationsRequest(BaseModel):
     room_qty: Optional[int]
     price_min: Optional[int]
     price_max: Optional[int]
+    prefetch_details: Optional[bool] = False
+
+
+class HotelDetailsBatchRequest(accommodationsRequest):
+    """Schema for fetching details of several hotels in one call."""
+
+    hotel_ids: list[str] = Field(..., min_length=1, max_length=12)
 
 
 class accommodationsResponse(BaseModel):
@@ -104,6 +118,25 @@ class accommodationsResponse(BaseModel):
     propertyClass: Optional[int]
     checkin_time_range: Optional[str]
     checkout_time_range: Optional[str]
+    distance_km: Optional[float] = None
+
+
+class HotelPageRequest(accommodationsRequest):
+    """Schema for paging, sorting and filtering a cached hotel search."""
+
+    sort: Literal["price", "review", "distance"] = "price"
+    max_price: Optional[float] = None
+    min_review_score: Optional[float] = None
+    min_stars: Optional[int] = None
+    max_distance_km: Optional[float] = None
+    cursor: Optional[str] = None
+    limit: int = Field(12, ge=1, le=50)
+
+
+class HotelPageResponse(BaseModel):
+    total: int
+    next_cursor: Optional[str]
+    items: list[accommodationsResponse]
 
 
 class HotelDetailsResponse(BaseModel):
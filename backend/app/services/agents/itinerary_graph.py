@@ -9,6 +9,12 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from app.services.agents.memory import ItineraryState
 from app.services.agents.nodes import *
 from app.services.agents.utils import get_initial_itinerary_state
+from app.services.agents.read_model import (
+    UI_KEYS,
+    get_itinerary_read_model,
+    read_model_to_state,
+    sync_itinerary_read_model,
+)
 from app.core.logger import get_logger
 
 log = get_logger(__name__)
@@ -104,9 +110,37 @@ async def run_itinerary_graph(
 
     final_state = await graph.ainvoke(input_data, config=config)
 
+    await sync_itinerary_read_model(db, session_id, final_state)
+
     return final_state
 
 
+async def load_itinerary_view(
+    session_id: int,
+    db: AsyncSession,
+    checkpointer: AsyncPostgresSaver,
+) -> Optional[dict]:
+    """
+    Returns the UI-facing itinerary state from the read model.
+    Falls back to the latest checkpoint (and backfills the read model) for sessions
+    that predate it. Returns None when the itinerary has not been started yet.
+    """
+    row = await get_itinerary_read_model(db, session_id)
+    if row is not None:
+        return read_model_to_state(row)
+
+    graph = generate_graph(checkpointer)
+    config = {"configurable": {"thread_id": f"itinerary_{session_id}"}}
+    current_state = await graph.aget_state(config)
+
+    if not current_state.values:
+        return None
+
+    await sync_itinerary_read_model(db, session_id, current_state.values)
+
+    return {k: current_state.values.get(k) for k in UI_KEYS}
+
+
 if __name__ == "__main__":
     print(
         "This module is not meant to be run directly. It provides the execution graph for the itinerary process.\n\n"
@@ -12,7 +12,8 @@ from app.services.agents.responses import *
 from app.core.config import settings
 
 from datetime import datetime
-from sqlalchemy import update, select
+from sqlalchemy import insert, update, select, func
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from app.core.database import SessionLocal
 from app.models.vacation_session import VacationSession
 from app.services.agents.utils import is_llm_null, resolve_location, get_resumed_state
@@ -22,7 +23,13 @@ from app.services.agents.tools import (
 )
 from app.core.logger import get_logger
 from app.models.global_attraction import GlobalAttraction
+from app.services.search.attraction_metrics import record_search_hits
 from app.services.search.attractions import *
+from app.services.search.nearby_attractions import (
+    catalog_city_center,
+    find_attractions_within_radius,
+    find_nearest_attractions,
+)
 from timezonefinder import TimezoneFinder
 from langchain_tavily import TavilySearch
 
@@ -245,6 +252,15 @@ async def responder(state: DiscoveryState) -> dict:
 search_tool = TavilySearch(max_results=5, tavily_api_key=settings.TAVILY_API_KEY)
 
 
+CITY_RADIUS_KM = 15
+
+
+def _hotel_coords(state: ItineraryState) -> tuple[float, float] | None:
+    """The booked hotel's coordinates, or None while no hotel is chosen."""
+    lat, lon = (state.get("trip_details") or {}).get("hotel_coords") or (0.0, 0.0)
+    return (lat, lon) if lat or lon else None
+
+
 async def picking_attractions(state: ItineraryState) -> dict:
     action = state.get("action")
 
@@ -291,36 +307,71 @@ async def picking_attractions(state: ItineraryState) -> dict:
     if action == "initial_fetch":
         log.info(f"Starting Initial Fetch for {city}, {country}...")
 
+        keys = GlobalAttraction.location_keys(city, country)
+
         async with SessionLocal() as db:
             stmt = (
                 select(GlobalAttraction)
                 .where(
-                    GlobalAttraction.city.ilike(f"%{city}%")
-                    & GlobalAttraction.country.ilike(f"%{country}%")
+                    GlobalAttraction.country_key == keys["country_key"],
+                    GlobalAttraction.city_key == keys["city_key"],
                 )
-                .order_by(GlobalAttraction.dynamic_relevance_rank().desc())
+                .order_by(GlobalAttraction.relevance_score.desc())
                 .limit(20)
             )
             result = await db.execute(stmt)
             existing_places = result.scalars().all()
 
+            if len(existing_places) < 10 and keys["city_key"]:
+                stmt = (
+                    select(GlobalAttraction)
+                    .where(
+                        GlobalAttraction.country_key == keys["country_key"],
+                        GlobalAttraction.city_key.contains(
+                            keys["city_key"], autoescape=True
+                        )
+                        | GlobalAttraction.city_key.op("%")(keys["city_key"]),
+                    )
+                    .order_by(GlobalAttraction.relevance_score.desc())
+                    .limit(20)
+                )
+                result = await db.execute(stmt)
+                existing_places = result.scalars().all()
+
+            if len(existing_places) < 10:
+                hotel = _hotel_coords(state)
+                if hotel:
+                    coords = {"lat": hotel[0], "lon": hotel[1], "name": city}
+                    nearby_places = [
+                        place
+                        for place, _ in await find_nearest_attractions(
+                            db, *hotel, k=20, max_radius_km=CITY_RADIUS_KM
+                        )
+                    ]
+                else:
+                    coords = await catalog_city_center(db, city, country)
+                    if not coords:
+                        return updates
+
+                    nearby_places = await find_attractions_within_radius(
+                        db, coords["lat"], coords["lon"], CITY_RADIUS_KM
+                    )
+                if len(nearby_places) > len(existing_places):
+                    existing_places = nearby_places
+
             if len(existing_places) >= 10:
                 log.info(
                     f"CACHE HIT: Showing {len(existing_places)} existing places from DB."
                 )
 
                 hit_ids = [p.id for p in existing_places]
-                await GlobalAttraction.track_search_metrics(db, hit_ids)
+                await record_search_hits(db, hit_ids)
 
                 updates["resolved_attractions"] = Overwrite(
                     [format_cached_poi(p) for p in existing_places]
                 )
                 return updates
 
-            coords = await get_city_coordinates(city, country)
-            if not coords:
-                return updates
-
             structured_llm = llm.with_structured_output(AttractionList)
             prompt = attraction_picker_prompt.format(
                 persona=state.get("persona", "Traveler"),
@@ -361,7 +412,7 @@ async def picking_attractions(state: ItineraryState) -> dict:
                 await asyncio.sleep(0.5)
 
             if loop_hit_ids:
-                await GlobalAttraction.track_search_metrics(db, loop_hit_ids)
+                await record_search_hits(db, loop_hit_ids)
 
             updates.update(
                 {
@@ -384,7 +435,8 @@ async def picking_attractions(state: ItineraryState) -> dict:
                 else last_message.get("content", str(last_message))
             )
 
-        coords = await get_city_coordinates(city, country)
+        async with SessionLocal() as db:
+            coords = await catalog_city_center(db, city, country)
         if not coords:
             return updates
 
@@ -432,7 +484,7 @@ async def picking_attractions(state: ItineraryState) -> dict:
                 await asyncio.sleep(0.5)
 
             if custom_hit_ids:
-                await GlobalAttraction.track_search_metrics(db, custom_hit_ids)
+                await record_search_hits(db, custom_hit_ids)
 
         updates.update(
             {
@@ -508,59 +560,80 @@ async def enrich_single_attraction_node(poi_data: dict) -> dict:
     return {"resolved_attractions": [enriched_poi]}
 
 
+def _attraction_row(poi_data: dict) -> dict:
+    return {
+        "external_place_id": poi_data.get("external_place_id"),
+        "wikidata_id": poi_data.get("wikidata_id"),
+        "official_name": poi_data.get("official_name"),
+        "city": poi_data.get("city"),
+        "state_province": poi_data.get("state_province"),
+        "country": poi_data.get("country"),
+        "formatted_address": poi_data.get("formatted_address"),
+        "timezone": poi_data.get("timezone"),
+        "latitude": poi_data.get("latitude"),
+        "longitude": poi_data.get("longitude"),
+        "category": poi_data.get("category"),
+        "tags": poi_data.get("tags"),
+        "description": poi_data.get("description"),
+        "image_url": poi_data.get("image_url"),
+        "website_url": poi_data.get("website_url"),
+        "rating": poi_data.get("rating"),
+        "price_tier": poi_data.get("price_tier"),
+        "recommended_duration_mins": poi_data.get("recommended_duration_mins", 120),
+        "tod_preference": poi_data.get("tod_preference"),
+        "opening_hours": poi_data.get("opening_hours"),
+        "needs_reservation": poi_data.get("needs_reservation"),
+        "search_count": 1,
+        "must_count": 0,
+        "want_count": 0,
+        "optional_count": 0,
+        **GlobalAttraction.location_keys(poi_data.get("city"), poi_data.get("country")),
+        "h3_cell": GlobalAttraction.spatial_cell(
+            poi_data.get("latitude"), poi_data.get("longitude")
+        ),
+    }
+
+
 async def save_attractions_to_db(state: ItineraryState) -> dict:
     resolved = state.get("resolved_attractions", [])
     if not resolved:
         return {"action": "move_to_next_stage"}
 
-    updated_resolved_list = []
+    # Last occurrence wins when the fan-out resolved the same place twice.
+    rows_by_xid = {
+        poi["external_place_id"]: _attraction_row(poi)
+        for poi in resolved
+        if poi.get("external_place_id")
+    }
 
-    async with SessionLocal() as db:
-        for poi_data in resolved:
-            stmt = select(GlobalAttraction).where(
-                GlobalAttraction.external_place_id == poi_data.get("external_place_id")
-            )
-            result = await db.execute(stmt)
-            existing_place = result.scalars().first()
-
-            if not existing_place:
-                new_attraction = GlobalAttraction(
-                    external_place_id=poi_data.get("external_place_id"),
-                    wikidata_id=poi_data.get("wikidata_id"),
-                    official_name=poi_data.get("official_name"),
-                    city=poi_data.get("city"),
-                    state_province=poi_data.get("state_province"),
-                    country=poi_data.get("country"),
-                    formatted_address=poi_data.get("formatted_address"),
-                    timezone=poi_data.get("timezone"),
-                    latitude=poi_data.get("latitude"),
-                    longitude=poi_data.get("longitude"),
-                    category=poi_data.get("category"),
-                    tags=poi_data.get("tags"),
-                    description=poi_data.get("description"),
-                    image_url=poi_data.get("image_url"),
-                    website_url=poi_data.get("website_url"),
-                    rating=poi_data.get("rating"),
-                    price_tier=poi_data.get("price_tier"),
-                    recommended_duration_mins=poi_data.get(
-                        "recommended_duration_mins", 120
-                    ),
-                    tod_preference=poi_data.get("tod_preference"),
-                    opening_hours=poi_data.get("opening_hours"),
-                    needs_reservation=poi_data.get("needs_reservation"),
-                )
-                db.add(new_attraction)
-                await db.flush()
+    # Places without an external id can't be matched, so each one is a new row.
+    unkeyed = [poi for poi in resolved if not poi.get("external_place_id")]
 
-                poi_data["id"] = new_attraction.id
-            else:
-                poi_data["id"] = existing_place.id
+    async with SessionLocal() as db:
+        if rows_by_xid:
+            stmt = pg_insert(GlobalAttraction).values(list(rows_by_xid.values()))
+            stmt = stmt.on_conflict_do_update(
+                index_elements=[GlobalAttraction.external_place_id],
+                set_={"updated_at": func.now()},
+            ).returning(GlobalAttraction.id, GlobalAttraction.external_place_id)
 
-            updated_resolved_list.append(poi_data)
+            result = await db.execute(stmt)
+            ids_by_xid = {xid: attraction_id for attraction_id, xid in result.all()}
+            for poi_data in resolved:
+                if poi_data.get("external_place_id"):
+                    poi_data["id"] = ids_by_xid[poi_data["external_place_id"]]
+
+        if unkeyed:
+            stmt = insert(GlobalAttraction).returning(
+                GlobalAttraction.id, sort_by_parameter_order=True
+            )
+            result = await db.execute(stmt, [_attraction_row(poi) for poi in unkeyed])
+            for poi_data, attraction_id in zip(unkeyed, result.scalars().all()):
+                poi_data["id"] = attraction_id
 
         await db.commit()
 
-    return {"resolved_attractions": Overwrite(updated_resolved_list), "action": "idle"}
+    return {"resolved_attractions": Overwrite(resolved), "action": "idle"}
 
 
 async def picking_transit(state: ItineraryState) -> dict:
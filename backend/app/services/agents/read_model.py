@@ -0,0 +1,136 @@
+from typing import Any, Optional
+
+from fastapi.encoders import jsonable_encoder
+from sqlalchemy import delete, select, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql import func
+
+from app.core.logger import get_logger
+from app.models.itinerary_read_model import ItineraryReadModel
+
+log = get_logger(__name__)
+
+UI_KEYS = (
+    "stage",
+    "pois",
+    "resolved_attractions",
+    "search_location",
+    "mobility_config",
+    "pace",
+    "mobility_recommendation",
+    "pace_recommendation",
+    "schedule",
+    "excluded_pois",
+    "trip_details",
+)
+
+
+def summarize_buckets(pois: Optional[list]) -> dict:
+    """Counts the POIs the user placed in each priority bucket."""
+    counts = {"must": 0, "want": 0, "optional": 0}
+    for poi in pois or []:
+        bucket = str(poi.get("bucket", "want")).lower()
+        counts[bucket] = counts.get(bucket, 0) + 1
+    return counts
+
+
+def summarize_schedule(schedule: Optional[list]) -> Optional[dict]:
+    """Reduces a generated schedule to the headline numbers shown in listings."""
+    if not schedule:
+        return None
+
+    attractions = 0
+    transit_mins = 0
+    for day in schedule:
+        for event in day.get("events", []):
+            if event.get("type") == "attraction" and event.get("bucket") != "logistics":
+                attractions += 1
+            transit_mins += event.get("transit_mins") or 0
+
+    return {
+        "days": len(schedule),
+        "attractions": attractions,
+        "transit_mins": transit_mins,
+    }
+
+
+def build_read_model_values(state: dict) -> dict:
+    """
+    Projects the UI-facing subset of an itinerary state into read model columns.
+    Only keys present in the state are emitted so partial updates stay partial.
+    """
+    values = {k: jsonable_encoder(state[k]) for k in UI_KEYS if k in state}
+
+    if "pois" in values:
+        values["bucket_counts"] = summarize_buckets(values["pois"])
+    if "schedule" in values:
+        values["schedule_summary"] = summarize_schedule(values["schedule"])
+    if values.get("stage") is None:
+        values.pop("stage", None)
+
+    return values
+
+
+def read_model_to_state(row: ItineraryReadModel) -> dict:
+    """Returns the read model row in the same shape as the graph state UI keys."""
+    return {k: getattr(row, k) for k in UI_KEYS}
+
+
+async def get_itinerary_read_model(
+    db: AsyncSession, session_id: int
+) -> Optional[ItineraryReadModel]:
+    result = await db.execute(
+        select(ItineraryReadModel).where(ItineraryReadModel.session_id == session_id)
+    )
+    return result.scalar_one_or_none()
+
+
+async def sync_itinerary_read_model(
+    db: AsyncSession, session_id: int, state: dict[str, Any], partial: bool = False
+):
+    """
+    Writes the latest itinerary state into the read model.
+    Full syncs upsert the row after a graph run; partial syncs only patch an existing
+    row so that sessions without a snapshot keep falling back to the checkpoint.
+    """
+    values = build_read_model_values(state)
+    if not values:
+        return
+
+    try:
+        if partial:
+            stmt = (
+                update(ItineraryReadModel)
+                .where(ItineraryReadModel.session_id == session_id)
+                .values(**values)
+            )
+        else:
+            stmt = insert(ItineraryReadModel).values(session_id=session_id, **values)
+            stmt = stmt.on_conflict_do_update(
+                index_elements=[ItineraryReadModel.session_id],
+                set_={**values, "updated_at": func.now()},
+            )
+
+        await db.execute(stmt)
+        await db.commit()
+    except Exception as e:
+        log.error(f"Failed to sync itinerary read model for session {session_id}: {e}")
+        await db.rollback()
+        await invalidate_itinerary_read_model(db, session_id)
+
+
+async def invalidate_itinerary_read_model(db: AsyncSession, session_id: int):
+    """Drops the snapshot so the next read rebuilds it from the checkpoint."""
+    try:
+        await db.execute(
+            delete(ItineraryReadModel).where(
+                ItineraryReadModel.session_id == session_id
+            )
+        )
+        await db.commit()
+    except Exception as e:
+        log.error(
+            f"Failed to invalidate itinerary read model for session {session_id}: {e}"
+        )
+        await db.rollback()
@@ -4,8 +4,9 @@ from sqlalchemy.orm import selectinload
 from app.models.vacation_session import VacationSession
 from app.models.vacation import Vacation
 from app.services.agents.memory import DiscoveryState, ItineraryState
+from app.core.http import get_http_client
+from app.services.search.place_cache import place_cache, place_key
 from app.utils.generic import calculate_age
-import httpx
 
 from app.services.agents.mobility_strategies import MobilityConfig
 
@@ -125,45 +126,67 @@ async def get_initial_state(db: AsyncSession, session_id: int) -> DiscoveryState
     }
 
 
-async def resolve_location(query: str) -> str:
-    """
-    Calls Nominatim (OSM) to turn messy user input into a
-    standardized 'City, CC' string.
-    """
-    url = f"https://nominatim.openstreetmap.org/search?format=json&q={query}&addressdetails=1&limit=1"
+NOMINATIM_URL = "https://nominatim.openstreetmap.org/search"
+
+
+async def _nominatim_resolve(query: str) -> str | None:
+    params = {"format": "json", "q": query, "addressdetails": 1, "limit": 1}
     headers = {
         "User-Agent": "TuRAG/1.0 (contact.turag@gmail.com)",
         "Accept-Language": "en",
     }
 
     try:
-        async with httpx.AsyncClient() as client:
-            response = await client.get(url, headers=headers, timeout=5.0)
-            if response.status_code == 200:
-                data = response.json()
-                if data:
-                    result = data[0]
-                    address = result.get("address", {})
-
-                    city = (
-                        address.get("city")
-                        or address.get("town")
-                        or address.get("village")
-                        or address.get("municipality")
-                        or address.get("state")
-                    )
-
-                    country_code = address.get("country_code")
-
-                    if city and country_code:
-                        print(f"Resolved '{query}' to '{city}, {country_code.upper()}'")
-                        return f"{city}, {country_code.upper()}"
-
-                    return result.get("display_name", query)
+        response = await get_http_client().get(
+            NOMINATIM_URL, params=params, headers=headers, timeout=5.0
+        )
+        if response.status_code == 200:
+            data = response.json()
+            if data:
+                result = data[0]
+                address = result.get("address", {})
+
+                city = (
+                    address.get("city")
+                    or address.get("town")
+                    or address.get("village")
+                    or address.get("municipality")
+                    or address.get("state")
+                )
+
+                country_code = address.get("country_code")
+
+                if city and country_code:
+                    print(f"Resolved '{query}' to '{city}, {country_code.upper()}'")
+                    return f"{city}, {country_code.upper()}"
+
+                return result.get("display_name", query)
     except Exception as e:
         print(f"Location resolution error: {e}")
 
-    return query.upper()
+    return None
+
+
+async def resolve_location(query: str) -> str:
+    """
+    Turns messy user input into a standardized 'City, CC' string. Known places
+    come from the place cache; the rest are resolved by Nominatim (OSM) and
+    remembered. Failed lookups are not cached.
+    """
+    key = place_key(query)
+    cached = await place_cache.get(key)
+    if cached and cached.get("label"):
+        return cached["label"]
+
+    label = await _nominatim_resolve(query)
+    if label is None:
+        return query.upper()
+
+    await place_cache.put(key, "nominatim", label=label)
+    label_key = place_key(label)
+    if label_key != key:
+        await place_cache.put(label_key, "nominatim", label=label)
+    return label
 
 
 def is_llm_null(value) -> bool:
@@ -0,0 +1 @@
+"""Package for the durable PDF rendering and email delivery pipeline."""
@@ -0,0 +1,143 @@
+import random
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import or_, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.delivery_job import DeliveryJob, DeliveryStatus
+
+BLUEPRINT_EMAIL = "vacation_blueprint_email"
+PDF_RENDER = "vacation_pdf_render"
+
+RETRY_BASE_SECONDS = 30
+RETRY_MAX_SECONDS = 60 * 60
+STALE_LOCK_MINUTES = 15
+STALE_EXHAUSTED_ERROR = "Worker stopped while processing the job; no attempts left"
+
+
+def enqueue_blueprint_email(
+    db: AsyncSession, user_id: str, email_to: str, vacation_payload: dict
+) -> DeliveryJob:
+    """
+    Adds the job to the caller's session so it is committed atomically with
+    the vacation being finalized.
+    """
+    job = DeliveryJob(
+        kind=BLUEPRINT_EMAIL,
+        user_id=user_id,
+        payload={"email_to": email_to, "vacation": vacation_payload},
+    )
+    db.add(job)
+    return job
+
+
+async def enqueue_pdf_render(
+    db: AsyncSession, user_id: str, vacation_payload: dict, content_hash: str
+) -> DeliveryJob:
+    """
+    Queues a render of the vacation PDF for the delivery worker, unless one for
+    the same payload is already pending or running. The caller commits.
+    """
+    result = await db.execute(
+        select(DeliveryJob).where(
+            DeliveryJob.kind == PDF_RENDER,
+            DeliveryJob.status.in_([DeliveryStatus.PENDING, DeliveryStatus.RUNNING]),
+            DeliveryJob.payload["content_hash"].as_string() == content_hash,
+        )
+    )
+    job = result.scalars().first()
+    if job is None:
+        job = DeliveryJob(
+            kind=PDF_RENDER,
+            user_id=user_id,
+            payload={"content_hash": content_hash, "vacation": vacation_payload},
+        )
+        db.add(job)
+    return job
+
+
+def retry_delay(attempts: int) -> timedelta:
+    """Exponential backoff with jitter: 30s, 60s, 120s, ... capped at an hour."""
+    delay = min(RETRY_MAX_SECONDS, RETRY_BASE_SECONDS * 2 ** max(0, attempts - 1))
+    return timedelta(seconds=delay * random.uniform(0.8, 1.2))
+
+
+async def claim_jobs(db: AsyncSession, limit: int) -> list[DeliveryJob]:
+    """
+    Locks up to `limit` due jobs with SKIP LOCKED so several workers can drain
+    the queue concurrently. Jobs left running by a crashed worker are picked up
+    again once their lock goes stale, unless that crash used up their last
+    attempt; those are marked failed so a job that kills the worker can't loop.
+    """
+    now = datetime.now(timezone.utc)
+    stale = (DeliveryJob.status == DeliveryStatus.RUNNING) & (
+        DeliveryJob.locked_at < now - timedelta(minutes=STALE_LOCK_MINUTES)
+    )
+
+    await db.execute(
+        update(DeliveryJob)
+        .where(stale, DeliveryJob.attempts >= DeliveryJob.max_attempts)
+        .values(
+            status=DeliveryStatus.FAILED,
+            locked_at=None,
+            last_error=STALE_EXHAUSTED_ERROR,
+        )
+        .execution_options(synchronize_session=False)
+    )
+
+    due = (
+        select(DeliveryJob.id)
+        .where(
+            or_(
+                (DeliveryJob.status == DeliveryStatus.PENDING)
+                & (DeliveryJob.run_after <= now),
+                stale & (DeliveryJob.attempts < DeliveryJob.max_attempts),
+            )
+        )
+        .order_by(DeliveryJob.run_after)
+        .limit(limit)
+        .with_for_update(skip_locked=True)
+    )
+
+    stmt = (
+        update(DeliveryJob)
+        .where(DeliveryJob.id.in_(due.scalar_subquery()))
+        .values(
+            status=DeliveryStatus.RUNNING,
+            locked_at=now,
+            attempts=DeliveryJob.attempts + 1,
+        )
+        .returning(DeliveryJob)
+        .execution_options(synchronize_session=False)
+    )
+    result = await db.execute(stmt)
+    return list(result.scalars().all())
+
+
+async def complete_job(db: AsyncSession, job_id: int):
+    await db.execute(
+        update(DeliveryJob)
+        .where(DeliveryJob.id == job_id)
+        .values(status=DeliveryStatus.DONE, locked_at=None, last_error=None)
+    )
+
+
+async def fail_job(
+    db: AsyncSession, job: DeliveryJob, error: str, permanent: bool = False
+) -> bool:
+    """
+    Schedules the next attempt, or marks the job failed once its attempts are
+    exhausted. Returns True when the job will not be retried.
+    """
+    exhausted = permanent or job.attempts >= job.max_attempts
+    values = {"locked_at": None, "last_error": error[:2000]}
+    if exhausted:
+        values["status"] = DeliveryStatus.FAILED
+    else:
+        values["status"] = DeliveryStatus.PENDING
+        values["run_after"] = datetime.now(timezone.utc) + retry_delay(job.attempts)
+
+    await db.execute(
+        update(DeliveryJob).where(DeliveryJob.id == job.id).values(**values)
+    )
+    return exhausted
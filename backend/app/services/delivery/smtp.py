@@ -0,0 +1,66 @@
+import asyncio
+from contextlib import suppress
+from email.message import EmailMessage
+
+import aiosmtplib
+
+from app.core.config import settings
+from app.core.logger import get_logger
+
+log = get_logger(__name__)
+
+SMTP_TIMEOUT_SECONDS = 30
+
+
+class SMTPPool:
+    """
+    Keeps up to `size` authenticated SMTP connections open and reuses them
+    across messages instead of doing a TLS handshake and login per email.
+    """
+
+    def __init__(self, size: int = settings.SMTP_POOL_SIZE):
+        self._slots = asyncio.Semaphore(size)
+        self._idle: list[aiosmtplib.SMTP] = []
+
+    async def _connect(self) -> aiosmtplib.SMTP:
+        client = aiosmtplib.SMTP(
+            hostname=settings.SMTP_HOST,
+            port=settings.SMTP_PORT,
+            start_tls=True,
+            timeout=SMTP_TIMEOUT_SECONDS,
+        )
+        await client.connect()
+        await client.login(settings.SMTP_USER, settings.SMTP_PASSWORD)
+        return client
+
+    async def _acquire(self) -> aiosmtplib.SMTP:
+        while self._idle:
+            client = self._idle.pop()
+            if client.is_connected:
+                return client
+        return await self._connect()
+
+    async def send(self, msg: EmailMessage):
+        async with self._slots:
+            client = await self._acquire()
+            try:
+                try:
+                    await client.send_message(msg)
+                except aiosmtplib.SMTPServerDisconnected:
+                    # Idle connections get dropped by the server; retry once on a fresh one.
+                    log.info("Pooled SMTP connection was closed, reconnecting.")
+                    with suppress(Exception):
+                        client.close()
+                    client = await self._connect()
+                    await client.send_message(msg)
+            except Exception:
+                with suppress(Exception):
+                    client.close()
+                raise
+            self._idle.append(client)
+
+    async def close(self):
+        while self._idle:
+            client = self._idle.pop()
+            with suppress(Exception):
+                await client.quit()
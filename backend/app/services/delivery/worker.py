@@ -0,0 +1,160 @@
+"""
+Standalone delivery worker: `python -m app.services.delivery.worker`.
+
+Drains the `delivery_jobs` queue outside the API process. PDFs are rendered in
+a process pool so WeasyPrint never holds an event loop, and emails go out over
+pooled async SMTP connections.
+"""
+
+import asyncio
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+
+from app.core.config import settings
+from app.core.database import SessionLocal, engine
+from app.core.logger import get_logger
+from app.models.delivery_job import DeliveryJob
+from app.models.notifications import Notification
+from app.services.delivery.queue import (
+    BLUEPRINT_EMAIL,
+    PDF_RENDER,
+    claim_jobs,
+    complete_job,
+    fail_job,
+)
+from app.services.delivery.smtp import SMTPPool
+from app.services.email.itinerary_email import build_vacation_blueprint_message
+from app.services.email.pdf_builder import generate_itinerary_pdf
+from app.services.email.pdf_cache import get_or_render_pdf
+
+log = get_logger(__name__)
+
+POLL_INTERVAL_SECONDS = 2
+CLAIM_BATCH_SIZE = 4
+
+
+class PermanentDeliveryError(Exception):
+    """A failure that retrying cannot fix (e.g. SMTP is not configured)."""
+
+
+def _notification(job: DeliveryJob, category: str, message: str) -> Notification:
+    return Notification(
+        user_id=job.user_id,
+        category=category,
+        message=message,
+        event_key=f"delivery:{job.id}",
+    )
+
+
+def _destination(job: DeliveryJob) -> str:
+    return job.payload["vacation"].get("destination") or "your destination"
+
+
+class DeliveryWorker:
+    def __init__(
+        self,
+        render_processes: int = settings.DELIVERY_RENDER_PROCESSES,
+        batch_size: int = CLAIM_BATCH_SIZE,
+    ):
+        self.render_processes = render_processes
+        self.batch_size = batch_size
+        self._render_pool: ProcessPoolExecutor | None = None
+        self._smtp = SMTPPool()
+
+    async def _render_pdf(self, payload: dict) -> bytes:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._render_pool, generate_itinerary_pdf, payload
+        )
+
+    async def _send_blueprint_email(self, job: DeliveryJob) -> Notification:
+        if not settings.SMTP_USER or not settings.SMTP_PASSWORD:
+            raise PermanentDeliveryError("SMTP credentials are not configured.")
+
+        vacation = job.payload["vacation"]
+        async with SessionLocal() as db:
+            _, pdf_bytes = await get_or_render_pdf(db, vacation, self._render_pdf)
+
+        msg = build_vacation_blueprint_message(
+            job.payload["email_to"], vacation, pdf_bytes
+        )
+        await self._smtp.send(msg)
+
+        log.info(f"Vacation blueprint email dispatched for delivery job {job.id}.")
+        return _notification(
+            job,
+            "EMAIL_SUCCESS",
+            f"🎉 Pack your bags! Your detailed TuRAG Blueprint for {_destination(job)} is waiting in your inbox.",
+        )
+
+    async def _render_vacation_pdf(self, job: DeliveryJob) -> None:
+        async with SessionLocal() as db:
+            await get_or_render_pdf(db, job.payload["vacation"], self._render_pdf)
+        log.info(f"Vacation PDF rendered for delivery job {job.id}.")
+
+    def _failure_notification(self, job: DeliveryJob) -> Notification:
+        return _notification(
+            job,
+            "EMAIL_ERROR",
+            f"✈️ Slight turbulence: We couldn't deliver your {_destination(job)} itinerary email. You can still access it anytime from your dashboard.",
+        )
+
+    async def process(self, job: DeliveryJob):
+        handlers = {
+            BLUEPRINT_EMAIL: self._send_blueprint_email,
+            PDF_RENDER: self._render_vacation_pdf,
+        }
+
+        try:
+            handler = handlers.get(job.kind)
+            if handler is None:
+                raise PermanentDeliveryError(f"Unknown delivery job kind '{job.kind}'.")
+            notification = await handler(job)
+        except Exception as e:
+            log.error(
+                f"Delivery job {job.id} failed on attempt {job.attempts}: {e}",
+                exc_info=True,
+            )
+            async with SessionLocal() as db:
+                exhausted = await fail_job(
+                    db, job, str(e), permanent=isinstance(e, PermanentDeliveryError)
+                )
+                if exhausted and job.kind == BLUEPRINT_EMAIL:
+                    db.add(self._failure_notification(job))
+                await db.commit()
+            return
+
+        async with SessionLocal() as db:
+            await complete_job(db, job.id)
+            if notification is not None:
+                db.add(notification)
+            await db.commit()
+
+    async def run(self):
+        self._render_pool = ProcessPoolExecutor(
+            max_workers=self.render_processes,
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+        log.info(
+            f"Delivery worker started with {self.render_processes} render processes."
+        )
+
+        try:
+            while True:
+                async with SessionLocal() as db:
+                    jobs = await claim_jobs(db, self.batch_size)
+                    await db.commit()
+
+                if not jobs:
+                    await asyncio.sleep(POLL_INTERVAL_SECONDS)
+                    continue
+
+                await asyncio.gather(*(self.process(job) for job in jobs))
+        finally:
+            await self._smtp.close()
+            self._render_pool.shutdown(cancel_futures=True)
+            await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(DeliveryWorker().run())
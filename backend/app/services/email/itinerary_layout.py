@@ -0,0 +1,147 @@
+"""View model and template rendering for the itinerary PDF."""
+
+from datetime import datetime
+from types import SimpleNamespace
+from typing import Any, Dict
+
+from app.services.email.rendering import render_template
+
+
+def format_short_date(date_str: str) -> str:
+    if not date_str:
+        return "—"
+    try:
+        clean_date = date_str.split("T")[0]
+        dt = datetime.strptime(clean_date, "%Y-%m-%d")
+        return dt.strftime("%b %d, %Y")
+    except Exception:
+        return date_str
+
+
+def format_day_label(date_str: str) -> str:
+    if not date_str:
+        return ""
+    try:
+        clean_date = date_str.split("T")[0]
+        dt = datetime.strptime(clean_date, "%Y-%m-%d")
+        return dt.strftime("%A, %B %d")
+    except Exception:
+        return ""
+
+
+DAY_LABELS = [
+    "Arrival Day",
+    "Day 1",
+    "Day 2",
+    "Day 3",
+    "Day 4",
+    "Day 5",
+    "Departure Day",
+]
+LOGISTICS_EVENT_IDS = {"arr_airport", "arr_hotel", "dep_airport"}
+
+
+def _format_price(amount, ccy: str, fallback: str = "—") -> str:
+    return f"{amount:,.2f} {ccy}" if amount else fallback
+
+
+def _event_view(event: Dict[str, Any]) -> SimpleNamespace:
+    event_id = str(event.get("id") or "")
+    if event_id in LOGISTICS_EVENT_IDS or event_id.startswith(
+        ("start_hotel", "return_hotel")
+    ):
+        kind, dot = "logistics", "logistics"
+    elif event.get("type") == "meal":
+        kind, dot = "meal", "meal"
+    else:
+        kind, dot = "main", "filled"
+
+    transit_path = event.get("transit_path") or {}
+    transit_steps = [
+        SimpleNamespace(
+            instruction=step.get("instruction"),
+            duration_mins=step.get("duration_mins"),
+            badge=(
+                {
+                    "bg_color": step["transit_detail"].get("bg_color", "#E2E8F0"),
+                    "text_color": step["transit_detail"].get("text_color", "#0F172A"),
+                    "line_name": step["transit_detail"].get("line_name"),
+                }
+                if step.get("transit_detail")
+                else None
+            ),
+        )
+        for step in transit_path.get("steps") or []
+    ]
+
+    return SimpleNamespace(
+        kind=kind,
+        dot=dot,
+        name=event.get("name"),
+        start_time=event.get("start_time", ""),
+        end_time=event.get("end_time", ""),
+        formatted_address=event.get("formatted_address"),
+        description=event.get("description"),
+        needs_reservation=event.get("needs_reservation"),
+        transit_steps=transit_steps,
+        transit_mins=(
+            transit_path.get("duration_mins")
+            if transit_steps
+            else max(event.get("transit_mins") or 0, 0)
+        ),
+        transit_distance=transit_path.get("distance_text", "Est"),
+    )
+
+
+def build_itinerary_html(vacation_data: Dict[str, Any]) -> str:
+    """Renders the itinerary template from a compiled Vacation payload."""
+    itinerary_data = vacation_data.get("itinerary_data", {}) or {}
+    mobility = itinerary_data.get("mobility", {})
+    timeline = itinerary_data.get("timeline", [])
+
+    ccy = itinerary_data.get("meta", {}).get("currency", "EUR")
+
+    passenger_capacity = f"{vacation_data.get('adults', 1)} Adult(s)"
+    if vacation_data.get("children", 0) > 0:
+        passenger_capacity += f" · {vacation_data.get('children')} Child(ren)"
+
+    doc = SimpleNamespace(
+        id=vacation_data.get("id", "—"),
+        destination=vacation_data.get("destination", "Your Itinerary"),
+        from_date=format_short_date(vacation_data.get("from_date")),
+        to_date=format_short_date(vacation_data.get("to_date")),
+        origin=(vacation_data.get("origin") or "—").replace(",", " / "),
+        passenger_capacity=passenger_capacity,
+        airport_name=vacation_data.get("airport_name") or "Self-Arranged Base Route",
+        flight_price=_format_price(
+            vacation_data.get("flight_price"), vacation_data.get("flight_ccy") or ccy
+        ),
+        accommodation_name=vacation_data.get("accommodation_name")
+        or "Self-Arranged Base Stay",
+        accommodation_address=vacation_data.get("accommodation_address") or "",
+        hotel_price=_format_price(
+            vacation_data.get("accommodation_price"),
+            vacation_data.get("accommodation_ccy") or ccy,
+        ),
+        has_rental_car=mobility.get("has_rental_car"),
+        mobility_price=_format_price(
+            mobility.get("price_est"), mobility.get("currency") or ccy, "0.00 EUR"
+        ),
+    )
+
+    days = []
+    for idx, day in enumerate(timeline):
+        day_index = day.get("day_index", idx)
+        days.append(
+            SimpleNamespace(
+                label=(
+                    DAY_LABELS[day_index]
+                    if day_index < len(DAY_LABELS)
+                    else f"Day {day_index + 1}"
+                ),
+                date_label=format_day_label(day.get("date")),
+                events=[_event_view(event) for event in day.get("events", [])],
+            )
+        )
+
+    return render_template("itinerary_pdf.mako", doc=doc, days=days)
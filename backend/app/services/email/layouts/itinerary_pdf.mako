@@ -0,0 +1,143 @@
+<%doc>
+    Itinerary PDF body. Styles live in itinerary.css and are handed to WeasyPrint
+    as a precompiled stylesheet, so this template only carries markup.
+</%doc>
+<%def name="transit_block(event)">
+    % if event.transit_steps:
+    <div class="ov-transit-container">
+        <div class="ov-transit-title">⚡ ${event.transit_mins}m Transit Link · (${event.transit_distance})</div>
+        <div class="ov-transit-steps">
+        % for step in event.transit_steps:
+            <div class="ov-step-row">
+                <span class="ov-step-text">
+                % if step.badge:
+                    <span class="ov-step-badge" style="background: ${step.badge["bg_color"]}; color: ${step.badge["text_color"]};">${step.badge["line_name"]}</span>
+                % endif
+                    ${step.instruction}
+                </span>
+                <span class="ov-step-dur">${step.duration_mins}m</span>
+            </div>
+        % endfor
+        </div>
+    </div>
+    % elif event.transit_mins:
+    <div class="ov-transit-container">
+        <div class="ov-transit-title">⚡ ${event.transit_mins}m Local Area Transit</div>
+    </div>
+    % endif
+</%def>
+
+<%def name="event_block(event)">
+    ${transit_block(event)}
+    <div class="ov-event card-${event.kind}">
+        <div class="ov-ev-time">
+            <span class="ov-ev-time-start">${event.start_time}</span>
+            <span class="ov-ev-time-end">${event.end_time}</span>
+        </div>
+        <div class="ov-ev-indicator">
+            <div class="ov-ev-dot dot-${event.dot}"></div>
+        </div>
+        <div class="ov-ev-body">
+            <div class="ov-ev-title-text">${event.name}</div>
+            % if event.kind == "main":
+                % if event.formatted_address:
+            <div class="ov-ev-addr">📍 ${event.formatted_address}</div>
+                % endif
+                % if event.description:
+            <div class="ov-ev-desc">${event.description}</div>
+                % endif
+                % if event.needs_reservation:
+            <div class="ov-ev-reservation">⚠️ Advance Booking Required</div>
+                % endif
+            % endif
+        </div>
+    </div>
+</%def>
+
+<%def name="day_block(day)">
+    <div class="ov-day">
+        <div class="ov-day-header">
+            <span class="ov-day-num">${day.label}</span>
+            <span class="ov-day-label">—</span>
+            <span class="ov-day-date">${day.date_label}</span>
+        </div>
+        <div class="ov-events">
+        % for event in day.events:
+            ${event_block(event)}
+        % endfor
+        </div>
+    </div>
+</%def>
+<!DOCTYPE html>
+<html>
+<head>
+<meta charset="utf-8">
+</head>
+<body>
+
+    <div class="ov-masthead">
+        <div class="ov-eyebrow">Master Blueprinted Itinerary Document</div>
+        <div class="ov-destination">${doc.destination}</div>
+        <div class="ov-dates">${doc.from_date} — ${doc.to_date}</div>
+
+        <table class="ov-meta-table">
+            <tr>
+                <td>
+                    <div class="ov-meta-label">Group Manifest</div>
+                    <div class="ov-meta-value">${doc.passenger_capacity}</div>
+                </td>
+                <td>
+                    <div class="ov-meta-label">Departing From</div>
+                    <div class="ov-meta-value">${doc.origin}</div>
+                </td>
+                <td style="text-align: right;">
+                    <div class="ov-meta-label">System Passport Tracking Reference</div>
+                    <div class="ov-meta-value">ID: #${doc.id}</div>
+                </td>
+            </tr>
+        </table>
+    </div>
+
+    <div class="ov-section-title">1. Arranged Logistics Ledger Summary</div>
+    <table class="ledger-table">
+        <thead>
+            <tr>
+                <th style="width: 25%; text-align: left;">Segment Channel</th>
+                <th style="width: 55%; text-align: left;">Arranged Vendor Asset / Description</th>
+                <th style="width: 20%; text-align: right;">Accounting Balance</th>
+            </tr>
+        </thead>
+        <tbody>
+            <tr>
+                <td style="font-weight: bold;">✈️ Transit</td>
+                <td>${doc.airport_name}</td>
+                <td class="price-col">${doc.flight_price}</td>
+            </tr>
+            <tr>
+                <td style="font-weight: bold;">🏨 Lodging</td>
+                <td>
+                    <div style="font-weight: bold;">${doc.accommodation_name}</div>
+                    <div style="font-size: 8pt; color: #64748B; margin-top: 1pt;">${doc.accommodation_address}</div>
+                </td>
+                <td class="price-col">${doc.hotel_price}</td>
+            </tr>
+            <tr>
+                % if doc.has_rental_car:
+                <td style="font-weight: bold;">🚖 Ground Network</td>
+                <td>Private Vehicle Lease</td>
+                % else:
+                <td style="font-weight: bold;">🚇 Ground Network</td>
+                <td>Public Network Route Pass</td>
+                % endif
+                <td class="price-col">${doc.mobility_price}</td>
+            </tr>
+        </tbody>
+    </table>
+
+    <div class="ov-section-title">2. Operational Chronology Blueprint</div>
+    % for day in days:
+    ${day_block(day)}
+    % endfor
+
+</body>
+</html>
@@ -0,0 +1,44 @@
+<!DOCTYPE html>
+<html>
+<head>
+    <meta charset="utf-8">
+</head>
+<body style="font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, Helvetica, Arial, sans-serif; background-color: #f8fafc; padding: 20px; margin: 0;">
+    <div style="max-width: 580px; margin: 0 auto; background-color: #ffffff; border: 1px solid #e2e8f0; border-radius: 16px; overflow: hidden; box-shadow: 0 4px 12px rgba(15, 23, 42, 0.03);">
+
+        <div style="background-color: #0f172a; padding: 32px 24px; text-align: center;">
+            <span style="font-size: 10px; font-weight: bold; color: #38bdf8; text-transform: uppercase; letter-spacing: 0.15em; display: block; margin-bottom: 4px;">TuRAG Travel Companion</span>
+            <h1 style="color: #ffffff; margin: 0; font-size: 24px; font-weight: 900; tracking-tight: -0.02em;">Pack Your Bags! 🌴</h1>
+            <p style="color: #94a3b8; margin: 8px 0 0 0; font-size: 14px; font-weight: 500;">${origin} &rarr; ${destination}</p>
+        </div>
+
+        <div style="padding: 32px 24px; color: #334155; line-height: 1.6;">
+            <p style="font-size: 15px; margin-top: 0; font-weight: 500;">Hi Traveler,</p>
+            <p style="font-size: 14px;">Great news! Your custom travel itinerary for <strong>${destination}</strong> is ready.</p>
+
+            <p style="font-size: 14px;">We have attached a finalized copy of your itinerary PDF directly to this email. It contains your complete daily timeline, accommodation references, costs, and transport directions so you can access them offline at any time.</p>
+
+            <div style="margin: 24px 0; padding: 16px; background-color: #f1f5f9; border-radius: 8px; font-size: 13px; color: #475569; border-left: 3px solid #64748b;">
+                📅 <strong>Trip Dates:</strong> ${from_date} — ${to_date}<br/>
+                👥 <strong>Travelers:</strong> ${adults} Adult(s)
+                % if children > 0:
+                · ${children} Child(ren)
+                % endif
+            </div>
+
+            <p style="font-size: 14px;">This blueprint has been saved securely. You can look back at this plan or review any of your past trips at any time by visiting your travel history page.</p>
+
+            <div style="margin: 32px 0 16px; text-align: center;">
+                <a href="${history_url}" style="display: inline-block; background-color: #0f172a; color: #ffffff; padding: 12px 28px; text-decoration: none; border-radius: 8px; font-size: 13px; font-weight: bold; tracking-wide: 0.05em; text-transform: uppercase; transition: background-color 0.2s;">View in Travel History</a>
+            </div>
+        </div>
+
+        <div style="background-color: #f8fafc; padding: 20px; text-align: center; border-top: 1px solid #e2e8f0;">
+            <p style="margin: 0; color: #94a3b8; font-size: 12px; font-weight: 500;">
+                Safe travels and smooth transits,<br>
+                <strong>The TuRAG Team</strong>
+            </p>
+        </div>
+    </div>
+</body>
+</html>
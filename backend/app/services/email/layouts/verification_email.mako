@@ -0,0 +1,18 @@
+<html>
+    <body style="font-family: Arial, sans-serif; color: #333; line-height: 1.6;">
+        <div style="max-width: 600px; margin: auto; padding: 20px; border: 1px solid #ddd; border-radius: 8px;">
+            <h2 style="color: #2b6cb0;">Welcome to TuRAG! 🌴</h2>
+            <p>Hi there,</p>
+            <p>Thank you for registering. Please confirm your email address to activate your account and start planning your trips.</p>
+            <br/>
+            <a href="${verification_link}" style="background-color: #2b6cb0; color: white; padding: 10px 20px; text-decoration: none; border-radius: 5px; display: inline-block;">
+                Verify My Email
+            </a>
+            <br/><br/>
+            <p style="font-size: 14px;">Or copy and paste this link into your browser:</p>
+            <p style="font-size: 14px; word-break: break-all; color: #555;">${verification_link}</p>
+            <br/>
+            <p>Cheers,<br/>The TuRAG Team</p>
+        </div>
+    </body>
+</html>
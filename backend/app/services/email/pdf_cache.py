@@ -0,0 +1,85 @@
+import hashlib
+from typing import Awaitable, Callable, Optional
+
+import orjson
+from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.logger import get_logger
+from app.models.rendered_document import RenderedDocument
+from app.models.vacation import Vacation
+
+log = get_logger(__name__)
+
+# Bump when the PDF layout changes so previously rendered blobs are not reused.
+PDF_RENDER_VERSION = 2
+
+
+def vacation_document_payload(vacation: Vacation) -> dict:
+    """The snapshot of a finalized vacation that the itinerary PDF is rendered from."""
+    return {
+        "id": vacation.id,
+        "destination": vacation.destination,
+        "origin": vacation.origin,
+        "from_date": vacation.from_date.isoformat() if vacation.from_date else None,
+        "to_date": vacation.to_date.isoformat() if vacation.to_date else None,
+        "adults": vacation.adults,
+        "children": vacation.children,
+        "flight_price": vacation.flight_price,
+        "flight_ccy": vacation.flight_ccy,
+        "airport_name": vacation.airport_name,
+        "flights_url": vacation.flights_url,
+        "accommodation_price": vacation.accommodation_price,
+        "accommodation_ccy": vacation.accommodation_ccy,
+        "accommodation_name": vacation.accommodation_name,
+        "accommodation_address": vacation.accommodation_address,
+        "accommodation_url": vacation.accommodation_url,
+        "itinerary_data": vacation.itinerary_data,
+    }
+
+
+def pdf_content_hash(payload: dict) -> str:
+    canonical = orjson.dumps(
+        {"v": PDF_RENDER_VERSION, "payload": payload},
+        option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS,
+    )
+    return hashlib.sha256(canonical).hexdigest()
+
+
+async def get_cached_pdf(db: AsyncSession, content_hash: str) -> Optional[bytes]:
+    """The rendered PDF for a payload hash, or None if it was never rendered."""
+    result = await db.execute(
+        select(RenderedDocument.content).where(
+            RenderedDocument.content_hash == content_hash
+        )
+    )
+    return result.scalar_one_or_none()
+
+
+async def get_or_render_pdf(
+    db: AsyncSession,
+    payload: dict,
+    render: Callable[[dict], Awaitable[bytes]],
+) -> tuple[str, bytes]:
+    """
+    Returns (content_hash, pdf_bytes), rendering through `render` only when no
+    blob exists for this exact payload yet.
+    """
+    content_hash = pdf_content_hash(payload)
+
+    cached = await get_cached_pdf(db, content_hash)
+    if cached is not None:
+        log.info(f"PDF cache HIT for {content_hash[:12]}")
+        return content_hash, cached
+
+    log.info(f"PDF cache MISS for {content_hash[:12]}, rendering...")
+    pdf_bytes = await render(payload)
+
+    await db.execute(
+        pg_insert(RenderedDocument)
+        .values(content_hash=content_hash, content=pdf_bytes, byte_size=len(pdf_bytes))
+        .on_conflict_do_nothing(index_elements=[RenderedDocument.content_hash])
+    )
+    await db.commit()
+    return content_hash, pdf_bytes
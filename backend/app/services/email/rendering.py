@@ -0,0 +1,28 @@
+"""
+Compiled Mako templates for emails and the itinerary PDF.
+
+Templates are compiled to Python on first use and kept in memory for the life
+of the process; output is HTML-escaped by default.
+"""
+
+from pathlib import Path
+
+from mako.lookup import TemplateLookup
+
+LAYOUTS_DIR = Path(__file__).resolve().parent / "layouts"
+
+template_lookup = TemplateLookup(
+    directories=[str(LAYOUTS_DIR)],
+    default_filters=["h"],
+    input_encoding="utf-8",
+    filesystem_checks=False,
+    collection_size=50,
+)
+
+
+def render_template(name: str, **context) -> str:
+    return template_lookup.get_template(name).render(**context)
+
+
+def read_layout(name: str) -> str:
+    return (LAYOUTS_DIR / name).read_text(encoding="utf-8")
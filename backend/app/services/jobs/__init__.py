@@ -0,0 +1 @@
+"""Package for periodic background jobs."""
@@ -0,0 +1,48 @@
+from datetime import datetime, timedelta
+
+from sqlalchemy import String, cast, false, func, literal, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.logger import get_logger
+from app.models.notifications import Notification
+from app.models.vacation_session import VacationSession
+
+log = get_logger(__name__)
+
+ABANDON_AFTER = timedelta(hours=24)
+
+
+async def detect_abandoned_sessions(db: AsyncSession):
+    """
+    Creates a "Still thinking about ...?" notification for every active session
+    left untouched for a day, in one set-based statement. The unique `event_key`
+    makes reruns a no-op for sessions that were already flagged.
+    """
+    threshold = datetime.now() - ABANDON_AFTER
+
+    stale_sessions = select(
+        VacationSession.user_id,
+        literal("SESSION_ALERT"),
+        literal("abandon_") + cast(VacationSession.id, String),
+        literal("Still thinking about ")
+        + func.coalesce(VacationSession.destination, "your trip")
+        + literal("? Jump back in!"),
+        false(),
+    ).where(
+        VacationSession.is_active == True,
+        VacationSession.updated_at < threshold,
+    )
+
+    stmt = (
+        insert(Notification)
+        .from_select(
+            ["user_id", "category", "event_key", "message", "is_read"],
+            stale_sessions,
+        )
+        .on_conflict_do_nothing(index_elements=["event_key"])
+    )
+
+    result = await db.execute(stmt)
+    if result.rowcount:
+        log.info(f"Flagged {result.rowcount} abandoned vacation sessions.")
@@ -0,0 +1,16 @@
+from app.models.global_attraction import GlobalAttraction
+from app.services.jobs.abandoned_sessions import detect_abandoned_sessions
+from app.services.jobs.runner import JobScheduler, PeriodicJob
+from app.services.search.attraction_metrics import flush_attraction_metrics
+
+scheduler = JobScheduler(
+    [
+        PeriodicJob("detect_abandoned_sessions", 300, detect_abandoned_sessions),
+        PeriodicJob("flush_attraction_metrics", 10, flush_attraction_metrics),
+        PeriodicJob(
+            "refresh_relevance_scores",
+            60 * 60 * 6,
+            GlobalAttraction.refresh_relevance_scores,
+        ),
+    ]
+)
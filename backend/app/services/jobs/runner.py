@@ -0,0 +1,71 @@
+import asyncio
+import random
+import zlib
+from dataclasses import dataclass
+from typing import Awaitable, Callable
+
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.database import SessionLocal
+from app.core.logger import get_logger
+
+log = get_logger(__name__)
+
+
+@dataclass(frozen=True)
+class PeriodicJob:
+    name: str
+    interval_seconds: int
+    run: Callable[[AsyncSession], Awaitable[None]]
+
+    @property
+    def lock_id(self) -> int:
+        """Stable advisory lock key shared by every worker for this job."""
+        return zlib.crc32(self.name.encode())
+
+
+async def run_job_once(job: PeriodicJob) -> bool:
+    """
+    Runs the job inside a transaction guarded by a transaction-level advisory
+    lock. Returns False when another worker already holds the lock.
+    """
+    async with SessionLocal() as db:
+        acquired = await db.scalar(select(func.pg_try_advisory_xact_lock(job.lock_id)))
+        if not acquired:
+            await db.rollback()
+            return False
+
+        await job.run(db)
+        await db.commit()
+        return True
+
+
+async def _run_forever(job: PeriodicJob):
+    await asyncio.sleep(random.uniform(0, min(30, job.interval_seconds)))
+
+    while True:
+        try:
+            await run_job_once(job)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            log.error(f"Background job '{job.name}' failed: {e}", exc_info=True)
+
+        await asyncio.sleep(job.interval_seconds)
+
+
+class JobScheduler:
+    def __init__(self, jobs: list[PeriodicJob]):
+        self.jobs = jobs
+        self._tasks: list[asyncio.Task] = []
+
+    async def start(self):
+        self._tasks = [asyncio.create_task(_run_forever(job)) for job in self.jobs]
+        log.info(f"Started {len(self._tasks)} background jobs.")
+
+    async def stop(self):
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
@@ -0,0 +1,97 @@
+import asyncio
+from collections import defaultdict
+
+import orjson
+import psycopg
+
+from app.core.database import raw_db_url
+from app.core.logger import get_logger
+
+log = get_logger(__name__)
+
+NOTIFICATION_CHANNEL = "notification_events"
+SUBSCRIBER_QUEUE_SIZE = 100
+RECONNECT_DELAY_SECONDS = 5
+
+RESYNC_EVENT = {"op": "resync"}
+
+
+class NotificationBroadcaster:
+    """
+    Holds a single LISTEN connection per worker and fans the change events
+    emitted by the `notifications` table trigger out to the SSE streams of
+    the affected user.
+    """
+
+    def __init__(self):
+        self._subscribers: dict[str, set[asyncio.Queue]] = defaultdict(set)
+        self._task: asyncio.Task | None = None
+
+    async def start(self):
+        self._task = asyncio.create_task(self._listen())
+
+    async def stop(self):
+        if self._task:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+
+    def subscribe(self, user_id: str) -> asyncio.Queue:
+        queue = asyncio.Queue(maxsize=SUBSCRIBER_QUEUE_SIZE)
+        self._subscribers[user_id].add(queue)
+        return queue
+
+    def unsubscribe(self, user_id: str, queue: asyncio.Queue):
+        queues = self._subscribers.get(user_id)
+        if not queues:
+            return
+        queues.discard(queue)
+        if not queues:
+            del self._subscribers[user_id]
+
+    def publish(self, user_id: str, event: dict):
+        for queue in self._subscribers.get(user_id, ()):
+            try:
+                queue.put_nowait(event)
+            except asyncio.QueueFull:
+                # A stalled client missed too much; make it reload the snapshot.
+                while not queue.empty():
+                    queue.get_nowait()
+                queue.put_nowait(RESYNC_EVENT)
+
+    def _resync_all(self):
+        for user_id in list(self._subscribers):
+            self.publish(user_id, RESYNC_EVENT)
+
+    async def _listen(self):
+        while True:
+            try:
+                async with await psycopg.AsyncConnection.connect(
+                    raw_db_url, autocommit=True
+                ) as conn:
+                    await conn.execute(f"LISTEN {NOTIFICATION_CHANNEL}")
+                    log.info("Notification broadcaster listening for changes.")
+
+                    # Events may have been missed while disconnected.
+                    self._resync_all()
+
+                    async for notify in conn.notifies():
+                        try:
+                            event = orjson.loads(notify.payload)
+                        except orjson.JSONDecodeError:
+                            log.warning(
+                                f"Malformed notification event: {notify.payload}"
+                            )
+                            continue
+
+                        user_id = event.pop("user_id", None)
+                        if user_id:
+                            self.publish(user_id, event)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                log.error(f"Notification broadcaster disconnected: {e}")
+                await asyncio.sleep(RECONNECT_DELAY_SECONDS)
+
+
+notification_broadcaster = NotificationBroadcaster()
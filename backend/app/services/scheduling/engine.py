@@ -1,4 +1,3 @@
-import math
 import json
 import numpy as np
 from datetime import datetime, timedelta, time
@@ -9,6 +8,7 @@ from ortools.constraint_solver import routing_enums_pb2
 from ortools.constraint_solver import pywrapcp
 
 from app.core.logger import get_logger
+from app.utils.generic import haversine_km
 
 log = get_logger(__name__)
 
@@ -49,17 +49,7 @@ class ScheduleEngine:
         }
 
     def _get_real_distance_km(self, lat1, lon1, lat2, lon2):
-        R = 6371.0
-        dlat = math.radians(lat2 - lat1)
-        dlon = math.radians(lon2 - lon1)
-        a = (
-            math.sin(dlat / 2) ** 2
-            + math.cos(math.radians(lat1))
-            * math.cos(math.radians(lat2))
-            * math.sin(dlon / 2) ** 2
-        )
-        c = 2 * math.atan2(math.sqrt(a), math.sqrt(1 - a))
-        return R * c
+        return haversine_km(lat1, lon1, lat2, lon2)
 
     def _get_base_transit_mins(self, lat1, lon1, lat2, lon2):
         straight_dist = self._get_real_distance_km(lat1, lon1, lat2, lon2)
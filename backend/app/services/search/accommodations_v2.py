@@ -2,6 +2,7 @@ from typing import Optional
 import httpx
 from app.core.config import settings
 from app.core.cache import redis_cache
+from app.core.http import get_http_client
 
 
 RAPIDAPI_KEY = settings.RAPIDAPI_KEY
@@ -32,13 +33,12 @@ async def get_destination_id(location_name: str) -> dict:
 
     print(f"Calling searchDestination for '{location_name}'...")
     try:
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                url,
-                headers=headers,
-                params=querystring,
-                timeout=REQUEST_TIMEOUT,
-            )
+        response = await get_http_client().get(
+            url,
+            headers=headers,
+            params=querystring,
+            timeout=REQUEST_TIMEOUT,
+        )
         response.raise_for_status()
         results = response.json()
 
@@ -49,8 +49,8 @@ async def get_destination_id(location_name: str) -> dict:
             return None
     except httpx.HTTPError as e:
         print(f"Error during destination search: {e}")
-        if response:
-            print(f"Response body: {response.text}")
+        if isinstance(e, httpx.HTTPStatusError):
+            print(f"Response body: {e.response.text}")
         return None
 
 
@@ -109,19 +109,18 @@ async def search_hotels(
     headers = {"x-rapidapi-key": RAPIDAPI_KEY, "x-rapidapi-host": RAPIDAPI_HOST}
 
     try:
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                url,
-                headers=headers,
-                params=querystring,
-                timeout=REQUEST_TIMEOUT,
-            )
+        response = await get_http_client().get(
+            url,
+            headers=headers,
+            params=querystring,
+            timeout=REQUEST_TIMEOUT,
+        )
         response.raise_for_status()
         return response.json()
     except httpx.HTTPError as e:
         print(f"Error during hotel search: {e}")
-        if response:
-            print(f"Response body: {response.text}")
+        if isinstance(e, httpx.HTTPStatusError):
+            print(f"Response body: {e.response.text}")
         return {}
 
 
@@ -144,7 +143,7 @@ async def get_hotel_details(
         departure_date (str): The departure date (YYYY-MM-DD).
 
     Returns:
-        dict: The JSON response from the API.
+        dict: The JSON response from the API, or None if the request failed.
     """
     url = f"https://{RAPIDAPI_HOST}/api/v1/hotels/getHotelDetails"
 
@@ -168,17 +167,17 @@ async def get_hotel_details(
     headers = {"x-rapidapi-key": RAPIDAPI_KEY, "x-rapidapi-host": RAPIDAPI_HOST}
 
     try:
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                url,
-                headers=headers,
-                params=querystring,
-                timeout=REQUEST_TIMEOUT,
-            )
+        response = await get_http_client().get(
+            url,
+            headers=headers,
+            params=querystring,
+            timeout=REQUEST_TIMEOUT,
+        )
         response.raise_for_status()
         return response.json()
     except httpx.HTTPError as e:
         print(f"Error during hotel details fetch: {e}")
-        if response:
-            print(f"Response body: {response.text}")
-        return {}
+        if isinstance(e, httpx.HTTPStatusError):
+            print(f"Response body: {e.response.text}")
+        # None is not cached, so a failed (pre)fetch is retried on the next open.
+        return None
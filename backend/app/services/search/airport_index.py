@@ -0,0 +1,299 @@
+import heapq
+from array import array
+from bisect import bisect_left
+from collections import defaultdict
+from collections.abc import Mapping
+from functools import lru_cache
+
+import airportsdata
+from babel import numbers
+
+from app.core.airport_data import (
+    AirportTable,
+    get_airports,
+    read_artifact,
+    write_artifact,
+)
+from app.core.logger import get_logger
+from app.utils.generic import normalize_country_key, normalize_place_key
+
+log = get_logger(__name__)
+
+AUTOCOMPLETE_LIMIT = 15
+NGRAM_SIZES = (2, 3)
+PREFIX_TIER_MAX = 50
+DEFAULT_CURRENCY = "USD"
+EMPTY_POSTINGS = array("I")
+
+# IATA metropolitan area codes, expanded to the airports they group.
+METRO_CODES = {
+    "BJS": ["PEK", "PKX"],
+    "BUE": ["EZE", "AEP"],
+    "BUH": ["OTP", "BBU"],
+    "CHI": ["ORD", "MDW"],
+    "JKT": ["CGK", "HLP"],
+    "LON": ["LHR", "LGW", "STN", "LTN", "LCY", "SEN"],
+    "MIL": ["MXP", "LIN", "BGY"],
+    "MOW": ["SVO", "DME", "VKO"],
+    "NYC": ["JFK", "EWR", "LGA"],
+    "OSA": ["KIX", "ITM"],
+    "PAR": ["CDG", "ORY", "BVA"],
+    "REK": ["KEF", "RKV"],
+    "RIO": ["GIG", "SDU"],
+    "ROM": ["FCO", "CIA"],
+    "SEL": ["ICN", "GMP"],
+    "STO": ["ARN", "BMA", "NYO"],
+    "TYO": ["HND", "NRT"],
+    "WAS": ["IAD", "DCA", "BWI"],
+    "YMQ": ["YUL", "YMX"],
+    "YTO": ["YYZ", "YTZ"],
+}
+
+
+def _city_match_tier(name: str) -> int:
+    """Score for an exact city match, ranking the main airport of a city first."""
+    if "international" in name or "intl" in name:
+        return 10
+    if "municipal" in name or "county" in name or "field" in name:
+        return 30
+    return 20
+
+
+def _ngrams(text: str, n: int):
+    return {text[i : i + n] for i in range(len(text) - n + 1)}
+
+
+class AirportIndex:
+    """
+    Search structures over the airport table, built once and shipped in the
+    airport artifact so workers only have to unpickle them.
+
+    Every airport's code, city and name are normalized up front. Prefix
+    lookups use a sorted key array with bisect, which acts as a flattened
+    trie over codes, cities, full names and name tokens. A 2/3-gram posting
+    map (sorted id arrays) answers infix queries. Autocomplete ranks only the
+    candidates these structures return.
+    """
+
+    def __init__(self, airports: Mapping, state: dict | None = None):
+        self._airports = airports
+        self._codes = list(airports)
+        state = state or self.build_state(airports)
+
+        self._fields: list[tuple[str, str, str, int]] = state["fields"]
+        self._sort_keys: list[tuple[str, str]] = state["sort_keys"]
+        self._by_city: dict[str, tuple[str, ...]] = state["by_city"]
+        self._currency_by_country: dict[str, str] = state["currencies"]
+        self._prefix_keys: list[str] = state["prefix_keys"]
+        self._prefix_ids: array = state["prefix_ids"]
+        self._ngrams: dict[int, dict[str, array]] = state["ngrams"]
+
+        self.search = lru_cache(maxsize=4096)(self._search)
+
+    @staticmethod
+    def build_state(airports: Mapping) -> dict:
+        fields = []
+        sort_keys = []
+        by_city = defaultdict(list)
+        currencies = {}
+        prefix_pairs: list[tuple[str, int]] = []
+        ngrams = {n: defaultdict(list) for n in NGRAM_SIZES}
+
+        for idx, (code, data) in enumerate(airports.items()):
+            city = normalize_place_key(data.get("city", ""))
+            name = normalize_place_key(data.get("name", ""))
+            code_key = code.lower()
+
+            fields.append((code_key, city, name, _city_match_tier(name)))
+            sort_keys.append((data.get("country", ""), data.get("city", "")))
+
+            if city:
+                by_city[city].append(code)
+            country = data.get("country", "")
+            if country and country not in currencies:
+                territory_currencies = numbers.get_territory_currencies(country)
+                currencies[country] = (
+                    territory_currencies[0]
+                    if territory_currencies
+                    else DEFAULT_CURRENCY
+                ).upper()
+
+            for key in {code_key, city, name, *name.split()}:
+                if key:
+                    prefix_pairs.append((key, idx))
+
+            grams = {
+                (n, gram)
+                for field in (code_key, city, name)
+                for n in NGRAM_SIZES
+                for gram in _ngrams(field, n)
+            }
+            for n, gram in grams:
+                ngrams[n][gram].append(idx)
+
+        prefix_pairs.sort()
+        return {
+            "fields": fields,
+            "sort_keys": sort_keys,
+            "by_city": {city: tuple(codes) for city, codes in by_city.items()},
+            "currencies": currencies,
+            "prefix_keys": [key for key, _ in prefix_pairs],
+            "prefix_ids": array("I", (idx for _, idx in prefix_pairs)),
+            "ngrams": {
+                n: {gram: array("I", ids) for gram, ids in postings.items()}
+                for n, postings in ngrams.items()
+            },
+        }
+
+    def state(self) -> dict:
+        return {
+            "fields": self._fields,
+            "sort_keys": self._sort_keys,
+            "by_city": self._by_city,
+            "currencies": self._currency_by_country,
+            "prefix_keys": self._prefix_keys,
+            "prefix_ids": self._prefix_ids,
+            "ngrams": self._ngrams,
+        }
+
+    def airport(self, code: str) -> dict | None:
+        return self._airports.get(code.strip().upper())
+
+    def _result(self, idx: int) -> dict:
+        code = self._codes[idx]
+        data = self._airports[code]
+        return {
+            "code": code,
+            "city": data.get("city", ""),
+            "name": data.get("name", ""),
+            "country": data.get("country", ""),
+        }
+
+    def currency_for_country(self, country_code: str) -> str:
+        return self._currency_by_country.get(country_code.upper(), DEFAULT_CURRENCY)
+
+    def parse_iata_list(self, value: str) -> list[str] | None:
+        """
+        Parses a comma-separated list of airport or metro codes ('OTP,BBU', 'LON').
+        Returns the expanded airport codes, or None when any entry is not a code.
+        """
+        codes = [c.strip().upper() for c in value.split(",") if c.strip()]
+        if not codes:
+            return None
+
+        expanded = []
+        for code in codes:
+            if code in self._airports:
+                expanded.append(code)
+            elif code in METRO_CODES:
+                expanded.extend(METRO_CODES[code])
+            else:
+                return None
+        return list(dict.fromkeys(expanded))
+
+    def airports_for(self, area: str, country: str | None = None) -> list[dict]:
+        """
+        Airports serving a city name or a single airport/metro code, optionally
+        restricted to a country (ISO code or name).
+        """
+        code = area.strip().upper()
+        if code in METRO_CODES:
+            found = [
+                self._airports[c] for c in METRO_CODES[code] if c in self._airports
+            ]
+        else:
+            found = [
+                self._airports[c]
+                for c in self._by_city.get(normalize_place_key(area), ())
+            ]
+            if code in self._airports and self._airports[code] not in found:
+                found.append(self._airports[code])
+
+        if country:
+            country_code = normalize_country_key(country).upper()
+            found = [a for a in found if a.get("country") == country_code]
+        return found
+
+    def _score(self, idx: int, query: str) -> int | None:
+        code, city, name, city_tier = self._fields[idx]
+        if code.startswith(query):
+            return 0
+        if query == city:
+            return city_tier
+        if city.startswith(query):
+            return 40
+        if name.startswith(query):
+            return 50
+        if query in city:
+            return 60
+        if query in name or query in code:
+            return 70
+        return None
+
+    def _prefix_candidates(self, query: str) -> set[int]:
+        start = bisect_left(self._prefix_keys, query)
+        end = bisect_left(self._prefix_keys, query + "\uffff", lo=start)
+        return set(self._prefix_ids[start:end])
+
+    def _infix_candidates(self, query: str) -> set[int]:
+        n = 3 if len(query) >= 3 else 2
+        postings = sorted(
+            (self._ngrams[n].get(gram, EMPTY_POSTINGS) for gram in _ngrams(query, n)),
+            key=len,
+        )
+        if not postings:
+            return set()
+
+        candidates = set(postings[0])
+        for ids in postings[1:]:
+            if not candidates:
+                break
+            candidates.intersection_update(ids)
+        return candidates
+
+    def _top(self, scored: list[tuple[int, int]], limit: int) -> list[dict]:
+        best = heapq.nsmallest(
+            limit, scored, key=lambda s: (s[0], *self._sort_keys[s[1]], s[1])
+        )
+        return [self._result(idx) for _, idx in best]
+
+    def _search(self, query: str, limit: int = AUTOCOMPLETE_LIMIT) -> list[dict]:
+        query = normalize_place_key(query)
+        if len(query) < 2:
+            return []
+
+        scored = [
+            (score, idx)
+            for idx in self._prefix_candidates(query)
+            if (score := self._score(idx, query)) is not None
+        ]
+
+        # Infix matches always rank below the prefix tiers, so they are only
+        # needed when the prefix tiers cannot fill the page on their own.
+        if sum(score <= PREFIX_TIER_MAX for score, _ in scored) < limit:
+            scored = [
+                (score, idx)
+                for idx in self._infix_candidates(query)
+                if (score := self._score(idx, query)) is not None
+            ]
+
+        return self._top(scored, limit)
+
+
+@lru_cache(maxsize=1)
+def get_airport_index() -> AirportIndex:
+    """Loaded on first use; from the artifact when one is available."""
+    payload = read_artifact()
+    index = AirportIndex(get_airports(), payload["index"] if payload else None)
+    log.info("Airport search index ready.")
+    return index
+
+
+def build_artifact():
+    table = AirportTable.from_rows(airportsdata.load("IATA"))
+    write_artifact(table, AirportIndex(table).state())
+    log.info(f"Wrote airport artifact with {len(table)} airports.")
+
+
+if __name__ == "__main__":
+    build_artifact()
@@ -0,0 +1,110 @@
+import uuid
+from collections import defaultdict
+
+import redis.asyncio as redis
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.cache import r
+from app.core.logger import get_logger
+from app.models.global_attraction import GlobalAttraction, METRIC_COLUMNS
+
+log = get_logger(__name__)
+
+PENDING_METRICS_KEY = "attraction_metrics:pending"
+FLUSHING_METRICS_PREFIX = "attraction_metrics:flushing:"
+
+
+async def record_attraction_metrics(
+    db: AsyncSession, deltas: dict[int, dict[str, int]]
+):
+    """
+    Buffers counter deltas ({attraction_id: {"search_count": 1, ...}}) in a Redis
+    hash so the request path never touches the hot attraction rows. If Redis is
+    unavailable the deltas are applied to Postgres directly.
+    """
+    deltas = {
+        attraction_id: {c: n for c, n in counts.items() if n}
+        for attraction_id, counts in deltas.items()
+    }
+    deltas = {k: v for k, v in deltas.items() if v}
+    if not deltas:
+        return
+
+    try:
+        async with r.pipeline(transaction=False) as pipe:
+            for attraction_id, counts in deltas.items():
+                for col, n in counts.items():
+                    pipe.hincrby(PENDING_METRICS_KEY, f"{attraction_id}:{col}", n)
+            await pipe.execute()
+    except redis.RedisError as e:
+        log.error(f"Metric buffer unavailable, writing counters directly: {e}")
+        await db.execute(GlobalAttraction.apply_metric_deltas_stmt(deltas))
+        await db.commit()
+
+
+async def record_search_hits(db: AsyncSession, attraction_ids: list[int]):
+    await record_attraction_metrics(
+        db, {attraction_id: {"search_count": 1} for attraction_id in attraction_ids}
+    )
+
+
+def _parse_buffer(raw: dict[str, str]) -> dict[int, dict[str, int]]:
+    deltas: dict[int, dict[str, int]] = defaultdict(dict)
+    for field, value in raw.items():
+        attraction_id, _, col = field.partition(":")
+        if col not in METRIC_COLUMNS or not attraction_id.isdigit():
+            continue
+        deltas[int(attraction_id)][col] = int(value)
+    return dict(deltas)
+
+
+async def _recover_orphaned_buffers():
+    """
+    Merges buffers left behind by a flush that died after RENAME back into the
+    pending hash. Flushes run under the job's advisory lock, so any flushing key
+    that exists when a flush starts belongs to no running flush.
+    """
+    async for flushing_key in r.scan_iter(match=f"{FLUSHING_METRICS_PREFIX}*"):
+        raw = await r.hgetall(flushing_key)
+        async with r.pipeline(transaction=True) as pipe:
+            for field, value in raw.items():
+                pipe.hincrby(PENDING_METRICS_KEY, field, int(value))
+            pipe.delete(flushing_key)
+            await pipe.execute()
+        log.warning(f"Recovered {len(raw)} buffered metrics from {flushing_key}.")
+
+
+async def flush_attraction_metrics(db: AsyncSession):
+    """
+    Atomically takes the pending buffer out of Redis (RENAME) and applies it to
+    Postgres in a single batched UPDATE. On failure the deltas are merged back
+    into the pending hash so the next flush retries them. The flushing key is
+    deleted before the commit that releases the advisory lock, so a crash can
+    lose one batch but never count it twice.
+    """
+    await _recover_orphaned_buffers()
+
+    flushing_key = f"{FLUSHING_METRICS_PREFIX}{uuid.uuid4().hex}"
+    try:
+        await r.rename(PENDING_METRICS_KEY, flushing_key)
+    except redis.ResponseError:
+        return
+
+    raw = await r.hgetall(flushing_key)
+    deltas = _parse_buffer(raw)
+
+    try:
+        if deltas:
+            await db.execute(GlobalAttraction.apply_metric_deltas_stmt(deltas))
+        await r.delete(flushing_key)
+        await db.commit()
+    except Exception:
+        await db.rollback()
+        async with r.pipeline(transaction=False) as pipe:
+            for field, value in raw.items():
+                pipe.hincrby(PENDING_METRICS_KEY, field, int(value))
+            pipe.delete(flushing_key)
+            await pipe.execute()
+        raise
+
+    log.info(f"Flushed buffered metrics for {len(deltas)} attractions.")
@@ -3,6 +3,8 @@ import random
 from typing import Dict, List, Optional
 from app.core.logger import get_logger
 from app.core.config import settings
+from app.core.http import get_http_client
+from app.services.search.place_cache import place_cache, place_key
 
 log = get_logger(__name__)
 
@@ -12,29 +14,42 @@ OTM_BASE_URL = "https://api.opentripmap.com/0.1/en/places"
 async def get_city_coordinates(
     city_name: str, country_code: Optional[str] = None
 ) -> Optional[Dict[str, float]]:
-    """1. Gets the exact center lat/lon of a city."""
+    """1. Gets the exact center lat/lon of a city, from the place cache when known."""
+    key = place_key(f"{city_name}, {country_code}" if country_code else city_name)
+    cached = await place_cache.get(key)
+    if cached and cached.get("latitude") is not None:
+        return {
+            "lat": cached["latitude"],
+            "lon": cached["longitude"],
+            "name": cached.get("name") or city_name,
+        }
+
     api_key = settings.OPENTRIPMAP_API_KEY
     if not api_key:
         return None
 
-    async with httpx.AsyncClient() as client:
-        try:
-            params = {"name": city_name, "apikey": api_key}
-            if country_code:
-                params["country"] = country_code
-            res = await client.get(f"{OTM_BASE_URL}/geoname", params=params)
-            res.raise_for_status()
-            data = res.json()
-            if "lat" in data and "lon" in data:
-                return {
-                    "lat": data["lat"],
-                    "lon": data["lon"],
-                    "name": data.get("name"),
-                }
-            return None
-        except httpx.HTTPError as e:
-            log.error(f"OTM /geoname error for {city_name}: {str(e)}")
-            return None
+    try:
+        params = {"name": city_name, "apikey": api_key}
+        if country_code:
+            params["country"] = country_code
+        res = await get_http_client().get(f"{OTM_BASE_URL}/geoname", params=params)
+        res.raise_for_status()
+        data = res.json()
+    except httpx.HTTPError as e:
+        log.error(f"OTM /geoname error for {city_name}: {str(e)}")
+        return None
+
+    if "lat" not in data or "lon" not in data:
+        return None
+
+    await place_cache.put(
+        key,
+        "opentripmap",
+        name=data.get("name"),
+        latitude=data["lat"],
+        longitude=data["lon"],
+    )
+    return {"lat": data["lat"], "lon": data["lon"], "name": data.get("name")}
 
 
 async def fetch_attractions_by_radius(
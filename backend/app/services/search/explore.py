@@ -1,14 +1,10 @@
-from serpapi import GoogleSearch
 from typing import Dict, Any, Optional
-from app.core.config import settings
+from app.core.cache import redis_cache
+from app.services.search.serpapi_client import serpapi_client
 
 
-GoogleSearch.SERP_API_KEY = settings.SERPAPI_API_KEY
-if not GoogleSearch.SERP_API_KEY:
-    raise ValueError("SERPAPI_API_KEY environment variable is required")
-
-
-def call_explore_api(
+@redis_cache(expire_time=3600 * 12)
+async def call_explore_api(
     departure_id: str,
     arrival_id: Optional[str] = None,
     arrival_area_id: Optional[str] = None,
@@ -30,7 +26,8 @@ def call_explore_api(
 ) -> Dict[str, Any]:
     """
     Call the Google Travel Explore API via SerpAPI for "inspiration" searches.
-    Uses the official serpapi-python library.
+    Results are cached in Redis like flight searches; explore prices are
+    indicative, so half a day of staleness is acceptable.
     """
 
     params = {"engine": "google_travel_explore", "departure_id": departure_id}
@@ -60,13 +57,7 @@ def call_explore_api(
             params[key] = value
 
     try:
-        search = GoogleSearch(params)
-        results = search.get_dict()
-
-        if "error" in results:
-            raise Exception(results["error"])
-
-        return results
+        return await serpapi_client.search(params)
 
     except Exception as e:
         print(f"Error calling SerpAPI (Google Travel Explore): {e}")
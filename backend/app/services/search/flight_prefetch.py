@@ -0,0 +1,66 @@
+"""
+Return-flight prefetch for the top outbound results.
+
+Inbound searches go through `call_flights_api` with the same arguments the
+inbound route uses, so a finished prefetch is served from the Redis cache and
+one that is still running is joined instead of repeated.
+"""
+
+import asyncio
+from typing import Any, Dict
+
+from app.core.logger import get_logger
+from app.services.search import flights
+
+log = get_logger(__name__)
+
+PREFETCH_TOP_N = 3
+PREFETCH_CONCURRENCY = 2
+
+_pending: dict[str, asyncio.Task] = {}
+
+
+async def fetch_inbound(
+    search_params: Dict[str, Any], departure_token: str
+) -> Dict[str, Any]:
+    """Return options for one outbound flight, reusing a prefetch in progress."""
+    pending = _pending.get(departure_token)
+    if pending is not None:
+        try:
+            return await asyncio.shield(pending)
+        except Exception as e:
+            log.warning(f"Inbound prefetch failed, searching again: {e}")
+
+    return await flights.call_flights_api(
+        departure_token=departure_token, **search_params
+    )
+
+
+async def prefetch_inbound(
+    search_params: Dict[str, Any],
+    departure_tokens: list[str],
+    limit: int = PREFETCH_TOP_N,
+):
+    """Warms the cache for the first `limit` tokens, a few searches at a time."""
+    semaphore = asyncio.Semaphore(PREFETCH_CONCURRENCY)
+
+    async def fetch(token: str) -> Dict[str, Any]:
+        async with semaphore:
+            return await flights.call_flights_api(
+                departure_token=token, **search_params
+            )
+
+    tasks = []
+    for token in departure_tokens[:limit]:
+        if token in _pending:
+            continue
+        task = asyncio.create_task(fetch(token))
+        _pending[token] = task
+        task.add_done_callback(lambda _, token=token: _pending.pop(token, None))
+        tasks.append(task)
+
+    results = await asyncio.gather(*tasks, return_exceptions=True)
+    failed = sum(isinstance(result, Exception) for result in results)
+    log.info(
+        f"Prefetched inbound flights for {len(tasks) - failed}/{len(tasks)} outbound options."
+    )
@@ -1,11 +1,10 @@
-from serpapi import GoogleSearch
-from typing import Dict, Any, Optional
-from babel import numbers
+import inspect
 import sys
-from app.core.config import settings
-from app.core.airport_data import AIRPORTS_DB
-from app.core.cache import redis_cache
-import asyncio
+from typing import Any, AsyncIterator, Dict, Optional
+
+from app.services.search.airport_index import get_airport_index
+from app.services.search.serpapi_client import serpapi_client
+from app.core.cache import build_cache_key, cache_get, cache_set, redis_cache
 
 
 def get_location_data(area_input: str, country_filter: str = None):
@@ -25,36 +24,15 @@ def get_location_data(area_input: str, country_filter: str = None):
             "currency": "EUR"               # Currency parameter
         }
     """
-    airports = AIRPORTS_DB
-    area_clean = area_input.strip()
-
-    found_airports = []
-
-    target_city = area_clean.lower()
-    target_code = area_clean.upper()
-    target_country = country_filter.strip().upper() if country_filter else None
-
-    for code, data in airports.items():
-        is_city_match = data.get("city", "").lower() == target_city
-        is_code_match = code == target_code
-
-        if is_city_match or is_code_match:
-            if target_country and data.get("country") != target_country:
-                continue
-
-            if len(code) == 3:
-                found_airports.append(data)
+    index = get_airport_index()
+    found_airports = index.airports_for(area_input, country_filter)
 
     if not found_airports:
         return {"error": f"No airports found for '{area_input}'"}
 
-    first_match = found_airports[0]
-    country_code = first_match["country"]
-
-    currency_list = numbers.get_territory_currencies(country_code)
-    currency_code = currency_list[0] if currency_list else "USD"
-
-    codes_str = ",".join(list(set([a["iata"] for a in found_airports])))
+    country_code = found_airports[0]["country"]
+    codes_str = ",".join(dict.fromkeys(a["iata"] for a in found_airports))
+    currency_code = index.currency_for_country(country_code)
 
     return {
         "departure_id": codes_str,
@@ -64,12 +42,37 @@ def get_location_data(area_input: str, country_filter: str = None):
     }
 
 
-GoogleSearch.SERP_API_KEY = settings.SERPAPI_API_KEY
-if not GoogleSearch.SERP_API_KEY:
-    raise ValueError("SERPAPI_API_KEY environment variable is required")
+FLIGHTS_CACHE_SECONDS = 3600 * 24 * 14
+FLIGHT_SECTIONS = ("best_flights", "other_flights")
+
+
+def flights_query(args: Dict[str, Any]) -> Dict[str, Any]:
+    """SerpAPI google_flights parameters for a `call_flights_api` argument set."""
+    params = {
+        "engine": "google_flights",
+    }
+
+    optional_params = {
+        key: value for key, value in args.items() if key != "sort_by_price"
+    }
+    optional_params["async"] = optional_params.pop("async_search", None)
+
+    for key, value in optional_params.items():
+        if value is not None:
+            params[key] = value
 
+    departure_token = args.get("departure_token")
+    booking_token = args.get("booking_token")
+    if (departure_token is not None or booking_token is not None) and "type" in params:
+        del params["type"]
 
-@redis_cache(expire_time=3600 * 24 * 14)
+    if args.get("sort_by_price") is True and args.get("sort_by") is None:
+        params["sort_by"] = 2
+
+    return params
+
+
+@redis_cache(expire_time=FLIGHTS_CACHE_SECONDS)
 async def call_flights_api(
     departure_id: Optional[str] = None,
     arrival_id: Optional[str] = None,
@@ -107,89 +110,10 @@ async def call_flights_api(
     output: Optional[str] = None,
     json_restrictor: Optional[str] = None,
     sort_by_price: Optional[bool] = None,
-) -> Dict[str, Any]:
-    return await asyncio.to_thread(
-        _call_flights_api,
-        departure_id,
-        arrival_id,
-        gl,
-        hl,
-        currency,
-        type,
-        outbound_date,
-        return_date,
-        travel_class,
-        multi_city_json,
-        show_hidden,
-        deep_search,
-        adults,
-        children,
-        infants_in_seat,
-        infants_on_lap,
-        sort_by,
-        stops,
-        exclude_airlines,
-        include_airlines,
-        bags,
-        max_price,
-        outbound_times,
-        return_times,
-        emissions,
-        layover_duration,
-        exclude_conns,
-        max_duration,
-        departure_token,
-        booking_token,
-        no_cache,
-        async_search,
-        zero_trace,
-        output,
-        json_restrictor,
-        sort_by_price,
-    )
-
-
-def _call_flights_api(
-    departure_id: Optional[str] = None,
-    arrival_id: Optional[str] = None,
-    gl: Optional[str] = None,
-    hl: Optional[str] = None,
-    currency: Optional[str] = None,
-    type: Optional[int] = 1,
-    outbound_date: Optional[str] = None,
-    return_date: Optional[str] = None,
-    travel_class: Optional[int] = None,
-    multi_city_json: Optional[str] = None,
-    show_hidden: Optional[bool] = None,
-    deep_search: Optional[bool] = True,
-    adults: Optional[int] = None,
-    children: Optional[int] = None,
-    infants_in_seat: Optional[int] = None,
-    infants_on_lap: Optional[int] = None,
-    sort_by: Optional[int] = None,
-    stops: Optional[int] = None,
-    exclude_airlines: Optional[str] = None,
-    include_airlines: Optional[str] = None,
-    bags: Optional[int] = None,
-    max_price: Optional[int] = None,
-    outbound_times: Optional[str] = None,
-    return_times: Optional[str] = None,
-    emissions: Optional[int] = None,
-    layover_duration: Optional[str] = None,
-    exclude_conns: Optional[str] = None,
-    max_duration: Optional[int] = None,
-    departure_token: Optional[str] = None,
-    booking_token: Optional[str] = None,
-    no_cache: Optional[bool] = None,
-    async_search: Optional[bool] = None,
-    zero_trace: Optional[bool] = None,
-    output: Optional[str] = None,
-    json_restrictor: Optional[str] = None,
-    sort_by_price: Optional[bool] = None,
 ) -> Dict[str, Any]:
     """
     Call the Google Flights API via SerpAPI to search for flights.
-    Uses the official serpapi-python library.
+    Uses the async SerpAPI client, so searches share pooled connections.
 
     Args:
         All args are documented in the original function
@@ -198,68 +122,13 @@ def _call_flights_api(
         Dict[str, Any]: API response containing flight data
 
     Raises:
-        ValueError: If API key is not found
-        Exception: If API request fails or returns an error
+        SerpApiError: If the API request fails, times out or returns an error
     """
 
-    params = {
-        "engine": "google_flights",
-    }
-
-    optional_params = {
-        "departure_id": departure_id,
-        "arrival_id": arrival_id,
-        "gl": gl,
-        "hl": hl,
-        "currency": currency,
-        "type": type,
-        "outbound_date": outbound_date,
-        "return_date": return_date,
-        "travel_class": travel_class,
-        "multi_city_json": multi_city_json,
-        "show_hidden": show_hidden,
-        "deep_search": deep_search,
-        "adults": adults,
-        "children": children,
-        "infants_in_seat": infants_in_seat,
-        "infants_on_lap": infants_on_lap,
-        "sort_by": sort_by,
-        "stops": stops,
-        "exclude_airlines": exclude_airlines,
-        "include_airlines": include_airlines,
-        "bags": bags,
-        "max_price": max_price,
-        "outbound_times": outbound_times,
-        "return_times": return_times,
-        "emissions": emissions,
-        "layover_duration": layover_duration,
-        "exclude_conns": exclude_conns,
-        "max_duration": max_duration,
-        "departure_token": departure_token,
-        "booking_token": booking_token,
-        "no_cache": no_cache,
-        "async": async_search,
-        "zero_trace": zero_trace,
-        "output": output,
-        "json_restrictor": json_restrictor,
-    }
-
-    for key, value in optional_params.items():
-        if value is not None:
-            params[key] = value
-
-    if (departure_token is not None or booking_token is not None) and "type" in params:
-        del params["type"]
-
-    if sort_by_price is True and sort_by is None:
-        params["sort_by"] = 2
+    params = flights_query(locals())
 
     try:
-        search = GoogleSearch(params)
-        results = search.get_dict()
-
-        if "error" in results:
-            raise Exception(results["error"])
+        results = await serpapi_client.search(params)
 
         if sort_by_price is True and "sort_by" not in params:
             if "best_flights" in results:
@@ -280,6 +149,36 @@ def _call_flights_api(
         raise
 
 
+async def stream_flights_api(**search_params) -> AsyncIterator[Dict[str, Any]]:
+    """
+    The flights `call_flights_api(**search_params)` would return, best_flights
+    then other_flights (SerpAPI's body order), yielded while the response is
+    still downloading. Reads and fills the same Redis entry as
+    `call_flights_api`, so a cached search is replayed straight away.
+    """
+    cache_key = build_cache_key(call_flights_api.__name__, (), search_params)
+    cached = await cache_get(cache_key)
+    if cached is not None:
+        for section in FLIGHT_SECTIONS:
+            for flight in cached.get(section) or []:
+                yield flight
+        return
+
+    args = inspect.signature(call_flights_api).bind(**search_params)
+    args.apply_defaults()
+
+    results = None
+    async for section, item in serpapi_client.stream_search(
+        flights_query(args.arguments), FLIGHT_SECTIONS
+    ):
+        if section is None:
+            results = item
+        else:
+            yield item
+
+    await cache_set(cache_key, FLIGHTS_CACHE_SECONDS, results)
+
+
 if __name__ == "__main__":
     print(get_location_data("Rome", "IT"))
     sys.exit()
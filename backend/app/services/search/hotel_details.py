@@ -0,0 +1,40 @@
+"""
+Bounded-concurrency hotel details fetches.
+
+Everything goes through the Redis-cached `get_hotel_details`, so hotels
+enriched right after a list search open from the cache.
+"""
+
+import asyncio
+from typing import Any, Dict, Optional
+
+from app.core.logger import get_logger
+from app.services.search import accommodations_v2
+
+log = get_logger(__name__)
+
+DETAILS_PREFETCH_TOP_N = 6
+DETAILS_CONCURRENCY = 4
+
+
+async def fetch_hotel_details_many(
+    param_sets: list[Dict[str, Any]], concurrency: int = DETAILS_CONCURRENCY
+) -> list[Optional[dict]]:
+    """Details for every parameter set, in order; None where the fetch failed."""
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def fetch(params: Dict[str, Any]) -> Optional[dict]:
+        async with semaphore:
+            try:
+                return await accommodations_v2.get_hotel_details(**params)
+            except Exception as e:
+                log.warning(f"Hotel details for {params.get('hotel_id')} failed: {e}")
+                return None
+
+    return await asyncio.gather(*(fetch(params) for params in param_sets))
+
+
+async def prefetch_hotel_details(param_sets: list[Dict[str, Any]]):
+    results = await fetch_hotel_details_many(param_sets)
+    fetched = sum(result is not None for result in results)
+    log.info(f"Prefetched details for {fetched}/{len(results)} hotels.")
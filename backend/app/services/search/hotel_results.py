@@ -0,0 +1,177 @@
+"""
+Cached hotel result sets with cursor pagination.
+
+A list search normalizes every hotel RapidAPI returns and stores the set in
+Redis under a fingerprint of the search. Pages, re-sorts and filters are then
+computed in memory from that set, without further upstream calls. Distances
+from the destination centre are only added, once per set, when a view sorts
+or filters on them.
+"""
+
+import base64
+import hashlib
+import json
+from typing import Any, Optional
+
+from app.core.cache import r
+from app.core.logger import get_logger
+from app.utils.generic import haversine_km
+
+log = get_logger(__name__)
+
+RESULT_SET_TTL_SECONDS = 3600
+RESULT_SET_PREFIX = "hotel_results:"
+PAGE_SIZE = 12
+
+MISSING_LAST = float("inf")
+
+
+class InvalidCursor(ValueError):
+    pass
+
+
+def search_fingerprint(params: dict) -> str:
+    payload = json.dumps(params, sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode()).hexdigest()[:32]
+
+
+def _time_range(block: Optional[dict]) -> Optional[str]:
+    if not block:
+        return None
+    return f"{block.get('fromTime')} - {block.get('untilTime')}"
+
+
+def normalize_hotel(hotel: dict) -> dict:
+    """One RapidAPI hotel as an `accommodationsResponse`-shaped dict."""
+    info = hotel.get("property", {})
+    gross_price = info.get("priceBreakdown", {}).get("grossPrice", {})
+
+    return {
+        "hotel_id": str(hotel.get("hotel_id", "")),
+        "hotel_name": info.get("name", ""),
+        "latitude": info.get("latitude"),
+        "longitude": info.get("longitude"),
+        "price": round(gross_price.get("value", MISSING_LAST), 2),
+        "currency": gross_price.get("currency"),
+        "photo_urls": info.get("photoUrls", []),
+        "accessibilityLabel": hotel.get("accessibilityLabel"),
+        "reviewScoreWord": info.get("reviewScoreWord"),
+        "reviewScore": info.get("reviewScore"),
+        "reviewCount": info.get("reviewCount"),
+        "propertyClass": info.get("propertyClass"),
+        "checkin_time_range": _time_range(info.get("checkin")),
+        "checkout_time_range": _time_range(info.get("checkout")),
+        "distance_km": None,
+    }
+
+
+def needs_distances(sort: str, max_distance_km: Optional[float]) -> bool:
+    return sort == "distance" or max_distance_km is not None
+
+
+def has_distances(hotels: list[dict]) -> bool:
+    return any(h["distance_km"] is not None for h in hotels)
+
+
+def add_distances(hotels: list[dict], center: dict) -> list[dict]:
+    """Fills `distance_km` from the destination centre, in place."""
+    for h in hotels:
+        if h["latitude"] is not None and h["longitude"] is not None:
+            h["distance_km"] = round(
+                haversine_km(
+                    center["lat"], center["lon"], h["latitude"], h["longitude"]
+                ),
+                2,
+            )
+    return hotels
+
+
+async def load_result_set(fingerprint: str) -> Optional[list[dict]]:
+    try:
+        cached = await r.get(RESULT_SET_PREFIX + fingerprint)
+    except Exception as e:
+        log.error(f"Failed to read hotel result set from Redis: {e}")
+        return None
+    return json.loads(cached) if cached else None
+
+
+async def store_result_set(fingerprint: str, hotels: list[dict]):
+    try:
+        await r.setex(
+            RESULT_SET_PREFIX + fingerprint, RESULT_SET_TTL_SECONDS, json.dumps(hotels)
+        )
+    except Exception as e:
+        log.error(f"Failed to cache hotel result set in Redis: {e}")
+
+
+def _sort_key(sort: str):
+    if sort == "review":
+        return lambda h: (-(h["reviewScore"] or 0), h["price"])
+    if sort == "distance":
+        return lambda h: (
+            MISSING_LAST if h["distance_km"] is None else h["distance_km"],
+            h["price"],
+        )
+    return lambda h: h["price"]
+
+
+def apply_view(
+    hotels: list[dict],
+    sort: str = "price",
+    max_price: Optional[float] = None,
+    min_review_score: Optional[float] = None,
+    min_stars: Optional[int] = None,
+    max_distance_km: Optional[float] = None,
+) -> list[dict]:
+    """Filters and sorts a cached result set; sorting is stable on ties."""
+
+    def keep(h: dict) -> bool:
+        if max_price is not None and h["price"] > max_price:
+            return False
+        if min_review_score is not None and (h["reviewScore"] or 0) < min_review_score:
+            return False
+        if min_stars is not None and (h["propertyClass"] or 0) < min_stars:
+            return False
+        if max_distance_km is not None and (
+            h["distance_km"] is None or h["distance_km"] > max_distance_km
+        ):
+            return False
+        return True
+
+    return sorted(filter(keep, hotels), key=_sort_key(sort))
+
+
+def encode_cursor(fingerprint: str, view: dict, offset: int) -> str:
+    payload = json.dumps({"fp": fingerprint, "view": view, "offset": offset})
+    return base64.urlsafe_b64encode(payload.encode()).decode()
+
+
+def decode_cursor(cursor: str, fingerprint: str, view: dict) -> int:
+    """Offset of the next page; the cursor must belong to the same search and view."""
+    try:
+        payload = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        offset = int(payload["offset"])
+    except Exception as e:
+        raise InvalidCursor("Malformed cursor") from e
+
+    if payload.get("fp") != fingerprint or payload.get("view") != view or offset < 0:
+        raise InvalidCursor("Cursor does not belong to this search")
+    return offset
+
+
+def paginate(
+    hotels: list[dict],
+    fingerprint: str,
+    view: dict,
+    cursor: Optional[str] = None,
+    limit: int = PAGE_SIZE,
+) -> dict[str, Any]:
+    offset = decode_cursor(cursor, fingerprint, view) if cursor else 0
+    end = offset + limit
+    return {
+        "items": hotels[offset:end],
+        "total": len(hotels),
+        "next_cursor": encode_cursor(fingerprint, view, end)
+        if end < len(hotels)
+        else None,
+    }
@@ -0,0 +1,123 @@
+import math
+
+import h3
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.global_attraction import GlobalAttraction, H3_RESOLUTION
+from app.services.search.attractions import get_city_coordinates
+from app.utils.generic import haversine_km
+
+EDGE_KM = h3.average_hexagon_edge_length(H3_RESOLUTION, "km")
+MAX_NEAREST_RADIUS_KM = 30.0
+
+
+def _cells_within(lat: float, lon: float, radius_km: float) -> list[str]:
+    # Neighbouring cell centres are edge * sqrt(3) apart; one extra ring covers
+    # points near the border of the outermost cells.
+    k = math.ceil(radius_km / (EDGE_KM * math.sqrt(3))) + 1
+    origin = h3.latlng_to_cell(lat, lon, H3_RESOLUTION)
+    return list(h3.grid_disk(origin, k))
+
+
+def _covered_km(rings: int) -> float:
+    """
+    Radius around the query point fully covered by a disk of `rings` rings:
+    each ring adds at least 1.5 edges, and both the point and a hit can sit up
+    to one edge from their cell centres.
+    """
+    return max(0.0, (rings + 1) * 1.5 * EDGE_KM - 2 * EDGE_KM)
+
+
+async def _candidates(
+    db: AsyncSession, lat: float, lon: float, radius_km: float
+) -> list[tuple[float, GlobalAttraction]]:
+    stmt = select(GlobalAttraction).where(
+        GlobalAttraction.h3_cell.in_(_cells_within(lat, lon, radius_km))
+    )
+    result = await db.execute(stmt)
+
+    candidates = []
+    for place in result.scalars().all():
+        distance = haversine_km(lat, lon, place.latitude, place.longitude)
+        if distance <= radius_km:
+            candidates.append((distance, place))
+    return candidates
+
+
+async def find_attractions_within_radius(
+    db: AsyncSession, lat: float, lon: float, radius_km: float, limit: int = 20
+) -> list[GlobalAttraction]:
+    """Catalog attractions within `radius_km` of a point, most relevant first."""
+    candidates = await _candidates(db, lat, lon, radius_km)
+    candidates.sort(key=lambda c: (-c[1].relevance_score, c[0]))
+    return [place for _, place in candidates[:limit]]
+
+
+async def find_nearest_attractions(
+    db: AsyncSession,
+    lat: float,
+    lon: float,
+    k: int = 10,
+    max_radius_km: float = MAX_NEAREST_RADIUS_KM,
+) -> list[tuple[GlobalAttraction, float]]:
+    """
+    The `k` catalog attractions closest to a point (e.g. the hotel), nearest
+    first, with their distance in km. The H3 disk widens ring by ring, doubling
+    each round and only loading the new rings, until the k-th hit is closer than
+    anything outside the searched disk could be.
+    """
+    origin = h3.latlng_to_cell(lat, lon, H3_RESOLUTION)
+    max_rings = math.ceil((max_radius_km + 2 * EDGE_KM) / (1.5 * EDGE_KM)) - 1
+
+    candidates: list[tuple[float, GlobalAttraction]] = []
+    searched, rings = -1, 1
+    while True:
+        cells = [
+            cell
+            for ring in range(searched + 1, rings + 1)
+            for cell in h3.grid_ring(origin, ring)
+        ]
+        result = await db.execute(
+            select(GlobalAttraction).where(GlobalAttraction.h3_cell.in_(cells))
+        )
+        for place in result.scalars().all():
+            distance = haversine_km(lat, lon, place.latitude, place.longitude)
+            if distance <= max_radius_km:
+                candidates.append((distance, place))
+        candidates.sort(key=lambda c: c[0])
+
+        if rings >= max_rings:
+            break
+        if len(candidates) >= k and candidates[k - 1][0] <= _covered_km(rings):
+            break
+        searched, rings = rings, min(rings * 2, max_rings)
+
+    return [(place, distance) for distance, place in candidates[:k]]
+
+
+async def catalog_city_center(db: AsyncSession, city: str, country: str) -> dict | None:
+    """
+    Centre of the attractions already cataloged for a city, so warm cities are
+    located without a round trip to OpenTripMap.
+    """
+    keys = GlobalAttraction.location_keys(city, country)
+    result = await db.execute(
+        select(
+            func.avg(GlobalAttraction.latitude), func.avg(GlobalAttraction.longitude)
+        ).where(
+            GlobalAttraction.country_key == keys["country_key"],
+            GlobalAttraction.city_key == keys["city_key"],
+        )
+    )
+    lat, lon = result.one()
+    if lat is not None and lon is not None:
+        return {"lat": lat, "lon": lon, "name": city}
+
+    # OpenTripMap filters on ISO codes; a name it can't map is left out.
+    country_code = keys["country_key"]
+    if len(country_code) != 2:
+        country_code = None
+    return await get_city_coordinates(
+        city, country_code.upper() if country_code else None
+    )
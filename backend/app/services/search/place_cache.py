@@ -0,0 +1,159 @@
+"""
+Persistent place-resolution cache.
+
+Destination resolution (Nominatim) and city centres (OpenTripMap /geoname) are
+stored in `place_resolutions`, keyed on normalized query text, with a bounded
+in-memory hot set in front. 'City, CC' labels of airport cities are seeded up front; bare city
+names are resolved once by Nominatim and cached from then on.
+
+Seed with `python -m app.services.search.place_cache`.
+"""
+
+import asyncio
+from collections import OrderedDict
+from collections.abc import Mapping
+from typing import Optional
+
+from sqlalchemy import delete, func, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.airport_data import get_airports
+from app.core.database import SessionLocal
+from app.core.logger import get_logger
+from app.models.place_resolution import PlaceResolution
+from app.utils.generic import normalize_country_key, normalize_place_key
+
+log = get_logger(__name__)
+
+HOT_SET_SIZE = 5000
+SEED_BATCH_SIZE = 1000
+SEED_SOURCE = "airports"
+
+FIELDS = ("label", "name", "latitude", "longitude")
+
+
+def place_key(query: str) -> str:
+    """
+    'Paris, France', 'paris,FR' and 'PARIS , fr' share one key ('paris|fr');
+    a query without a country part keys on the city alone.
+    """
+    city, _, country = (query or "").partition(",")
+    city_key = normalize_place_key(city)
+    country_key = normalize_country_key(country.split(",")[-1])
+    return f"{city_key}|{country_key}" if country_key else city_key
+
+
+def airport_seed_entries(airports: Mapping) -> dict[str, str]:
+    """
+    `'city|cc' -> 'City, CC'` for every airport city. Bare city names are left
+    to Nominatim: airport counts say nothing about which Rome or Dublin a
+    traveller means.
+    """
+    entries: dict[str, str] = {}
+    for airport in airports.values():
+        city, country = airport.get("city"), airport.get("country")
+        city_key = normalize_place_key(city)
+        if city_key and country:
+            entries.setdefault(f"{city_key}|{country.lower()}", f"{city}, {country}")
+    return entries
+
+
+class PlaceCache:
+    def __init__(self, hot_size: int = HOT_SET_SIZE):
+        self.hot_size = hot_size
+        self._hot: OrderedDict[str, dict] = OrderedDict()
+
+    def get_hot(self, key: str) -> Optional[dict]:
+        entry = self._hot.get(key)
+        if entry is not None:
+            self._hot.move_to_end(key)
+        return entry
+
+    def remember(self, key: str, entry: dict):
+        self._hot[key] = {**self._hot.get(key, {}), **entry}
+        self._hot.move_to_end(key)
+        while len(self._hot) > self.hot_size:
+            self._hot.popitem(last=False)
+
+    async def get(self, key: str) -> Optional[dict]:
+        if not key:
+            return None
+        entry = self.get_hot(key)
+        if entry is not None:
+            return entry
+
+        try:
+            async with SessionLocal() as db:
+                row = await db.get(PlaceResolution, key)
+        except Exception as e:
+            log.error(f"Place cache lookup for '{key}' failed: {e}")
+            return None
+        if row is None:
+            return None
+
+        entry = {field: getattr(row, field) for field in FIELDS}
+        self.remember(key, entry)
+        return entry
+
+    async def put(self, key: str, source: str, **fields):
+        """Merges `fields` into the entry; fields it does not name are kept."""
+        if not key:
+            return
+        self.remember(key, fields)
+
+        stmt = pg_insert(PlaceResolution).values(query_key=key, source=source, **fields)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[PlaceResolution.query_key],
+            set_={
+                **{field: stmt.excluded[field] for field in fields},
+                "source": stmt.excluded.source,
+                "updated_at": func.now(),
+            },
+        )
+        try:
+            async with SessionLocal() as db:
+                await db.execute(stmt)
+                await db.commit()
+        except Exception as e:
+            log.error(f"Place cache write for '{key}' failed: {e}")
+
+
+place_cache = PlaceCache()
+
+
+async def seed_from_airports(db: AsyncSession) -> int:
+    """
+    Inserts airport-city labels; entries resolved live are left untouched and
+    seeded keys that are no longer generated are dropped.
+    """
+    entries = airport_seed_entries(get_airports())
+    await db.execute(
+        delete(PlaceResolution).where(
+            PlaceResolution.source == SEED_SOURCE,
+            PlaceResolution.query_key.not_in(entries),
+        )
+    )
+
+    existing = set((await db.execute(select(PlaceResolution.query_key))).scalars())
+    rows = [
+        {"query_key": key, "label": label, "source": SEED_SOURCE}
+        for key, label in entries.items()
+        if key not in existing
+    ]
+
+    for start in range(0, len(rows), SEED_BATCH_SIZE):
+        stmt = pg_insert(PlaceResolution).values(rows[start : start + SEED_BATCH_SIZE])
+        await db.execute(stmt.on_conflict_do_nothing())
+    await db.commit()
+    return len(rows)
+
+
+async def _seed():
+    async with SessionLocal() as db:
+        seeded = await seed_from_airports(db)
+    log.info(f"Seeded {seeded} places from airport cities.")
+
+
+if __name__ == "__main__":
+    asyncio.run(_seed())
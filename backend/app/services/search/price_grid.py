@@ -0,0 +1,91 @@
+"""
+Flexible-date price grid: the cheapest fare for every outbound/return date
+pair within a window around the requested dates.
+"""
+
+import asyncio
+from datetime import date, timedelta
+from typing import Any, AsyncIterator, Dict, Optional
+
+from app.core.logger import get_logger
+from app.services.search import flights
+
+log = get_logger(__name__)
+
+MAX_GRID_DAYS = 3
+GRID_CONCURRENCY = 6
+
+
+def grid_cells(
+    outbound_date: str, return_date: Optional[str], days: int
+) -> list[tuple[str, Optional[str]]]:
+    """
+    Date pairs within ±`days` of the requested dates, skipping past departures
+    and returns before the outbound. One-way searches only shift the outbound.
+    The requested pair comes first so it is searched first.
+    """
+    outbound = date.fromisoformat(outbound_date)
+    inbound = date.fromisoformat(return_date) if return_date else None
+    today = date.today()
+    offsets = sorted(range(-days, days + 1), key=abs)
+
+    cells = []
+    for out_shift in offsets:
+        out_day = outbound + timedelta(days=out_shift)
+        if out_day < today:
+            continue
+        if inbound is None:
+            cells.append((out_day.isoformat(), None))
+            continue
+        for ret_shift in offsets:
+            ret_day = inbound + timedelta(days=ret_shift)
+            if ret_day >= out_day:
+                cells.append((out_day.isoformat(), ret_day.isoformat()))
+    return cells
+
+
+def cheapest_price(results: Dict[str, Any]) -> Optional[float]:
+    prices = [
+        flight["price"]
+        for flight in (results.get("best_flights") or [])
+        + (results.get("other_flights") or [])
+        if flight.get("price") is not None
+    ]
+    lowest = results.get("price_insights", {}).get("lowest_price")
+    if lowest is not None:
+        prices.append(lowest)
+    return min(prices) if prices else None
+
+
+async def stream_price_grid(
+    search_params: Dict[str, Any],
+    cells: list[tuple[str, Optional[str]]],
+    concurrency: int = GRID_CONCURRENCY,
+) -> AsyncIterator[Dict[str, Any]]:
+    """
+    Searches every cell through `call_flights_api` and yields each one as soon
+    as it completes. Cells already in the Redis cache come back first; the rest
+    run `concurrency` at a time.
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def search(outbound_date: str, return_date: Optional[str]) -> dict:
+        cell = {"outbound_date": outbound_date, "return_date": return_date}
+        # Only the dates change, so argument order (and with it the cache key)
+        # matches the getOutboundFlights search for the same dates.
+        params = {**search_params, **cell}
+        try:
+            async with semaphore:
+                results = await flights.call_flights_api(**params)
+            return {**cell, "price": cheapest_price(results)}
+        except Exception as e:
+            log.warning(f"Price grid cell {outbound_date}/{return_date} failed: {e}")
+            return {**cell, "price": None, "error": True}
+
+    tasks = [asyncio.create_task(search(*cell)) for cell in cells]
+    try:
+        for next_cell in asyncio.as_completed(tasks):
+            yield await next_cell
+    finally:
+        for task in tasks:
+            task.cancel()
@@ -0,0 +1,129 @@
+"""
+Async SerpAPI client over the shared HTTP pool.
+
+Replaces `serpapi.GoogleSearch`, which is synchronous and opens a new
+connection per search, so flight searches no longer hold a worker thread each.
+"""
+
+import asyncio
+from typing import Any, AsyncIterator, Dict, Iterable, Optional
+
+import httpx
+import orjson
+
+from app.core.config import settings
+from app.core.http import get_http_client
+from app.core.logger import get_logger
+from app.utils.json_stream import JsonArrayScanner
+
+log = get_logger(__name__)
+
+SERPAPI_URL = "https://serpapi.com/search.json"
+
+
+class SerpApiError(Exception):
+    """SerpAPI returned an error payload, a bad status or did not answer in time."""
+
+
+class SerpApiClient:
+    """
+    Spreads searches over one or more API keys (comma-separated in
+    SERPAPI_API_KEY), each capped at `max_concurrency` in-flight requests.
+    """
+
+    def __init__(
+        self,
+        api_keys: str = settings.SERPAPI_API_KEY,
+        max_concurrency: int = settings.SERPAPI_MAX_CONCURRENCY_PER_KEY,
+        timeout: float = settings.SERPAPI_TIMEOUT_SECONDS,
+    ):
+        self.keys = [key.strip() for key in api_keys.split(",") if key.strip()]
+        if not self.keys:
+            raise ValueError("SERPAPI_API_KEY environment variable is required")
+
+        self.timeout = timeout
+        self._slots = {key: asyncio.Semaphore(max_concurrency) for key in self.keys}
+        self._in_flight = dict.fromkeys(self.keys, 0)
+
+    def _pick_key(self) -> str:
+        return min(self.keys, key=self._in_flight.__getitem__)
+
+    @staticmethod
+    def _query(params: Dict[str, Any]) -> Dict[str, Any]:
+        return {
+            key: str(value).lower() if isinstance(value, bool) else value
+            for key, value in params.items()
+            if value is not None
+        }
+
+    @staticmethod
+    def _results(engine: str, status_code: int, body: bytes) -> Dict[str, Any]:
+        try:
+            results = orjson.loads(body)
+        except orjson.JSONDecodeError:
+            results = {}
+
+        if "error" in results:
+            raise SerpApiError(results["error"])
+        if status_code >= 400:
+            raise SerpApiError(f"SerpAPI ({engine}) returned HTTP {status_code}")
+        return results
+
+    async def search(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        query = self._query(params)
+        engine = query.get("engine", "unknown")
+
+        api_key = self._pick_key()
+        self._in_flight[api_key] += 1
+        try:
+            async with self._slots[api_key]:
+                response = await get_http_client().get(
+                    SERPAPI_URL,
+                    params={**query, "api_key": api_key},
+                    timeout=self.timeout,
+                )
+        except httpx.TimeoutException as e:
+            raise SerpApiError(f"SerpAPI ({engine}) timed out") from e
+        except httpx.HTTPError as e:
+            raise SerpApiError(f"SerpAPI ({engine}) request failed: {e}") from e
+        finally:
+            self._in_flight[api_key] -= 1
+
+        return self._results(engine, response.status_code, response.content)
+
+    async def stream_search(
+        self, params: Dict[str, Any], array_keys: Iterable[str]
+    ) -> AsyncIterator[tuple[Optional[str], Any]]:
+        """
+        Like `search`, but yields `(array_key, element)` for the elements of the
+        given top-level arrays while the body is still downloading. The last
+        event is `(None, results)` with the whole parsed response.
+        """
+        query = self._query(params)
+        engine = query.get("engine", "unknown")
+        scanner = JsonArrayScanner(array_keys)
+
+        api_key = self._pick_key()
+        self._in_flight[api_key] += 1
+        try:
+            async with self._slots[api_key]:
+                async with get_http_client().stream(
+                    "GET",
+                    SERPAPI_URL,
+                    params={**query, "api_key": api_key},
+                    timeout=self.timeout,
+                ) as response:
+                    async for chunk in response.aiter_bytes():
+                        for item in scanner.feed(chunk):
+                            yield item
+        except httpx.TimeoutException as e:
+            raise SerpApiError(f"SerpAPI ({engine}) timed out") from e
+        except httpx.HTTPError as e:
+            raise SerpApiError(f"SerpAPI ({engine}) request failed: {e}") from e
+        finally:
+            self._in_flight[api_key] -= 1
+
+        yield None, self._results(engine, response.status_code, bytes(scanner.body))
+
+
+serpapi_client = SerpApiClient()
@@ -1 +1 @@
-from .security import *
+"""Shared helpers. Import submodules directly (app.utils.generic, app.utils.security)."""
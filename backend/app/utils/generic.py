@@ -1,4 +1,11 @@
+import math
+import re
+import unicodedata
 from datetime import datetime
+from functools import lru_cache
+
+import orjson
+from babel import Locale
 
 
 def calculate_age(date_of_birth):
@@ -11,3 +18,78 @@ def calculate_age(date_of_birth):
         - ((today.month, today.day) < (date_of_birth.month, date_of_birth.day))
     )
     return age
+
+
+EARTH_RADIUS_KM = 6371.0
+
+
+def haversine_km(lat1, lon1, lat2, lon2):
+    dlat = math.radians(lat2 - lat1)
+    dlon = math.radians(lon2 - lon1)
+    a = (
+        math.sin(dlat / 2) ** 2
+        + math.cos(math.radians(lat1))
+        * math.cos(math.radians(lat2))
+        * math.sin(dlon / 2) ** 2
+    )
+    c = 2 * math.atan2(math.sqrt(a), math.sqrt(1 - a))
+    return EARTH_RADIUS_KM * c
+
+
+COUNTRY_ALIASES = {
+    "usa": "us",
+    "united states of america": "us",
+    "uk": "gb",
+    "great britain": "gb",
+    "england": "gb",
+    "scotland": "gb",
+    "wales": "gb",
+    "holland": "nl",
+    "czech republic": "cz",
+    "turkey": "tr",
+    "italia": "it",
+    "deutschland": "de",
+    "espana": "es",
+    "brasil": "br",
+}
+
+
+def normalize_place_key(value: str | None) -> str:
+    """
+    Lowercases, strips accents and collapses punctuation/whitespace so that
+    'São Paulo', 'sao  paulo' and 'Sao-Paulo' share the same lookup key.
+    """
+    if not value:
+        return ""
+    decomposed = unicodedata.normalize("NFKD", value)
+    stripped = "".join(c for c in decomposed if not unicodedata.combining(c))
+    return " ".join(re.sub(r"[^\w]+", " ", stripped.casefold()).split())
+
+
+@lru_cache(maxsize=1)
+def _country_name_index() -> dict[str, str]:
+    index = {
+        normalize_place_key(name): code.lower()
+        for code, name in Locale("en").territories.items()
+        if code.isalpha() and len(code) == 2
+    }
+    index.update(COUNTRY_ALIASES)
+    return index
+
+
+def normalize_country_key(value: str | None) -> str:
+    """
+    Maps a country name, alias or ISO code ('Italy', 'IT', 'Italia', 'UK') to its
+    lowercase ISO 3166-1 alpha-2 code ('it', 'gb'), falling back to the
+    normalized name.
+    """
+    key = normalize_place_key(value)
+    if key in COUNTRY_ALIASES:
+        return COUNTRY_ALIASES[key]
+    if len(key) == 2 and key.isalpha():
+        return key
+    return _country_name_index().get(key, key)
+
+
+def format_sse(event: str, data) -> str:
+    return f"event: {event}\ndata: {orjson.dumps(data).decode('utf-8')}\n\n"
@@ -0,0 +1,79 @@
+"""
+Incremental extraction of array elements from a JSON object body.
+"""
+
+import re
+from typing import Any, Iterable, Optional
+
+import orjson
+
+# Bytes that can change the scanner state; everything else is skipped by the regex.
+_STRUCTURAL = re.compile(rb'["\\{}\[\]]')
+
+
+class JsonArrayScanner:
+    """
+    Fed the body of a JSON object chunk by chunk, returns each element of the
+    selected top-level arrays as soon as it is complete, in document order.
+    The whole body is kept in `body` for parsing once the response ends.
+    """
+
+    def __init__(self, array_keys: Iterable[str]):
+        self.array_keys = set(array_keys)
+        self.body = bytearray()
+        self._pos = 0
+        self._depth = 0
+        self._in_string = False
+        self._skip_until = 0
+        self._string_start = 0
+        self._last_string: Optional[bytes] = None
+        self._array: Optional[str] = None
+        self._item_start: Optional[int] = None
+
+    def feed(self, chunk: bytes) -> list[tuple[str, Any]]:
+        self.body += chunk
+        items = []
+
+        for match in _STRUCTURAL.finditer(self.body, self._pos):
+            i = match.start()
+            if i < self._skip_until:
+                continue
+            c = self.body[i]
+
+            if self._in_string:
+                if c == ord("\\"):
+                    self._skip_until = i + 2
+                elif c == ord('"'):
+                    self._in_string = False
+                    if self._depth == 1:
+                        self._last_string = bytes(self.body[self._string_start : i])
+                continue
+
+            if c == ord('"'):
+                self._in_string = True
+                self._string_start = i + 1
+            elif c in b"{[":
+                if (
+                    c == ord("[")
+                    and self._depth == 1
+                    and self._last_string is not None
+                    and self._last_string.decode() in self.array_keys
+                ):
+                    self._array = self._last_string.decode()
+                elif self._array is not None and self._depth == 2:
+                    self._item_start = i
+                self._depth += 1
+            else:
+                self._depth -= 1
+                if self._array is None:
+                    continue
+                if self._depth == 2 and self._item_start is not None:
+                    items.append(
+                        (self._array, orjson.loads(self.body[self._item_start : i + 1]))
+                    )
+                    self._item_start = None
+                elif self._depth == 1:
+                    self._array = None
+
+        self._pos = len(self.body)
+        return items
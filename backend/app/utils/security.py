@@ -1,10 +1,17 @@
 from datetime import datetime
+from typing import Optional
 import bcrypt
 import jwt
+from fastapi import HTTPException
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 from app.models.blacklist_token import BlacklistToken
 from app.core.database import SessionLocal
+from app.core.logger import get_logger
+from app.core.revocation import revocation_cache
+from app.core.password_hashing import password_hashing_pool, HashingLimitExceeded
+
+log = get_logger(__name__)
 
 
 def get_password_hash(password: str) -> str:
@@ -20,6 +27,36 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     return bcrypt.checkpw(password_byte_enc, hashed_password_byte_enc)
 
 
+async def _run_hashing(fn, *args, ip: Optional[str], account: Optional[str]):
+    try:
+        return await password_hashing_pool.run(fn, *args, ip=ip, account=account)
+    except HashingLimitExceeded as e:
+        log.warning(f"Rejected password check (ip={ip}, account={account}): {e}")
+        raise HTTPException(
+            status_code=429,
+            detail="Too many attempts in progress. Please try again shortly.",
+        ) from e
+
+
+async def get_password_hash_async(
+    password: str, ip: Optional[str] = None, account: Optional[str] = None
+) -> str:
+    """get_password_hash on the bounded bcrypt pool, off the event loop."""
+    return await _run_hashing(get_password_hash, password, ip=ip, account=account)
+
+
+async def verify_password_async(
+    plain_password: str,
+    hashed_password: str,
+    ip: Optional[str] = None,
+    account: Optional[str] = None,
+) -> bool:
+    """verify_password on the bounded bcrypt pool, off the event loop."""
+    return await _run_hashing(
+        verify_password, plain_password, hashed_password, ip=ip, account=account
+    )
+
+
 async def blacklist_token(db: AsyncSession, token: str, expires_at: datetime):
     try:
         if expires_at.tzinfo is not None:
@@ -32,20 +69,33 @@ async def blacklist_token(db: AsyncSession, token: str, expires_at: datetime):
         await db.rollback()
         raise e
 
+    try:
+        await revocation_cache.revoke(token, expires_at)
+    except Exception as e:
+        log.error(f"Failed to mirror token revocation to Redis: {e}")
+
 
 async def is_token_revoked(token: str) -> bool:
-    """Check if a JWT token is blacklisted"""
-    async with SessionLocal() as db:
-        payload = jwt.decode(
-            token,
-            options={"verify_signature": False, "verify_exp": False},
-            algorithms=["HS256"],
-        )
-        jti = payload.get("jti")
+    """
+    Check if a JWT token is blacklisted.
+    Answered from the Redis revocation cache when possible; Postgres is only
+    consulted when the cache cannot rule the token in or out.
+    """
+    payload = jwt.decode(
+        token,
+        options={"verify_signature": False, "verify_exp": False},
+        algorithms=["HS256"],
+    )
+    jti = payload.get("jti")
+
+    if not jti:
+        return False
 
-        if not jti:
-            return False
+    cached = await revocation_cache.is_revoked(jti)
+    if cached is not None:
+        return cached
 
+    async with SessionLocal() as db:
         stmt = select(BlacklistToken).filter_by(token=jti)
         result = await db.execute(stmt)
 
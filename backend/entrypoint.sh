@@ -5,8 +5,16 @@ set -e
 echo "Applying database migrations via Alembic..."
 alembic upgrade head
 
+echo "Building the compact airport dataset..."
+python -m app.services.search.airport_index
+
+echo "Seeding the place-resolution cache from airport cities..."
+python -m app.services.search.place_cache
+
 echo "Executing test suite..."
 pytest
 
 echo "Starting Uvicorn server..."
-exec uvicorn app.main:app --host 0.0.0.0 --port 5000 --workers 1
\ No newline at end of file
+# Client addresses come from X-Forwarded-For, trusted only from the gateway.
+exec uvicorn app.main:app --host 0.0.0.0 --port 5000 --workers 1 \
+    --proxy-headers --forwarded-allow-ips "${FORWARDED_ALLOW_IPS:-127.0.0.1}"
\ No newline at end of file
@@ -0,0 +1,98 @@
+"""
+Measures itinerary template rendering against full PDF generation per timeline size.
+
+    python -m stress_tests.bench_pdf_templates [--pdf]
+"""
+
+import argparse
+import time
+
+from app.services.email.itinerary_layout import build_itinerary_html
+
+TIMELINE_SIZES = [(1, 4), (3, 6), (7, 8), (14, 10)]
+
+
+def make_payload(days: int, events_per_day: int) -> dict:
+    timeline = []
+    for d in range(days):
+        events = []
+        for e in range(events_per_day):
+            events.append(
+                {
+                    "id": f"poi_{d}_{e}",
+                    "type": "meal" if e % 4 == 3 else "attraction",
+                    "name": f"Attraction {d}.{e}",
+                    "formatted_address": "Piazza del Colosseo, 1, Rome",
+                    "description": "A landmark worth the visit. " * 8,
+                    "needs_reservation": e % 3 == 0,
+                    "start_time": "10:00",
+                    "end_time": "11:30",
+                    "transit_path": {
+                        "duration_mins": 18,
+                        "distance_text": "3.2 km",
+                        "steps": [
+                            {"instruction": "Walk to Colosseo", "duration_mins": 4},
+                            {
+                                "instruction": "Metro B towards Rebibbia",
+                                "duration_mins": 14,
+                                "transit_detail": {"line_name": "B"},
+                            },
+                        ],
+                    },
+                }
+            )
+        timeline.append(
+            {"day_index": d, "date": f"2026-05-{d + 1:02d}", "events": events}
+        )
+
+    return {
+        "id": "bench",
+        "destination": "Rome, Italy",
+        "origin": "Bucharest, Romania",
+        "from_date": "2026-05-01",
+        "to_date": f"2026-05-{days:02d}",
+        "adults": 2,
+        "flight_price": 231.5,
+        "accommodation_price": 780.0,
+        "itinerary_data": {"meta": {"currency": "EUR"}, "timeline": timeline},
+    }
+
+
+def timed(fn, payload, repeat: int) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn(payload)
+    return (time.perf_counter() - start) / repeat * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--pdf", action="store_true", help="also time WeasyPrint")
+    parser.add_argument("--repeat", type=int, default=50)
+    args = parser.parse_args()
+
+    if args.pdf:
+        from app.services.email.pdf_builder import generate_itinerary_pdf
+
+    build_itinerary_html(make_payload(1, 1))  # compile the template once
+
+    print(f"{'days':>5} {'events':>7} {'template_ms':>12} {'pdf_ms':>9} {'share':>7}")
+    for days, per_day in TIMELINE_SIZES:
+        payload = make_payload(days, per_day)
+        template_ms = timed(build_itinerary_html, payload, args.repeat)
+
+        pdf_ms = share = ""
+        if args.pdf:
+            pdf_total = timed(
+                generate_itinerary_pdf, payload, max(1, args.repeat // 10)
+            )
+            pdf_ms = f"{pdf_total:.1f}"
+            share = f"{template_ms / pdf_total:.1%}"
+
+        print(
+            f"{days:>5} {days * per_day:>7} {template_ms:>12.2f} {pdf_ms:>9} {share:>7}"
+        )
+
+
+if __name__ == "__main__":
+    main()
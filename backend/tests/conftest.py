@@ -1,6 +1,12 @@
 import pytest
 from unittest.mock import AsyncMock
-from app.core.database import langgraph_pool
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.core.database import Base, langgraph_pool
+
+DATABASE_URL = "sqlite:///:memory:"
 
 
 @pytest.fixture(scope="session", autouse=True)
@@ -11,3 +17,45 @@ def mock_global_langgraph_pool():
     """
     langgraph_pool.open = AsyncMock()
     langgraph_pool.close = AsyncMock()
+
+
+class AsyncSessionAdapter:
+    """Runs the AsyncSession calls of the code under test on a sync SQLite session."""
+
+    def __init__(self, session):
+        self.session = session
+
+    async def execute(self, stmt, *args, **kwargs):
+        return self.session.execute(stmt, *args, **kwargs)
+
+    def add(self, instance):
+        self.session.add(instance)
+
+    async def flush(self):
+        self.session.flush()
+
+    async def commit(self):
+        self.session.commit()
+
+    async def rollback(self):
+        self.session.rollback()
+
+    async def close(self):
+        pass
+
+
+@pytest.fixture(name="db_session")
+def fixture_db_session():
+    engine = create_engine(
+        DATABASE_URL, poolclass=StaticPool, connect_args={"check_same_thread": False}
+    )
+    Base.metadata.create_all(bind=engine)
+    session = sessionmaker(autocommit=False, autoflush=False, bind=engine)()
+    yield session
+    session.close()
+    Base.metadata.drop_all(bind=engine)
+
+
+@pytest.fixture(name="async_db")
+def fixture_async_db(db_session):
+    return AsyncSessionAdapter(db_session)
@@ -0,0 +1,69 @@
+import asyncio
+from datetime import datetime, timedelta
+
+from sqlalchemy import select
+
+from app.models.notifications import Notification
+from app.models.user import User
+from app.models.vacation_session import VacationSession
+from app.services.jobs.abandoned_sessions import (
+    ABANDON_AFTER,
+    detect_abandoned_sessions,
+)
+
+
+def add_session(db_session, user, destination, idle, is_active=True):
+    vacation = VacationSession(
+        user_id=user.id,
+        destination=destination,
+        is_active=is_active,
+        updated_at=datetime.now() - idle,
+    )
+    db_session.add(vacation)
+    db_session.flush()
+    return vacation
+
+
+def notifications(db_session) -> dict[str, Notification]:
+    rows = db_session.execute(select(Notification)).scalars()
+    return {row.event_key: row for row in rows}
+
+
+def test_flags_each_stale_active_session_once(db_session, async_db):
+    user = User(email="traveller@example.com", hashed_password="pwd")
+    db_session.add(user)
+    db_session.flush()
+
+    stale = ABANDON_AFTER + timedelta(hours=1)
+    rome = add_session(db_session, user, "Rome, Italy", stale)
+    unnamed = add_session(db_session, user, None, stale)
+    add_session(db_session, user, "Oslo, Norway", timedelta(hours=1))
+    add_session(db_session, user, "Lima, Peru", stale, is_active=False)
+    db_session.commit()
+
+    asyncio.run(detect_abandoned_sessions(async_db))
+    db_session.commit()
+
+    flagged = notifications(db_session)
+    assert set(flagged) == {f"abandon_{rome.id}", f"abandon_{unnamed.id}"}
+
+    alert = flagged[f"abandon_{rome.id}"]
+    assert alert.user_id == user.id
+    assert alert.category == "SESSION_ALERT"
+    assert alert.message == "Still thinking about Rome, Italy? Jump back in!"
+    assert alert.is_read is False
+    assert (
+        flagged[f"abandon_{unnamed.id}"].message
+        == "Still thinking about your trip? Jump back in!"
+    )
+
+    # Reruns leave existing notifications, including read ones, untouched.
+    alert.is_read = True
+    db_session.commit()
+
+    asyncio.run(detect_abandoned_sessions(async_db))
+    db_session.commit()
+
+    rerun = notifications(db_session)
+    assert set(rerun) == set(flagged)
+    assert rerun[f"abandon_{rome.id}"].is_read is True
@@ -0,0 +1,67 @@
+import pickle
+
+from app.core.airport_data import AirportTable
+from app.services.search.airport_index import AirportIndex, get_airport_index
+
+SAMPLE = {
+    "AAA": {"city": "Springfield", "name": "Springfield Municipal", "country": "US"},
+    "BBB": {"city": "Springfield", "name": "Springfield Intl", "country": "US"},
+    "CCC": {"city": "Springfield", "name": "Capital Airport", "country": "US"},
+    "DDD": {"city": "West Springfield", "name": "Barnes Field", "country": "US"},
+    "SPR": {"city": "Shelbyville", "name": "Shelbyville Airport", "country": "US"},
+}
+
+
+def codes(index, q):
+    return [r["code"] for r in index.search(q)]
+
+
+def test_score_tiers_match_legacy_ranking():
+    index = AirportIndex(SAMPLE)
+
+    assert codes(index, "springfield") == ["BBB", "CCC", "AAA", "DDD"]
+    assert codes(index, "spr") == ["SPR", "AAA", "BBB", "CCC", "DDD"]
+    assert codes(index, "barnes") == ["DDD"]
+
+
+def test_real_index_is_accent_insensitive_and_capped():
+    index = get_airport_index()
+
+    assert codes(index, "otp")[0] == "OTP"
+    assert "GRU" in codes(index, "são paulo")
+    assert len(index.search("sa")) == 15
+
+
+def test_city_resolution_handles_accents_metro_codes_and_country_names():
+    index = get_airport_index()
+
+    paris = {a["iata"] for a in index.airports_for("Paris", "France")}
+    assert {"CDG", "ORY"} <= paris
+    assert {a["iata"] for a in index.airports_for("São Paulo")} == {
+        a["iata"] for a in index.airports_for("sao paulo")
+    }
+    assert index.parse_iata_list("LON, otp")[:2] == ["LHR", "LGW"]
+    assert "OTP" in index.parse_iata_list("LON, otp")
+    assert index.parse_iata_list("Paris, FR") is None
+    assert index.currency_for_country("RO") == "RON"
+
+
+def test_columnar_table_and_pickled_index_match_a_fresh_build():
+    rows = {
+        code: dict(data, iata=code, lat=1.5, lon=-2.0) for code, data in SAMPLE.items()
+    }
+    table = AirportTable.from_rows(rows)
+    restored = AirportIndex(
+        table, pickle.loads(pickle.dumps(AirportIndex(table).state()))
+    )
+
+    assert table["BBB"]["name"] == "Springfield Intl"
+    assert table["BBB"]["lat"] == 1.5
+    assert "ZZZ" not in table
+    for q in ("springfield", "spr", "barnes", "field"):
+        assert codes(restored, q) == codes(AirportIndex(SAMPLE), q)
+    assert [a["iata"] for a in restored.airports_for("springfield")] == [
+        "AAA",
+        "BBB",
+        "CCC",
+    ]
@@ -0,0 +1,98 @@
+import asyncio
+
+from sqlalchemy.dialects import postgresql
+
+from app.models.global_attraction import GlobalAttraction
+from app.services.search import attraction_metrics
+from app.services.search.attraction_metrics import (
+    FLUSHING_METRICS_PREFIX,
+    PENDING_METRICS_KEY,
+    _parse_buffer,
+)
+
+
+def test_parse_buffer_groups_fields_and_skips_unknown_ones():
+    raw = {
+        "12:search_count": "3",
+        "12:must_count": "-1",
+        "7:want_count": "2",
+        "7:relevance_score": "9",
+        "abc:search_count": "1",
+        "garbage": "4",
+    }
+
+    assert _parse_buffer(raw) == {
+        12: {"search_count": 3, "must_count": -1},
+        7: {"want_count": 2},
+    }
+
+
+def test_metric_deltas_become_one_clamped_update():
+    stmt = GlobalAttraction.apply_metric_deltas_stmt(
+        {12: {"search_count": 3}, 7: {"must_count": -1}}
+    )
+    compiled = stmt.compile(
+        dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True}
+    )
+    sql = str(compiled)
+
+    assert sql.count("UPDATE global_attractions") == 1
+    assert "(VALUES (12, 3, 0, 0, 0), (7, 0, -1, 0, 0))" in sql
+    assert "greatest(global_attractions.search_count + deltas.search_count, 0)" in sql
+    assert "relevance_score=" in sql
+
+
+class FakePipeline:
+    def __init__(self, redis):
+        self.redis = redis
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    def hincrby(self, key, field, n):
+        bucket = self.redis.hashes.setdefault(key, {})
+        bucket[field] = str(int(bucket.get(field, 0)) + n)
+
+    def delete(self, key):
+        self.redis.hashes.pop(key, None)
+
+    async def execute(self):
+        return []
+
+
+class FakeRedis:
+    def __init__(self, hashes):
+        self.hashes = hashes
+
+    async def scan_iter(self, match):
+        for key in list(self.hashes):
+            if key.startswith(match.rstrip("*")):
+                yield key
+
+    async def hgetall(self, key):
+        return dict(self.hashes.get(key, {}))
+
+    def pipeline(self, transaction=True):
+        return FakePipeline(self)
+
+
+def test_orphaned_flushing_buffers_are_merged_back_into_pending(monkeypatch):
+    fake = FakeRedis(
+        {
+            PENDING_METRICS_KEY: {"12:search_count": "1"},
+            f"{FLUSHING_METRICS_PREFIX}dead": {
+                "12:search_count": "4",
+                "7:want_count": "2",
+            },
+        }
+    )
+    monkeypatch.setattr(attraction_metrics, "r", fake)
+
+    asyncio.run(attraction_metrics._recover_orphaned_buffers())
+
+    assert fake.hashes == {
+        PENDING_METRICS_KEY: {"12:search_count": "5", "7:want_count": "2"}
+    }
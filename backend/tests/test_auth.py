@@ -11,6 +11,7 @@ from app.core.database import get_db, Base
 from app.models.user import User
 from app.models.vacation_session import VacationSession
 from app.core.auth import auth, refresh_token_cookie
+from app.utils.security import get_password_hash_async, verify_password
 
 DATABASE_URL = "sqlite:///:memory:"
 
@@ -153,3 +154,10 @@ def test_vacation_session_isolation(db_session):
         assert patch_response.json()["detail"] == "Session not found"
 
     app.dependency_overrides.clear()
+
+
+def test_password_hashing_survives_repeated_lifespans():
+    for _ in range(2):
+        with TestClient(app) as client:
+            hashed = client.portal.call(get_password_hash_async, "SecurePassword123!")
+            assert verify_password("SecurePassword123!", hashed)
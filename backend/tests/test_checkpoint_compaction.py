@@ -0,0 +1,159 @@
+import importlib.util
+import operator
+import os
+from pathlib import Path
+from typing import Annotated
+
+import pytest
+from alembic.migration import MigrationContext
+from alembic.operations import Operations
+from langgraph.checkpoint.postgres import PostgresSaver
+from langgraph.graph import END, START, StateGraph
+from sqlalchemy import create_engine, text
+from sqlalchemy.engine import make_url
+from typing_extensions import TypedDict
+
+# The procedure is PL/pgSQL with COMMITs between batches, so it only runs on a
+# real server. Point this at a scratch database: the checkpoint tables are
+# created and dropped by the fixture.
+TEST_DATABASE_URL = os.getenv("TEST_DATABASE_URL")
+
+MIGRATION = (
+    Path(__file__).resolve().parents[1]
+    / "alembic"
+    / "versions"
+    / "c7d2e5a1f834_add_checkpoint_compaction_job.py"
+)
+CHECKPOINT_TABLES = (
+    "checkpoint_writes",
+    "checkpoint_blobs",
+    "checkpoints",
+    "checkpoint_migrations",
+)
+KEEP_LATEST = 4
+BATCH_SIZE = 2
+
+pytestmark = pytest.mark.skipif(
+    not TEST_DATABASE_URL, reason="TEST_DATABASE_URL is not set"
+)
+
+
+class CounterState(TypedDict):
+    count: int
+    log: Annotated[list[int], operator.add]
+
+
+def step(state: CounterState) -> dict:
+    return {"count": state["count"] + 1, "log": [state["count"]]}
+
+
+def build_graph(checkpointer):
+    builder = StateGraph(CounterState)
+    builder.add_node("step", step)
+    builder.add_edge(START, "step")
+    builder.add_edge("step", END)
+    return builder.compile(checkpointer=checkpointer)
+
+
+def load_migration():
+    spec = importlib.util.spec_from_file_location("compaction_migration", MIGRATION)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def thread_config(thread_id: str) -> dict:
+    return {"configurable": {"thread_id": thread_id}}
+
+
+def count_rows(conn, table: str, thread_id: str) -> int:
+    return conn.execute(
+        text(f"SELECT COUNT(*) FROM {table} WHERE thread_id = :thread_id"),
+        {"thread_id": thread_id},
+    ).scalar_one()
+
+
+@pytest.fixture(name="pg")
+def fixture_pg():
+    url = make_url(TEST_DATABASE_URL)
+    engine = create_engine(
+        url.set(drivername="postgresql+psycopg"), isolation_level="AUTOCOMMIT"
+    )
+    dsn = url.set(drivername="postgresql").render_as_string(hide_password=False)
+
+    with PostgresSaver.from_conn_string(dsn) as saver:
+        saver.setup()
+        with engine.connect() as conn:
+            with Operations.context(MigrationContext.configure(conn)):
+                load_migration().create_compaction_objects()
+
+        yield engine, saver
+
+    with engine.connect() as conn:
+        conn.execute(
+            text("DROP PROCEDURE IF EXISTS compact_checkpoints(INTEGER, INTEGER)")
+        )
+        conn.execute(text("DROP TABLE IF EXISTS checkpoint_compaction_runs"))
+        for table in CHECKPOINT_TABLES:
+            conn.execute(text(f"DROP TABLE IF EXISTS {table}"))
+    engine.dispose()
+
+
+def test_compaction_keeps_latest_checkpoints_and_their_state(pg):
+    engine, saver = pg
+    graph = build_graph(saver)
+    busy, quiet = thread_config("itinerary_1"), thread_config("itinerary_2")
+
+    graph.invoke({"count": 0, "log": []}, busy)
+    for _ in range(5):
+        graph.invoke({"log": [-1]}, busy)
+    graph.invoke({"count": 0, "log": []}, quiet)
+
+    kept_states = [s.values for s in graph.get_state_history(busy, limit=KEEP_LATEST)]
+    quiet_states = [s.values for s in graph.get_state_history(quiet)]
+
+    with engine.connect() as conn:
+        busy_checkpoints = count_rows(conn, "checkpoints", "itinerary_1")
+        busy_blobs = count_rows(conn, "checkpoint_blobs", "itinerary_1")
+        quiet_rows = {
+            table: count_rows(conn, table, "itinerary_2")
+            for table in ("checkpoints", "checkpoint_writes", "checkpoint_blobs")
+        }
+        assert busy_checkpoints > KEEP_LATEST
+        assert quiet_rows["checkpoints"] <= KEEP_LATEST
+
+        conn.execute(text(f"CALL compact_checkpoints({KEEP_LATEST}, {BATCH_SIZE})"))
+
+        assert count_rows(conn, "checkpoints", "itinerary_1") == KEEP_LATEST
+        assert count_rows(conn, "checkpoint_blobs", "itinerary_1") < busy_blobs
+        assert (
+            conn.execute(
+                text(
+                    "SELECT COUNT(*) FROM checkpoint_writes w "
+                    "WHERE w.thread_id = 'itinerary_1' AND w.checkpoint_id < "
+                    "(SELECT MIN(checkpoint_id) FROM checkpoints "
+                    "WHERE thread_id = 'itinerary_1')"
+                )
+            ).scalar_one()
+            == 0
+        )
+        assert {
+            table: count_rows(conn, table, "itinerary_2") for table in quiet_rows
+        } == quiet_rows
+
+        run = conn.execute(
+            text("SELECT * FROM checkpoint_compaction_runs ORDER BY id DESC LIMIT 1")
+        ).one()
+
+    # Every kept checkpoint still resolves to the same state, so no blob it
+    # references was removed.
+    assert [s.values for s in graph.get_state_history(busy)] == kept_states
+    assert graph.get_state(busy).values == kept_states[0]
+    assert [s.values for s in graph.get_state_history(quiet)] == quiet_states
+
+    assert run.finished_at is not None
+    assert run.kept_per_thread == KEEP_LATEST
+    assert run.threads_compacted == 1
+    assert run.checkpoints_deleted == busy_checkpoints - KEEP_LATEST
+    assert run.blobs_deleted > 0
+    assert run.bytes_freed > 0
@@ -0,0 +1,39 @@
+from langgraph.checkpoint.serde.jsonplus import JsonPlusSerializer
+from app.core.checkpoint_serde import CompressedSerializer
+
+
+def build_schedule():
+    polyline = "a~l~Fjk~uOwHJy@P" * 100
+    leg = {
+        "mode": "walking",
+        "polyline": polyline,
+        "alternatives": {"walking": {"polyline": polyline, "duration_mins": 12}},
+    }
+    return [
+        {
+            "day_index": day,
+            "events": [
+                {"id": i, "type": "attraction", "transit_leg": leg} for i in range(5)
+            ],
+        }
+        for day in range(3)
+    ]
+
+
+def test_roundtrip_compresses_and_deduplicates():
+    serde = CompressedSerializer()
+    schedule = build_schedule()
+
+    typ, data = serde.dumps_typed(schedule)
+
+    assert typ == "msgpack+cas+zstd"
+    assert len(data) < len(JsonPlusSerializer().dumps_typed(schedule)[1]) / 10
+    assert serde.loads_typed((typ, data)) == schedule
+
+
+def test_reads_checkpoints_written_by_default_serializer():
+    serde = CompressedSerializer()
+    legacy = JsonPlusSerializer().dumps_typed({"stage": 2, "pace": "Moderate"})
+
+    assert serde.loads_typed(legacy) == {"stage": 2, "pace": "Moderate"}
+    assert serde.dumps_typed(None) == ("null", b"")
@@ -0,0 +1,63 @@
+import asyncio
+from datetime import datetime, timedelta, timezone
+
+
+from app.models.delivery_job import DeliveryJob, DeliveryStatus
+from app.services.email.pdf_cache import pdf_content_hash
+from app.services.delivery.queue import (
+    BLUEPRINT_EMAIL,
+    RETRY_BASE_SECONDS,
+    RETRY_MAX_SECONDS,
+    STALE_LOCK_MINUTES,
+    claim_jobs,
+    retry_delay,
+)
+
+
+def test_retry_delay_backs_off_exponentially_with_cap():
+    first = retry_delay(1).total_seconds()
+    third = retry_delay(3).total_seconds()
+    last = retry_delay(20).total_seconds()
+
+    assert 0.8 * RETRY_BASE_SECONDS <= first <= 1.2 * RETRY_BASE_SECONDS
+    assert 0.8 * 4 * RETRY_BASE_SECONDS <= third <= 1.2 * 4 * RETRY_BASE_SECONDS
+    assert last <= 1.2 * RETRY_MAX_SECONDS
+
+
+def test_pdf_hash_is_stable_across_key_order():
+    a = {"destination": "Rome, Italy", "itinerary_data": {"timeline": [], "meta": {}}}
+    b = {"itinerary_data": {"meta": {}, "timeline": []}, "destination": "Rome, Italy"}
+
+    assert pdf_content_hash(a) == pdf_content_hash(b)
+    assert pdf_content_hash(a) != pdf_content_hash({**a, "adults": 2})
+
+
+def test_stale_jobs_are_reclaimed_until_attempts_run_out(db_session, async_db):
+    stale_since = datetime.now(timezone.utc) - timedelta(minutes=STALE_LOCK_MINUTES + 1)
+
+    def job(attempts):
+        return DeliveryJob(
+            kind=BLUEPRINT_EMAIL,
+            user_id="user-1",
+            payload={},
+            status=DeliveryStatus.RUNNING,
+            attempts=attempts,
+            max_attempts=3,
+            locked_at=stale_since,
+            run_after=stale_since,
+        )
+
+    retryable, poisoned = job(attempts=2), job(attempts=3)
+    db_session.add_all([retryable, poisoned])
+    db_session.commit()
+
+    claimed = asyncio.run(claim_jobs(async_db, limit=10))
+    db_session.commit()
+    db_session.expire_all()
+
+    assert [j.id for j in claimed] == [retryable.id]
+    assert retryable.attempts == 3
+    assert retryable.status == DeliveryStatus.RUNNING
+    assert poisoned.status == DeliveryStatus.FAILED
+    assert poisoned.locked_at is None
+    assert poisoned.last_error
@@ -0,0 +1,37 @@
+import asyncio
+
+from app.services.search import flight_prefetch, flights
+
+
+def test_prefetch_is_bounded_and_joined_by_the_inbound_route(monkeypatch):
+    calls = []
+    running = 0
+    peak = 0
+
+    async def fake_call_flights_api(**kwargs):
+        nonlocal running, peak
+        calls.append(kwargs["departure_token"])
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+        return {"best_flights": [{"booking_token": kwargs["departure_token"]}]}
+
+    monkeypatch.setattr(flights, "call_flights_api", fake_call_flights_api)
+    params = {"departure_id": "OTP", "arrival_id": "CDG"}
+
+    async def scenario():
+        prefetch = asyncio.create_task(
+            flight_prefetch.prefetch_inbound(params, ["t1", "t2", "t3", "t4"])
+        )
+        await asyncio.sleep(0)
+        picked = await flight_prefetch.fetch_inbound(params, "t2")
+        await prefetch
+        return picked
+
+    picked = asyncio.run(scenario())
+
+    assert picked == {"best_flights": [{"booking_token": "t2"}]}
+    assert sorted(calls) == ["t1", "t2", "t3"]
+    assert peak == flight_prefetch.PREFETCH_CONCURRENCY
+    assert flight_prefetch._pending == {}
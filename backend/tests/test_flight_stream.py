@@ -0,0 +1,112 @@
+import asyncio
+import json
+
+import httpx
+
+from app.routers.search import flight_option_lines
+from app.services.search import flights
+from app.services.search import serpapi_client as serpapi_module
+
+
+def flight(token, price):
+    return {
+        "departure_token": token,
+        "price": price,
+        "flights": [
+            {
+                "airline": "TAROM",
+                "departure_airport": {
+                    "name": "Henri Coanda",
+                    "time": "2026-08-01 09:00",
+                },
+                "arrival_airport": {
+                    "name": "Charles de Gaulle",
+                    "time": "2026-08-01 11:30",
+                },
+                "duration": 210,
+            }
+        ],
+    }
+
+
+async def upstream(flights):
+    for f in flights:
+        yield f
+
+
+def collect_lines(flights, tokens=None):
+    async def collect():
+        return [
+            line async for line in flight_option_lines(upstream(flights), "EUR", tokens)
+        ]
+
+    return asyncio.run(collect())
+
+
+def test_stream_sends_best_flights_first_one_line_each():
+    flights = [flight("b1", 120), flight(None, 99)] + [
+        flight(f"o{i}", 200 + i) for i in range(15)
+    ]
+    tokens = []
+
+    lines = collect_lines(flights, tokens)
+    options = [json.loads(line) for line in lines]
+
+    assert all(line.endswith("\n") for line in lines)
+    assert [o["token"] for o in options] == ["b1"] + [f"o{i}" for i in range(10)]
+    assert tokens == [o["token"] for o in options]
+    assert options[0]["flights"][0]["duration"] == "210"
+    assert options[0]["currency"] == "EUR"
+
+
+def test_empty_search_ends_with_an_error_line():
+    assert [json.loads(line) for line in collect_lines([])] == [
+        {"error": "No flights found"}
+    ]
+
+
+def test_flights_are_yielded_before_the_body_finishes(monkeypatch):
+    body = json.dumps(
+        {
+            "search_metadata": {"id": "abc"},
+            "best_flights": [flight("b1", 120)],
+            "other_flights": [flight("o1", 200)],
+            "price_insights": {"lowest_price": 120},
+        }
+    ).encode()
+    split = body.index(b'"other_flights"')
+    events = []
+
+    async def chunks():
+        events.append("chunk 1")
+        yield body[:split]
+        events.append("chunk 2")
+        yield body[split:]
+
+    def handler(request):
+        return httpx.Response(200, content=chunks())
+
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    monkeypatch.setattr(serpapi_module, "get_http_client", lambda: client)
+    cached = {}
+
+    async def cache_get(key):
+        return None
+
+    async def cache_set(key, expire_time, result):
+        cached[key] = result
+
+    monkeypatch.setattr(flights, "cache_get", cache_get)
+    monkeypatch.setattr(flights, "cache_set", cache_set)
+    monkeypatch.setattr(
+        flights, "serpapi_client", serpapi_module.SerpApiClient("key-a")
+    )
+
+    async def consume():
+        async for f in flights.stream_flights_api(departure_id="OTP", arrival_id="CDG"):
+            events.append(f["departure_token"])
+
+    asyncio.run(consume())
+
+    assert events == ["chunk 1", "b1", "chunk 2", "o1"]
+    assert list(cached.values())[0]["price_insights"] == {"lowest_price": 120}
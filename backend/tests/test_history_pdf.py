@@ -0,0 +1,103 @@
+import asyncio
+
+import pytest
+from authx import TokenPayload
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import select
+
+from app.core.auth import access_token_header
+from app.core.database import get_db
+from app.models.delivery_job import DeliveryJob
+from app.models.user import User
+from app.models.vacation import Vacation
+from app.routers.history import etag_matches, router
+from app.services.delivery.queue import PDF_RENDER
+from app.services.email.pdf_cache import get_or_render_pdf
+
+PDF_BYTES = b"%PDF-1.7 itinerary"
+
+
+@pytest.fixture(name="client")
+def fixture_client(db_session, async_db):
+    user = User(email="traveller@example.com", hashed_password="pwd")
+    db_session.add(user)
+    db_session.flush()
+    user_id = user.id
+    db_session.add(
+        Vacation(id="v1", user_id=user_id, destination="Rome, Italy", is_finalized=True)
+    )
+    db_session.commit()
+
+    async def override_get_db():
+        yield async_db
+
+    async def override_token():
+        return TokenPayload(sub=user_id)
+
+    app = FastAPI()
+    app.include_router(router)
+    app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[access_token_header] = override_token
+
+    with TestClient(app) as client:
+        yield client
+
+
+def render_jobs(db_session) -> list[DeliveryJob]:
+    db_session.expire_all()
+    stmt = select(DeliveryJob).where(DeliveryJob.kind == PDF_RENDER)
+    return list(db_session.execute(stmt).scalars())
+
+
+def test_etag_matching_follows_if_none_match_rules():
+    etag = '"abc"'
+
+    assert etag_matches('"abc"', etag)
+    assert etag_matches('W/"abc"', etag)
+    assert etag_matches('"xyz", W/"abc"', etag)
+    assert etag_matches(" * ", etag)
+    assert not etag_matches(None, etag)
+    assert not etag_matches('"abcd"', etag)
+    assert not etag_matches('"xyz", "ab"', etag)
+    # A substring of the header is not a match.
+    assert not etag_matches('"xabc"', etag)
+
+
+def test_pdf_is_queued_for_the_worker_then_served_and_revalidated(
+    client, db_session, async_db
+):
+    url = "/history/vacations/v1/pdf"
+
+    # Nothing rendered yet: the API queues one render job instead of rendering.
+    for _ in range(2):
+        pending = client.get(url)
+        assert pending.status_code == 202
+        assert pending.headers["Retry-After"]
+    jobs = render_jobs(db_session)
+    assert len(jobs) == 1
+
+    # What the delivery worker does with the job.
+    async def render(payload):
+        return PDF_BYTES
+
+    asyncio.run(get_or_render_pdf(async_db, jobs[0].payload["vacation"], render))
+
+    first = client.get(url)
+    assert first.status_code == 200
+    assert first.content == PDF_BYTES
+    assert first.headers["content-type"] == "application/pdf"
+    etag = first.headers["ETag"]
+    assert etag == f'"{jobs[0].payload["content_hash"]}"'
+
+    for if_none_match in (etag, f"W/{etag}", f'"stale", {etag}', "*"):
+        revalidated = client.get(url, headers={"If-None-Match": if_none_match})
+        assert revalidated.status_code == 304
+        assert revalidated.headers["ETag"] == etag
+        assert revalidated.content == b""
+
+    changed = client.get(url, headers={"If-None-Match": '"stale"'})
+    assert changed.status_code == 200
+    assert changed.content == PDF_BYTES
+
+    assert client.get("/history/vacations/missing/pdf").status_code == 404
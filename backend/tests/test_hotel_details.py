@@ -0,0 +1,37 @@
+import asyncio
+
+from app.services.search import accommodations_v2, hotel_details
+
+
+def test_details_are_fetched_in_order_with_bounded_concurrency(monkeypatch):
+    running = 0
+    peak = 0
+
+    async def fake_get_hotel_details(**params):
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+        if params["hotel_id"] == "bad":
+            raise RuntimeError("RapidAPI timed out")
+        return {"status": True, "data": {"hotel_id": params["hotel_id"]}}
+
+    monkeypatch.setattr(accommodations_v2, "get_hotel_details", fake_get_hotel_details)
+    ids = ["h1", "bad", "h3", "h4", "h5", "h6"]
+
+    results = asyncio.run(
+        hotel_details.fetch_hotel_details_many(
+            [{"hotel_id": hotel_id} for hotel_id in ids], concurrency=2
+        )
+    )
+
+    assert peak == 2
+    assert results[1] is None
+    assert [r["data"]["hotel_id"] for r in results if r] == [
+        "h1",
+        "h3",
+        "h4",
+        "h5",
+        "h6",
+    ]
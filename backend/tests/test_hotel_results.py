@@ -0,0 +1,88 @@
+import pytest
+
+from app.services.search import hotel_results
+
+CENTER = {"lat": 48.8566, "lon": 2.3522}
+
+
+def hotel(hotel_id, price, score, stars, lat, lon):
+    return {
+        "hotel_id": hotel_id,
+        "property": {
+            "name": f"Hotel {hotel_id}",
+            "latitude": lat,
+            "longitude": lon,
+            "priceBreakdown": {"grossPrice": {"value": price, "currency": "EUR"}},
+            "reviewScore": score,
+            "propertyClass": stars,
+            "checkin": {"fromTime": "15:00", "untilTime": "23:00"},
+        },
+    }
+
+
+HOTELS = hotel_results.add_distances(
+    [
+        hotel_results.normalize_hotel(h)
+        for h in (
+            hotel(1, 180.456, 9.1, 4, 48.8606, 2.3376),
+            hotel(2, 95.0, 7.8, 3, 48.8900, 2.3500),
+            hotel(3, 240.0, None, 5, 48.8570, 2.3525),
+            hotel(4, 120.0, 8.6, 3, 48.7000, 2.2000),
+        )
+    ],
+    CENTER,
+)
+
+
+def ids(hotels):
+    return [h["hotel_id"] for h in hotels]
+
+
+def test_distances_are_only_needed_for_distance_views():
+    plain = [hotel_results.normalize_hotel(hotel(5, 99.0, 8.0, 3, 48.86, 2.35))]
+
+    assert not hotel_results.has_distances(plain)
+    assert hotel_results.has_distances(HOTELS)
+    assert not hotel_results.needs_distances("price", None)
+    assert hotel_results.needs_distances("distance", None)
+    assert hotel_results.needs_distances("review", 5.0)
+
+
+def test_normalized_hotels_sort_and_filter_in_memory():
+    assert HOTELS[0]["price"] == 180.46
+    assert HOTELS[0]["checkin_time_range"] == "15:00 - 23:00"
+    assert HOTELS[2]["distance_km"] < 0.1
+
+    assert ids(hotel_results.apply_view(HOTELS)) == ["2", "4", "1", "3"]
+    assert ids(hotel_results.apply_view(HOTELS, "review")) == ["1", "4", "2", "3"]
+    assert ids(hotel_results.apply_view(HOTELS, "distance"))[:2] == ["3", "1"]
+    assert ids(hotel_results.apply_view(HOTELS, max_price=200, min_review_score=8)) == [
+        "4",
+        "1",
+    ]
+    assert ids(hotel_results.apply_view(HOTELS, min_stars=4, max_distance_km=5)) == [
+        "1",
+        "3",
+    ]
+
+
+def test_cursor_pages_through_one_view_only():
+    view = {"sort": "price"}
+    sorted_hotels = hotel_results.apply_view(HOTELS)
+
+    first = hotel_results.paginate(sorted_hotels, "fp", view, limit=3)
+    second = hotel_results.paginate(
+        sorted_hotels, "fp", view, first["next_cursor"], limit=3
+    )
+
+    assert ids(first["items"]) == ["2", "4", "1"]
+    assert ids(second["items"]) == ["3"]
+    assert second["next_cursor"] is None
+    assert first["total"] == second["total"] == 4
+
+    with pytest.raises(hotel_results.InvalidCursor):
+        hotel_results.paginate(
+            sorted_hotels, "fp", {"sort": "review"}, first["next_cursor"]
+        )
+    with pytest.raises(hotel_results.InvalidCursor):
+        hotel_results.paginate(sorted_hotels, "fp", view, "not-a-cursor")
@@ -0,0 +1,29 @@
+from app.services.email.itinerary_layout import build_itinerary_html
+
+
+def test_itinerary_html_renders_days_and_escapes_content():
+    payload = {
+        "destination": "Rome, Italy",
+        "itinerary_data": {
+            "timeline": [
+                {
+                    "day_index": 0,
+                    "date": "2026-05-01",
+                    "events": [
+                        {"id": "arr_airport", "name": "Arrival"},
+                        {"id": 7, "name": "Trevi <Fountain>", "transit_mins": 5},
+                        {"id": 8, "type": "meal", "name": "Lunch"},
+                    ],
+                }
+            ]
+        },
+    }
+
+    html = build_itinerary_html(payload)
+
+    assert "Arrival Day" in html
+    assert "Friday, May 01" in html
+    assert "Trevi &lt;Fountain&gt;" in html
+    assert html.count('class="ov-event card-') == 3
+    assert "card-logistics" in html and "card-meal" in html
+    assert "5m Local Area Transit" in html
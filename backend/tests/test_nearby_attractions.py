@@ -0,0 +1,122 @@
+import asyncio
+import math
+import random
+from contextlib import asynccontextmanager
+from unittest.mock import AsyncMock
+
+import h3
+import pytest
+
+from app.models.global_attraction import GlobalAttraction, H3_RESOLUTION
+from app.services.search.nearby_attractions import (
+    _cells_within,
+    find_nearest_attractions,
+)
+from app.utils.generic import haversine_km
+
+BUCHAREST = (44.4268, 26.1025)
+HOTEL = (41.8986, 12.4769)
+
+
+def test_spatial_cell_matches_h3_resolution():
+    cell = GlobalAttraction.spatial_cell(*BUCHAREST)
+
+    assert h3.get_resolution(cell) == H3_RESOLUTION
+    assert GlobalAttraction.spatial_cell(None, BUCHAREST[1]) is None
+
+
+def test_radius_cells_cover_every_point_in_radius():
+    radius_km = 15
+    cells = set(_cells_within(*BUCHAREST, radius_km))
+
+    for bearing in range(0, 360, 15):
+        for fraction in (0.25, 0.5, 0.75, 0.99):
+            d = radius_km * fraction
+            lat = BUCHAREST[0] + (d / 111.0) * math.cos(math.radians(bearing))
+            lon = BUCHAREST[1] + (
+                d / (111.0 * math.cos(math.radians(BUCHAREST[0])))
+            ) * math.sin(math.radians(bearing))
+
+            if haversine_km(*BUCHAREST, lat, lon) <= radius_km:
+                assert GlobalAttraction.spatial_cell(lat, lon) in cells
+
+
+def place_at(name: str, lat: float, lon: float, city: str = "Rome") -> GlobalAttraction:
+    return GlobalAttraction(
+        official_name=name,
+        city=city,
+        country="Italy",
+        latitude=lat,
+        longitude=lon,
+        h3_cell=GlobalAttraction.spatial_cell(lat, lon),
+        **GlobalAttraction.location_keys(city, "Italy"),
+    )
+
+
+def test_nearest_attractions_match_brute_force(db_session, async_db):
+    rng = random.Random(7)
+    places = [
+        place_at(
+            f"place-{i}",
+            HOTEL[0] + rng.uniform(-0.3, 0.3),
+            HOTEL[1] + rng.uniform(-0.4, 0.4),
+        )
+        for i in range(80)
+    ]
+    db_session.add_all(places)
+    db_session.commit()
+
+    by_distance = sorted(
+        (haversine_km(*HOTEL, p.latitude, p.longitude), p.official_name) for p in places
+    )
+    for k in (1, 5, 25):
+        nearest = asyncio.run(find_nearest_attractions(async_db, *HOTEL, k=k))
+
+        assert [p.official_name for p, _ in nearest] == [
+            name for _, name in by_distance[:k]
+        ]
+        assert [d for _, d in nearest] == pytest.approx([d for d, _ in by_distance[:k]])
+
+    # Nothing beyond the radius cap is returned, however many are asked for.
+    capped = asyncio.run(
+        find_nearest_attractions(async_db, *HOTEL, k=500, max_radius_km=5)
+    )
+    assert [p.official_name for p, _ in capped] == [
+        name for d, name in by_distance if d <= 5
+    ]
+
+
+def test_initial_fetch_uses_places_nearest_the_hotel(db_session, async_db, monkeypatch):
+    from app.services.agents import nodes
+
+    near = [
+        place_at(f"near-{i}", HOTEL[0] + 0.002 * i, HOTEL[1], city="Trastevere")
+        for i in range(12)
+    ]
+    far = place_at("far", HOTEL[0] + 0.5, HOTEL[1], city="Trastevere")
+    db_session.add_all(near + [far])
+    db_session.commit()
+
+    @asynccontextmanager
+    async def session_local():
+        yield async_db
+
+    async def no_city_center(*args):
+        raise AssertionError("the hotel anchors the lookup")
+
+    monkeypatch.setattr(nodes, "SessionLocal", session_local)
+    monkeypatch.setattr(nodes, "catalog_city_center", no_city_center)
+    monkeypatch.setattr(nodes, "record_search_hits", AsyncMock())
+
+    updates = asyncio.run(
+        nodes.picking_attractions(
+            {
+                "action": "initial_fetch",
+                "search_location": "Rome, Italy",
+                "trip_details": {"hotel_coords": HOTEL},
+            }
+        )
+    )
+
+    names = [poi["official_name"] for poi in updates["resolved_attractions"].value]
+    assert names == [f"near-{i}" for i in range(12)]
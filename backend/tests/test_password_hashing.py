@@ -0,0 +1,72 @@
+import asyncio
+import threading
+
+import bcrypt
+import pytest
+
+from app.core.password_hashing import HashingLimitExceeded, PasswordHashingPool
+
+
+def test_verify_runs_off_the_event_loop():
+    pool = PasswordHashingPool(workers=1)
+    hashed = bcrypt.hashpw(b"secret", bcrypt.gensalt(rounds=4))
+    loop_thread = threading.get_ident()
+
+    def check(password):
+        return threading.get_ident() != loop_thread and bcrypt.checkpw(password, hashed)
+
+    assert asyncio.run(pool.run(check, b"secret", ip="1.2.3.4"))
+    assert pool.stats()["calls"] == 1
+    pool.shutdown()
+
+
+def test_per_account_limit_rejects_extra_attempts():
+    pool = PasswordHashingPool(workers=1, per_account=1)
+    release = threading.Event()
+
+    async def scenario():
+        first = asyncio.create_task(pool.run(release.wait, account="user@example.com"))
+        await asyncio.sleep(0)
+
+        with pytest.raises(HashingLimitExceeded):
+            await pool.run(lambda: None, account="user@example.com")
+
+        # Other accounts are unaffected.
+        other = asyncio.create_task(pool.run(lambda: True, account="other@example.com"))
+        release.set()
+        await first
+        assert await other
+
+    asyncio.run(scenario())
+    pool.shutdown()
+
+
+def test_full_queue_rejects_instead_of_waiting():
+    pool = PasswordHashingPool(workers=1, max_pending=2)
+    release = threading.Event()
+
+    async def scenario():
+        queued = [
+            asyncio.create_task(pool.run(release.wait, ip=f"10.0.0.{i}"))
+            for i in range(2)
+        ]
+        await asyncio.sleep(0)
+
+        with pytest.raises(HashingLimitExceeded):
+            await pool.run(lambda: None, ip="10.0.0.9")
+
+        release.set()
+        await asyncio.gather(*queued)
+        assert await pool.run(lambda: True, ip="10.0.0.9")
+
+    asyncio.run(scenario())
+    pool.shutdown()
+
+
+def test_pool_serves_again_after_shutdown():
+    pool = PasswordHashingPool(workers=1)
+
+    assert asyncio.run(pool.run(lambda: 1))
+    pool.shutdown()
+    assert asyncio.run(pool.run(lambda: 2)) == 2
+    pool.shutdown()
@@ -0,0 +1,58 @@
+from app.core.airport_data import get_airports
+from app.services.search.place_cache import PlaceCache, airport_seed_entries, place_key
+
+AIRPORTS = {
+    "CDG": {"city": "Paris", "country": "FR"},
+    "ORY": {"city": "Paris", "country": "FR"},
+    "PRX": {"city": "Paris", "country": "US"},
+    "BHX": {"city": "Birmingham", "country": "GB"},
+    "BHM": {"city": "Birmingham", "country": "US"},
+    "GRU": {"city": "São Paulo", "country": "BR"},
+    "XXX": {"city": "", "country": "FR"},
+}
+
+
+def test_query_variants_share_one_key():
+    assert place_key("Paris, France") == place_key("paris,FR") == "paris|fr"
+    assert place_key("  PARIS ") == "paris"
+    assert place_key("Sao-Paulo, Brazil") == place_key("São Paulo, BR")
+
+
+def test_airport_seed_only_has_city_and_country_keys():
+    entries = airport_seed_entries(AIRPORTS)
+
+    assert entries == {
+        "paris|fr": "Paris, FR",
+        "paris|us": "Paris, US",
+        "birmingham|gb": "Birmingham, GB",
+        "birmingham|us": "Birmingham, US",
+        "sao paulo|br": "São Paulo, BR",
+    }
+
+
+def test_ambiguous_real_cities_are_left_to_nominatim():
+    entries = airport_seed_entries(get_airports())
+
+    assert entries["rome|it"] == "Rome, IT"
+    assert entries["dublin|ie"] == "Dublin, IE"
+    assert entries["rome|us"] == "Rome, US"
+    for city in ("rome", "dublin", "florence", "bali"):
+        assert city not in entries
+    assert all("|" in key for key in entries)
+
+
+def test_hot_set_merges_fields_and_evicts_least_recent():
+    cache = PlaceCache(hot_size=2)
+
+    cache.remember("paris|fr", {"label": "Paris, FR"})
+    cache.remember("rome|it", {"label": "Rome, IT"})
+    cache.get_hot("paris|fr")
+    cache.remember("paris|fr", {"latitude": 48.85, "longitude": 2.35})
+    cache.remember("oslo|no", {"label": "Oslo, NO"})
+
+    assert cache.get_hot("rome|it") is None
+    assert cache.get_hot("paris|fr") == {
+        "label": "Paris, FR",
+        "latitude": 48.85,
+        "longitude": 2.35,
+    }
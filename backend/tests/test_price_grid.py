@@ -0,0 +1,58 @@
+import asyncio
+from datetime import date, timedelta
+
+from app.services.search import flights, price_grid
+
+
+def day(offset: int) -> str:
+    return (date.today() + timedelta(days=offset)).isoformat()
+
+
+def test_grid_cells_skip_past_and_inverted_dates():
+    cells = price_grid.grid_cells(day(1), day(3), 2)
+
+    assert cells[0] == (day(1), day(3))
+    assert all(out >= day(0) for out, _ in cells)
+    assert all(ret >= out for out, ret in cells)
+    assert len(cells) == len(set(cells)) == 17
+    assert price_grid.grid_cells(day(10), None, 3)[:3] == [
+        (day(10), None),
+        (day(9), None),
+        (day(11), None),
+    ]
+
+
+def test_cells_stream_as_they_finish_with_bounded_concurrency(monkeypatch):
+    running = 0
+    peak = 0
+
+    async def fake_call_flights_api(**kwargs):
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        # Later outbound dates answer sooner, e.g. because they were cached.
+        await asyncio.sleep(0.05 - int(kwargs["outbound_date"][-2:]) % 5 * 0.01)
+        running -= 1
+        if kwargs["outbound_date"] == day(12):
+            raise RuntimeError("SerpAPI timed out")
+        return {
+            "best_flights": [{"price": 300}],
+            "other_flights": [{"price": 250}, {"price": None}],
+        }
+
+    monkeypatch.setattr(flights, "call_flights_api", fake_call_flights_api)
+    cells = price_grid.grid_cells(day(10), None, 3)
+
+    async def collect():
+        params = {"departure_id": "OTP", "outbound_date": None, "return_date": None}
+        return [
+            cell
+            async for cell in price_grid.stream_price_grid(params, cells, concurrency=3)
+        ]
+
+    streamed = asyncio.run(collect())
+
+    assert peak == 3
+    assert {c["outbound_date"] for c in streamed} == {out for out, _ in cells}
+    assert {c["price"] for c in streamed if c["outbound_date"] != day(12)} == {250}
+    assert next(c for c in streamed if c["outbound_date"] == day(12))["error"]
@@ -55,7 +55,7 @@ def fixture_db_session():
     Base.metadata.drop_all(bind=engine)
 
 
-def test_dynamic_relevance_rank_sql_generation(db_session):
+def build_bucharest_attractions():
     antipa = GlobalAttraction(
         official_name="Muzeul Antipa",
         city="Bucharest",
@@ -132,14 +132,28 @@ def test_dynamic_relevance_rank_sql_generation(db_session):
         created_at=datetime.datetime.now() - datetime.timedelta(days=180),
     )
 
-    db_session.add_all([
-        antipa, 
-        ateneu_roman, 
-        arcul_de_triumf, 
-        parcul_herastrau, 
-        palatul_parlamentului, 
-        carturesti_carusel
-    ])
+    return [
+        antipa,
+        ateneu_roman,
+        arcul_de_triumf,
+        parcul_herastrau,
+        palatul_parlamentului,
+        carturesti_carusel,
+    ]
+
+
+EXPECTED_ORDER = [
+    "Muzeul Antipa",
+    "Ateneul Roman",
+    "Parcul Herastrau",
+    "Arcul de Triumf",
+    "Carturesti Carusel",
+    "Palatul Parlamentului",
+]
+
+
+def test_dynamic_relevance_rank_sql_generation(db_session):
+    db_session.add_all(build_bucharest_attractions())
     db_session.commit()
 
     stmt = select(GlobalAttraction).order_by(
@@ -159,4 +173,18 @@ def test_dynamic_relevance_rank_sql_generation(db_session):
     
     assert results[4].official_name == "Carturesti Carusel"
     
-    assert results[5].official_name == "Palatul Parlamentului"
\ No newline at end of file
+    assert results[5].official_name == "Palatul Parlamentului"
+
+
+def test_materialized_relevance_score_matches_dynamic_rank(db_session):
+    db_session.add_all(build_bucharest_attractions())
+    db_session.commit()
+
+    db_session.execute(GlobalAttraction.refresh_relevance_scores_stmt())
+    db_session.commit()
+
+    stmt = select(GlobalAttraction).order_by(GlobalAttraction.relevance_score.desc())
+    results = db_session.execute(stmt).scalars().all()
+
+    assert [r.official_name for r in results] == EXPECTED_ORDER
+    assert all(r.relevance_score > 0 for r in results)
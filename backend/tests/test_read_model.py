@@ -0,0 +1,123 @@
+import asyncio
+
+import pytest
+from fastapi.encoders import jsonable_encoder
+from langgraph.checkpoint.memory import InMemorySaver
+
+from app.services.agents import itinerary_graph
+from app.services.agents.itinerary_graph import (
+    generate_graph,
+    load_itinerary_view,
+    run_itinerary_graph,
+)
+from app.services.agents.read_model import (
+    UI_KEYS,
+    get_itinerary_read_model,
+    invalidate_itinerary_read_model,
+    read_model_to_state,
+    sync_itinerary_read_model,
+)
+
+SESSION_ID = 7
+CONFIG = {"configurable": {"thread_id": f"itinerary_{SESSION_ID}"}}
+
+COLOSSEUM = {"id": 1, "bucket": "must", "time_to_spend": 120, "name": "Colosseum"}
+PANTHEON = {"id": 2, "bucket": "want", "time_to_spend": 45, "name": "Pantheon"}
+
+
+async def checkpoint_view(graph) -> dict:
+    state = await graph.aget_state(CONFIG)
+    return jsonable_encoder({k: state.values.get(k) for k in UI_KEYS})
+
+
+async def read_model_view(db) -> dict:
+    row = await get_itinerary_read_model(db, SESSION_ID)
+    db.session.expire_all()
+    return read_model_to_state(row)
+
+
+@pytest.fixture(name="stub_nodes")
+def fixture_stub_nodes(monkeypatch):
+    """Replaces the LLM-backed nodes with fixed state updates."""
+
+    async def initial_state(db, session_id):
+        return {"session_id": session_id, "search_location": "Rome, Italy"}
+
+    async def picking_attractions(state):
+        return {
+            "pois": [COLOSSEUM],
+            "resolved_attractions": [{"id": 1, "name": "Colosseum"}],
+        }
+
+    async def picking_transit(state):
+        return {"mobility_recommendation": {"mode": "transit"}}
+
+    monkeypatch.setattr(itinerary_graph, "get_initial_itinerary_state", initial_state)
+    monkeypatch.setattr(itinerary_graph, "picking_attractions", picking_attractions)
+    monkeypatch.setattr(itinerary_graph, "picking_transit", picking_transit)
+
+
+def test_read_model_tracks_checkpoint_through_graph_runs_and_router_writes(
+    async_db, stub_nodes
+):
+    db = async_db
+    checkpointer = InMemorySaver()
+    graph = generate_graph(checkpointer)
+
+    async def run(stage):
+        await run_itinerary_graph(SESSION_ID, "search", stage, None, db, checkpointer)
+
+    async def scenario():
+        await run(0)
+        assert await read_model_view(db) == await checkpoint_view(graph)
+
+        # The same write/sync pairs the itinerary router performs.
+        for update in (
+            {"pois": [COLOSSEUM, PANTHEON]},
+            {"pace": "Fast-Paced"},
+            {"mobility_config": {"mode": "transit", "max_walk_mins": 20}},
+            {"trip_details": {"start_time": "09:00", "end_time": "19:00"}},
+        ):
+            await graph.aupdate_state(CONFIG, update)
+            await sync_itinerary_read_model(db, SESSION_ID, update, partial=True)
+            assert await read_model_view(db) == await checkpoint_view(graph)
+
+        view = await load_itinerary_view(SESSION_ID, db, checkpointer)
+        assert view == await checkpoint_view(graph)
+        row = await get_itinerary_read_model(db, SESSION_ID)
+        assert row.bucket_counts == {"must": 1, "want": 1, "optional": 0}
+
+        # Later runs upsert the existing snapshot; the reducer-accumulated
+        # resolved_attractions must come through whole.
+        await run(0)
+        await run(1)
+        view = await read_model_view(db)
+        assert view == await checkpoint_view(graph)
+        assert view["stage"] == 1
+        assert len(view["resolved_attractions"]) == 2
+
+    asyncio.run(scenario())
+
+
+def test_backfill_from_checkpoint_after_missed_partial_sync(async_db, stub_nodes):
+    db = async_db
+    checkpointer = InMemorySaver()
+    graph = generate_graph(checkpointer)
+
+    async def scenario():
+        await run_itinerary_graph(SESSION_ID, "search", 0, None, db, checkpointer)
+        await invalidate_itinerary_read_model(db, SESSION_ID)
+
+        # Without a snapshot a partial sync is a no-op and reads fall back.
+        await graph.aupdate_state(CONFIG, {"pois": [PANTHEON]})
+        await sync_itinerary_read_model(
+            db, SESSION_ID, {"pois": [PANTHEON]}, partial=True
+        )
+        assert await get_itinerary_read_model(db, SESSION_ID) is None
+
+        view = await load_itinerary_view(SESSION_ID, db, checkpointer)
+        assert view["pois"] == [PANTHEON]
+        assert view == await checkpoint_view(graph)
+        assert await read_model_view(db) == await checkpoint_view(graph)
+
+    asyncio.run(scenario())
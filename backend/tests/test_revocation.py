@@ -0,0 +1,83 @@
+import asyncio
+import time
+import uuid
+from datetime import datetime, timedelta
+
+from app.core import revocation
+from app.core.revocation import BloomFilter, RevocationCache
+
+
+def test_bloom_filter_has_no_false_negatives():
+    bloom = BloomFilter(capacity=1000, error_rate=0.01)
+    revoked = [uuid.uuid4().hex for _ in range(1000)]
+    for jti in revoked:
+        bloom.add(jti)
+
+    assert all(jti in bloom for jti in revoked)
+
+    others = [uuid.uuid4().hex for _ in range(5000)]
+    false_positives = sum(1 for jti in others if jti in bloom)
+    assert false_positives / len(others) < 0.03
+
+
+def test_tokens_outside_the_filter_skip_redis():
+    cache = RevocationCache()
+    cache.bloom = BloomFilter(capacity=10)
+    cache.bloom.add("revoked-jti")
+
+    assert asyncio.run(cache.is_revoked("fresh-jti")) is False
+
+
+class FakePipeline:
+    def __init__(self, redis):
+        self.redis = redis
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    def set(self, key, value, exat):
+        self.redis.keys[key] = value
+
+    def zadd(self, key, mapping):
+        self.redis.index.update(mapping)
+
+    async def execute(self):
+        return []
+
+
+class FakeRedis:
+    def __init__(self):
+        self.keys = {}
+        self.index = {}
+
+    async def zremrangebyscore(self, key, low, high):
+        self.index = {jti: exp for jti, exp in self.index.items() if exp > high}
+
+    async def zrange(self, key, start, end):
+        return list(self.index)
+
+    def pipeline(self, transaction=True):
+        return FakePipeline(self)
+
+
+def test_rebuild_restores_revocations_whose_redis_mirror_failed(monkeypatch):
+    fake = FakeRedis()
+    expires_at = datetime.utcnow() + timedelta(hours=1)
+    fake.index["mirrored-jti"] = int(time.time()) + 3600
+    monkeypatch.setattr(revocation, "r", fake)
+
+    async def live_revocations(self):
+        return [("mirrored-jti", expires_at), ("unmirrored-jti", expires_at)]
+
+    monkeypatch.setattr(RevocationCache, "_live_revocations", live_revocations)
+    cache = RevocationCache()
+
+    asyncio.run(cache.rebuild())
+
+    assert "unmirrored-jti" in cache.bloom
+    assert "mirrored-jti" in cache.bloom
+    assert "revoked_token:unmirrored-jti" in fake.keys
+    assert "unmirrored-jti" in fake.index
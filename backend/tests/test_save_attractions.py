@@ -0,0 +1,102 @@
+import asyncio
+from contextlib import asynccontextmanager
+
+import pytest
+from langgraph.types import Overwrite
+from sqlalchemy import select
+
+from app.models.global_attraction import GlobalAttraction
+from app.services.agents import nodes
+
+COLOSSEUM = {
+    "external_place_id": "N1",
+    "official_name": "Colosseum",
+    "city": "Rome",
+    "country": "Italy",
+    "latitude": 41.8902,
+    "longitude": 12.4922,
+}
+PANTHEON = {
+    "external_place_id": "N2",
+    "official_name": "Pantheon",
+    "city": "Rome",
+    "country": "Italy",
+    "latitude": 41.8986,
+    "longitude": 12.4769,
+}
+TREVI = {
+    "official_name": "Trevi Fountain",
+    "city": "Rome",
+    "country": "Italy",
+    "latitude": 41.9009,
+    "longitude": 12.4833,
+}
+SPANISH_STEPS = {
+    "official_name": "Spanish Steps",
+    "city": "Rome",
+    "country": "Italy",
+    "latitude": 41.9060,
+    "longitude": 12.4828,
+}
+
+
+@pytest.fixture(autouse=True)
+def fixture_session_local(monkeypatch, async_db):
+    @asynccontextmanager
+    async def session_local():
+        yield async_db
+
+    monkeypatch.setattr(nodes, "SessionLocal", session_local)
+
+
+def test_upsert_assigns_ids_to_new_known_and_repeated_places(db_session):
+    known = GlobalAttraction(**nodes._attraction_row(COLOSSEUM))
+    known.search_count = 5
+    db_session.add(known)
+    db_session.commit()
+
+    resolved = [
+        dict(COLOSSEUM),
+        dict(PANTHEON),
+        dict(TREVI),
+        dict(PANTHEON),
+        dict(SPANISH_STEPS),
+    ]
+    result = asyncio.run(
+        nodes.save_attractions_to_db({"resolved_attractions": resolved})
+    )
+
+    assert result["action"] == "idle"
+    assert isinstance(result["resolved_attractions"], Overwrite)
+    saved = result["resolved_attractions"].value
+    assert [poi["official_name"] for poi in saved] == [
+        "Colosseum",
+        "Pantheon",
+        "Trevi Fountain",
+        "Pantheon",
+        "Spanish Steps",
+    ]
+
+    rows = {
+        row.official_name: row
+        for row in db_session.execute(select(GlobalAttraction)).scalars()
+    }
+    assert len(rows) == 4
+    assert saved[0]["id"] == known.id
+    assert saved[1]["id"] == saved[3]["id"] == rows["Pantheon"].id
+    assert saved[2]["id"] == rows["Trevi Fountain"].id
+    assert saved[4]["id"] == rows["Spanish Steps"].id
+
+    # A known place keeps its counters; only its timestamp is touched.
+    assert rows["Colosseum"].search_count == 5
+    assert rows["Pantheon"].search_count == 1
+    assert rows["Pantheon"].h3_cell == GlobalAttraction.spatial_cell(
+        PANTHEON["latitude"], PANTHEON["longitude"]
+    )
+
+
+def test_nothing_resolved_moves_to_next_stage(db_session):
+    result = asyncio.run(nodes.save_attractions_to_db({"resolved_attractions": []}))
+
+    assert result == {"action": "move_to_next_stage"}
+    assert db_session.execute(select(GlobalAttraction)).first() is None
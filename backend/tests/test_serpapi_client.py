@@ -0,0 +1,51 @@
+import asyncio
+
+import httpx
+import pytest
+
+from app.services.search import serpapi_client as serpapi_module
+from app.services.search.serpapi_client import SerpApiClient, SerpApiError
+
+
+def use_transport(monkeypatch, handler):
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    monkeypatch.setattr(serpapi_module, "get_http_client", lambda: client)
+
+
+def test_searches_are_capped_per_key_and_spread_across_keys(monkeypatch):
+    in_flight = {"key-a": 0, "key-b": 0}
+    peak = {"key-a": 0, "key-b": 0}
+
+    async def handler(request):
+        key = request.url.params["api_key"]
+        assert request.url.params["deep_search"] == "true"
+        in_flight[key] += 1
+        peak[key] = max(peak[key], in_flight[key])
+        await asyncio.sleep(0.01)
+        in_flight[key] -= 1
+        return httpx.Response(200, json={"best_flights": []})
+
+    use_transport(monkeypatch, handler)
+    client = SerpApiClient("key-a, key-b", max_concurrency=2)
+
+    async def scenario():
+        params = {"engine": "google_flights", "deep_search": True, "stops": None}
+        return await asyncio.gather(*(client.search(params) for _ in range(8)))
+
+    assert asyncio.run(scenario()) == [{"best_flights": []}] * 8
+    assert peak == {"key-a": 2, "key-b": 2}
+
+
+def test_error_payloads_and_timeouts_raise(monkeypatch):
+    def handler(request):
+        if request.url.params["engine"] == "slow":
+            raise httpx.ReadTimeout("timed out", request=request)
+        return httpx.Response(400, json={"error": "Invalid departure_id"})
+
+    use_transport(monkeypatch, handler)
+    client = SerpApiClient("key-a")
+
+    with pytest.raises(SerpApiError, match="Invalid departure_id"):
+        asyncio.run(client.search({"engine": "google_flights"}))
+    with pytest.raises(SerpApiError, match="timed out"):
+        asyncio.run(client.search({"engine": "slow"}))
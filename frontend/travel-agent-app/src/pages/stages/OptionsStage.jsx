@@ -623,6 +623,25 @@ function BookingLinksModal({ urls, booked, selectedInbound, selectedHotel, onCon
     );
 }
 
+// Streams newline-delimited JSON, calling onItem for each line as it arrives.
+async function readNdjson(response, onItem) {
+  const reader = response.body.getReader();
+  const decoder = new TextDecoder("utf-8");
+  let buffer = "";
+
+  while (true) {
+    const { value, done } = await reader.read();
+    buffer += decoder.decode(value || new Uint8Array(), { stream: !done });
+    const lines = buffer.split('\n');
+    buffer = done ? "" : lines.pop();
+
+    for (const line of lines) {
+      if (line.trim()) onItem(JSON.parse(line));
+    }
+    if (done) break;
+  }
+}
+
 export default function OptionsStage() {
   const { sessionData, refreshContext } = useOutletContext();
   const session = sessionData?.data || sessionData;
@@ -782,7 +801,8 @@ export default function OptionsStage() {
       infants_in_seat: travelerCounts.infantsSeat,
       infants_on_lap: travelerCounts.infantsLap,
       stops: parseInt(maxStops),
-      sort_by: parseInt(sortBy)
+      sort_by: parseInt(sortBy),
+      prefetch_inbound: true
     };
 
     const childrenString = childAges.length > 0 ? childAges.join(",") : null;
@@ -796,21 +816,29 @@ export default function OptionsStage() {
         children: childrenString,
         room_qty: roomQty,
         price_min: null,
-        price_max: null
+        price_max: null,
+        prefetch_details: true
     };
 
-    try {
-      const [flightRes, hotelRes] = await Promise.all([
-        fetchWithAuth(`${API_BASE_URL}/search/getOutboundFlights`, flightsBody, "POST"),
-        fetchWithAuth(`${API_BASE_URL}/search/getaccommodations`, hotelsBody, "POST")
-      ]);
+    // Flights and hotels load independently, so flights render as they stream in.
+    const loadFlights = async () => {
+      const flightRes = await fetchWithAuth(`${API_BASE_URL}/search/getOutboundFlights/stream`, flightsBody, "POST");
+      if (!flightRes.ok) return;
+      await readNdjson(flightRes, (item) => {
+        if (item.error) setError(item.error);
+        else setOutboundFlights(prev => [...prev, item]);
+      });
+    };
 
-      if (flightRes.ok) {
-        setOutboundFlights(await flightRes.json());
-      }
+    const loadHotels = async () => {
+      const hotelRes = await fetchWithAuth(`${API_BASE_URL}/search/getaccommodations`, hotelsBody, "POST");
       if (hotelRes.ok) {
         setHotels(await hotelRes.json());
       }
+    };
+
+    try {
+      await Promise.all([loadFlights(), loadHotels()]);
     } catch (err) {
       console.error(err);
       setError("Failed to fetch search results. Please try again.");